@@ -0,0 +1,263 @@
+"""Maintenance commands for the Embedded Systems AI Agent"""
+
+import argparse
+import sys
+
+
+def cmd_embed_server(args) -> int:
+    """Run the shared embedding service"""
+    from src.tools.embedding_service import run_embedding_server
+
+    run_embedding_server(args.socket)
+    return 0
+
+
+def cmd_embed_parity(args) -> int:
+    """Report cosine agreement of an embedding backend with the reference"""
+    from src.tools.embeddings import check_backend_parity
+
+    report = check_backend_parity(args.backend, reference=args.reference)
+    print(f"🧪 {report['backend']} vs {report['reference']} ({report['samples']} samples)")
+    print(f"   Mean cosine: {report['mean_cosine']:.4f}")
+    print(f"   Min cosine:  {report['min_cosine']:.4f}")
+    print(f"   Neighbor agreement: {report['neighbor_agreement']:.0%}")
+    return 0 if report["min_cosine"] >= args.min_cosine else 1
+
+
+def cmd_bench_dims(args) -> int:
+    """Benchmark recall@k and latency of reduced embedding dimensions"""
+    from pathlib import Path
+    from src.tools import EmbeddedSystemsTools
+    from src.tools.dim_reduction import benchmark_dimensions
+    from src.tools.embeddings import PARITY_SAMPLE_TEXTS
+
+    tools = EmbeddedSystemsTools()
+    files = [p for p in tools.knowledge_base_path.rglob("*")
+             if p.is_file() and p.suffix.lower() in tools.SUPPORTED_EXTENSIONS
+             and p.suffix.lower() not in tools.SKIP_EXTENSIONS and not tools._is_internal_path(p)]
+    corpus = tools._sample_chunks(files, args.max_chunks)
+    if not corpus:
+        print("❌ No chunks found in the knowledge base")
+        return 1
+
+    if args.queries_file:
+        queries = [q.strip() for q in Path(args.queries_file).read_text(encoding="utf-8").splitlines() if q.strip()]
+    else:
+        queries = PARITY_SAMPLE_TEXTS
+
+    base = getattr(tools.embeddings, "base", tools.embeddings)  # Always compare against full vectors
+    dims_list = [int(d) for d in args.dims.split(",")]
+    report = benchmark_dimensions(base, corpus, queries, dims_list, k=args.k, method=args.method)
+
+    print(f"📊 {len(corpus)} chunks, {len(queries)} queries, method={args.method}")
+    print(f"{'dims':>6} {'recall@' + str(args.k):>10} {'ms/query':>10} {'index MB':>10}")
+    for row in report:
+        if "skipped" in row:
+            print(f"{row['dims']:>6}   ⚠️ skipped: {row['skipped']}")
+            continue
+        print(f"{row['dims']:>6} {row['recall_at_k']:>10.3f} {row['latency_ms']:>10.3f} {row['index_mb']:>10.2f}")
+    return 0
+
+
+def cmd_reindex(args) -> int:
+    """Rebuild the knowledge base into a new index generation and swap to it"""
+    import asyncio
+    from src.tools.index_generations import rebuild_index
+
+    queries = args.query or None
+    result = asyncio.run(rebuild_index(args.directory, queries, grace_seconds=args.grace))
+    print(result["message"])
+    if result["success"]:
+        print(f"📁 Active generation: {result['generation']}")
+    return 0 if result["success"] else 1
+
+
+def cmd_kb_export(args) -> int:
+    """Pack the knowledge base index and model into a bundle"""
+    from src.tools.kb_bundle import export_bundle
+
+    result = export_bundle(args.output, include_model=not args.no_model)
+    print(result["message"])
+    return 0 if result["success"] else 1
+
+
+def cmd_kb_import(args) -> int:
+    """Install a knowledge base bundle as the active index"""
+    from src.tools.kb_bundle import import_bundle
+
+    result = import_bundle(args.bundle, force=args.force, if_empty=args.if_empty, grace_seconds=args.grace)
+    print(result["message"])
+    return 0 if result["success"] else 1
+
+
+def cmd_import_budget(args) -> int:
+    """Fail when importing a module takes longer than the budget"""
+    from src.utils.import_budget import check_import_budget
+
+    report = check_import_budget(args.module, args.budget_ms, runs=args.runs)
+    status = "✅" if report["within_budget"] else "❌"
+    print(f"{status} import {report['module']}: {report['total_ms']:.1f} ms (budget {report['budget_ms']:.0f} ms)")
+    for entry in report["slowest"][:args.top]:
+        print(f"   {entry['cumulative_ms']:>8.1f} ms  {entry['module']}")
+    return 0 if report["within_budget"] else 1
+
+
+def cmd_catalog_import(args) -> int:
+    """Load CSV/JSON catalogs (or the bundled datasets) into the SQLite catalog"""
+    from src.data import load_dataset
+    from src.data.catalog import CatalogStore, read_catalog_file
+
+    store = CatalogStore(args.db)
+    importer = store.import_components if args.kind == "components" else store.import_libraries
+    sources = args.files or [None]
+    replace = args.replace
+    for source in sources:
+        try:
+            records = read_catalog_file(source, args.kind) if source else load_dataset(args.kind)
+            count = importer(records, replace=replace)
+        except (OSError, ValueError) as e:
+            print(f"❌ Failed to import {source or 'bundled dataset'}: {e}")
+            return 1
+        replace = False  # Only the first file replaces existing entries
+        print(f"✅ Imported {count} {args.kind} from {source or 'bundled dataset'}")
+
+    counts = store.counts()
+    print(f"📦 Catalog {args.db}: {counts['components']} components, {counts['libraries']} libraries")
+    return 0
+
+
+def cmd_crawl(args) -> int:
+    """Crawl documentation sites into the knowledge base"""
+    import asyncio
+    from src.tools.crawler import Crawler
+
+    tools = None
+    if not args.no_ingest:
+        from src.tools import EmbeddedSystemsTools
+        tools = EmbeddedSystemsTools()
+    crawler = Crawler(tools, state_name=args.state, concurrency=args.concurrency, delay=args.delay,
+                      max_pages=args.max_pages, max_depth=args.max_depth)
+
+    queued = crawler.add_seeds(args.seeds, scope=args.prefix) if args.seeds else 0
+    for sitemap in args.sitemap or []:
+        try:
+            queued += crawler.add_sitemap(sitemap, scope=args.prefix)
+        except Exception as e:
+            print(f"❌ Sitemap {sitemap}: {e}")
+            return 1
+    print(f"🕷️ Queued {queued} new URL(s); crawling up to {args.max_pages} page(s)")
+
+    stats = asyncio.run(crawler.run())
+    print(f"✅ Fetched {stats['fetched']}, ingested {stats['ingested']}, duplicates {stats['duplicates']}, "
+          f"failed {stats['failed']}, disallowed {stats['disallowed']}")
+    print(f"   Frontier: {stats['frontier']}")
+    return 0
+
+
+def cmd_validate(args) -> int:
+    """Validate sketches and scripts; fails when any file has errors"""
+    from src.tools.code_validation import validate_files
+
+    report = validate_files(args.paths, args.platform, compile_check=args.compile)
+    for path, result in report["files"].items():
+        problems = ([result["error"]] if "error" in result else []) + result.get("errors", []) + result.get("warnings", [])
+        print(f"{'✅' if result['success'] else '❌'} {path}")
+        for message in problems:
+            print(f"   {message}")
+    summary = report["summary"]
+    print(f"{summary['files']} file(s), {summary['errors']} error(s), {summary['warnings']} warning(s)")
+    return 0 if report["success"] else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
+    from src.config import (
+        EMBEDDING_SERVICE_SOCKET, EMBEDDINGS_BACKEND, INDEX_SWAP_GRACE_SECONDS, IMPORT_TIME_BUDGET_MS,
+        PARTS_CATALOG_DB, CRAWL_CONCURRENCY, CRAWL_DELAY_SECONDS, CRAWL_MAX_PAGES, CRAWL_MAX_DEPTH
+    )
+
+    parser = argparse.ArgumentParser(description="Embedded Systems AI Agent maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    embed_server = commands.add_parser("embed-server", help="Run the shared embedding service")
+    embed_server.add_argument("--socket", default=EMBEDDING_SERVICE_SOCKET, help="Unix socket path")
+    embed_server.set_defaults(func=cmd_embed_server)
+
+    embed_parity = commands.add_parser("embed-parity", help="Compare an embedding backend with the reference")
+    embed_parity.add_argument("--backend", default=EMBEDDINGS_BACKEND, choices=["torch", "onnx", "onnx-int8"])
+    embed_parity.add_argument("--reference", default="torch", choices=["torch", "onnx", "onnx-int8"])
+    embed_parity.add_argument("--min-cosine", type=float, default=0.99, help="Fail below this cosine")
+    embed_parity.set_defaults(func=cmd_embed_parity)
+
+    bench_dims = commands.add_parser("bench-dims", help="Benchmark reduced embedding dimensions")
+    bench_dims.add_argument("--dims", default="256,128,64", help="Comma-separated dimensions")
+    bench_dims.add_argument("--k", type=int, default=5, help="Neighbors compared for recall")
+    bench_dims.add_argument("--method", default="pca", choices=["pca", "truncate"])
+    bench_dims.add_argument("--max-chunks", type=int, default=2000, help="Corpus chunks to index")
+    bench_dims.add_argument("--queries-file", help="File with one query per line")
+    bench_dims.set_defaults(func=cmd_bench_dims)
+
+    reindex = commands.add_parser("reindex", help="Zero-downtime rebuild of the knowledge base index")
+    reindex.add_argument("--directory", help="Knowledge base directory (defaults to KNOWLEDGE_BASE_DIR)")
+    reindex.add_argument("--query", action="append", help="Validation query (repeatable)")
+    reindex.add_argument("--grace", type=float, default=INDEX_SWAP_GRACE_SECONDS,
+                         help="Seconds before the previous generation is deleted")
+    reindex.set_defaults(func=cmd_reindex)
+
+    kb_export = commands.add_parser("kb-export", help="Export index, manifest and model as one bundle")
+    kb_export.add_argument("output", help="Bundle file to write (e.g. kb-bundle.tar.gz)")
+    kb_export.add_argument("--no-model", action="store_true", help="Leave out embedding model weights")
+    kb_export.set_defaults(func=cmd_kb_export)
+
+    kb_import = commands.add_parser("kb-import", help="Install a knowledge base bundle")
+    kb_import.add_argument("bundle", help="Bundle file created by kb-export")
+    kb_import.add_argument("--force", action="store_true", help="Import even if the embedding config differs")
+    kb_import.add_argument("--if-empty", action="store_true", help="Skip when an index already exists")
+    kb_import.add_argument("--grace", type=float, default=INDEX_SWAP_GRACE_SECONDS,
+                           help="Seconds before the previous generation is deleted")
+    kb_import.set_defaults(func=cmd_kb_import)
+
+    import_budget = commands.add_parser("import-budget", help="Check startup import time against a budget")
+    import_budget.add_argument("--module", default="main", help="Module to import (default: main)")
+    import_budget.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    import_budget.add_argument("--runs", type=int, default=3, help="Fresh interpreter runs (fastest counts)")
+    import_budget.add_argument("--top", type=int, default=5, help="Slowest imports to list")
+    import_budget.set_defaults(func=cmd_import_budget)
+
+    catalog_import = commands.add_parser("catalog-import", help="Import parts or libraries into the SQLite catalog")
+    catalog_import.add_argument("kind", choices=["components", "libraries"])
+    catalog_import.add_argument("files", nargs="*", help="CSV/JSON catalog files (default: bundled dataset)")
+    catalog_import.add_argument("--db", default=PARTS_CATALOG_DB, help="Catalog database path")
+    catalog_import.add_argument("--replace", action="store_true", help="Delete existing entries of this kind first")
+    catalog_import.set_defaults(func=cmd_catalog_import)
+
+    crawl = commands.add_parser("crawl", help="Crawl documentation sites into the knowledge base")
+    crawl.add_argument("seeds", nargs="*", help="Start pages (omit to resume the saved frontier)")
+    crawl.add_argument("--sitemap", action="append", help="Sitemap to queue (repeatable)")
+    crawl.add_argument("--prefix", action="append", help="URL prefix to stay within (default: seed directories)")
+    crawl.add_argument("--max-pages", type=int, default=CRAWL_MAX_PAGES, help="Pages fetched in this run")
+    crawl.add_argument("--max-depth", type=int, default=CRAWL_MAX_DEPTH, help="Link hops followed from a seed")
+    crawl.add_argument("--concurrency", type=int, default=CRAWL_CONCURRENCY)
+    crawl.add_argument("--delay", type=float, default=CRAWL_DELAY_SECONDS, help="Seconds between requests to one host")
+    crawl.add_argument("--state", default="default", help="Frontier name; reuse it to resume a crawl")
+    crawl.add_argument("--no-ingest", action="store_true", help="Only write Markdown files, do not ingest them")
+    crawl.set_defaults(func=cmd_crawl)
+
+    validate = commands.add_parser("validate", help="Validate sketches and Python scripts")
+    validate.add_argument("paths", nargs="+", help="Files or directories")
+    validate.add_argument("--platform", choices=["arduino", "esp32", "raspberry_pi"],
+                          help="Platform for every file (default: from the file extension)")
+    validate.add_argument("--compile", action="store_true",
+                          help="Also syntax-check Arduino/ESP32 files with the host C++ compiler")
+    validate.set_defaults(func=cmd_validate)
+
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
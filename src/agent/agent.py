@@ -5,27 +5,14 @@ import json
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
-
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_groq import ChatGroq
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-
-from src.state import ProjectState
-from src.config import GROQ_MODEL, GROQ_TEMPERATURE, PROJECTS_DIR
-from src.tools import (
-    EmbeddedSystemsTools,
-    web_search_tool,
-    component_lookup_tool,
-    pinout_lookup_tool,
-    code_template_tool,
-    code_validator_tool,
-    library_lookup_tool,
-    file_operations_tool
-)
+from typing import AsyncIterator, Dict, Optional
+
+from src.config import GROQ_MODEL, GROQ_TEMPERATURE, PROJECTS_DIR, FAST_PATH_ROUTER
 from src.utils import extract_code_from_response
 
+# LangChain, LangGraph and the tools are imported inside the methods that use
+# them so importing this module (and the CLI on top of it) stays cheap.
+
 
 class EmbeddedSystemsAgent:
     """Main agent class using LangGraph for embedded systems development"""
@@ -38,6 +25,21 @@ class EmbeddedSystemsAgent:
             knowledge_base_path: Path to knowledge base directory
             auto_ingest: Whether to automatically ingest knowledge base files on startup
         """
+        from langchain_groq import ChatGroq
+        from langgraph.prebuilt import ToolNode
+        from src.tools import (
+            EmbeddedSystemsTools,
+            web_search_tool,
+            component_lookup_tool,
+            pinout_lookup_tool,
+            pin_capability_tool,
+            code_template_tool,
+            code_validator_tool,
+            library_lookup_tool,
+            library_resolve_tool,
+            file_operations_tool
+        )
+
         self.llm = ChatGroq(
             groq_api_key=groq_api_key,
             model_name=GROQ_MODEL,
@@ -45,21 +47,32 @@ class EmbeddedSystemsAgent:
         )
 
         self.tools_instance = EmbeddedSystemsTools(knowledge_base_path)
+        self.tools_instance.warm_up()
 
-        # Initialize tools list
-        self.tools = [
+        from src.tools.tool_executor import with_tool_executor
+
+        # Initialize tools list; the tools block, so async calls run them in the bounded tool pool
+        self.tools = [with_tool_executor(t) for t in [
             web_search_tool,
             component_lookup_tool,
             pinout_lookup_tool,
+            pin_capability_tool,
             code_template_tool,
             code_validator_tool,
             library_lookup_tool,
+            library_resolve_tool,
             file_operations_tool
-        ]
+        ]]
 
         # Create tool node
         self.tool_node = ToolNode(tools=self.tools)
 
+        # Lookups the router recognizes skip the LLM
+        self.router = None
+        if FAST_PATH_ROUTER:
+            from src.agent.router import IntentRouter
+            self.router = IntentRouter()
+
         # Create the graph
         self.graph = self._create_graph()
         
@@ -95,13 +108,9 @@ class EmbeddedSystemsAgent:
             print(f"📚 Auto-ingesting knowledge base ({total_files} files)...")
             print("⏳ This may take a few minutes on first run...")
             
-            # Run ingestion synchronously
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            results = loop.run_until_complete(self.ingest_knowledge_base())
-            loop.close()
+            # Run ingestion synchronously on the shared background loop
+            from src.utils.event_loop import run_async
+            results = run_async(self.ingest_knowledge_base())
             
             if results["success"]:
                 print(f"✅ {results['message']}")
@@ -113,20 +122,25 @@ class EmbeddedSystemsAgent:
         except Exception as e:
             print(f"⚠️ Auto-ingest error: {str(e)}")
 
-    def _create_graph(self) -> StateGraph:
+    def _create_graph(self):
         """Create the LangGraph workflow
         
         Returns:
             Compiled state graph
         """
-        # Agent function
-        def call_agent(state: ProjectState):
+        from langgraph.graph import StateGraph, END
+        from src.state import ProjectState
+
+        llm_with_tools = self.llm.bind_tools(self.tools)
+
+        # Agent function; both nodes are coroutines so a request holds no thread while it waits
+        async def call_agent(state: ProjectState):
             messages = state["messages"]
-            response = self.llm.bind_tools(self.tools).invoke(messages)
+            response = await llm_with_tools.ainvoke(messages)
             return {"messages": [response]}
 
-        def call_tools(state: ProjectState):
-            return self.tool_node.invoke({"messages": state["messages"]})
+        async def call_tools(state: ProjectState):
+            return await self.tool_node.ainvoke({"messages": state["messages"]})
 
         # Conditional edge
         def should_continue(state: ProjectState):
@@ -151,6 +165,80 @@ class EmbeddedSystemsAgent:
 
         return workflow.compile()
 
+    def _initial_state(self, user_input: str, platform_name: str):
+        """Graph input for a request: system prompt, user message and empty project fields"""
+        from langchain_core.messages import SystemMessage, HumanMessage
+        from src.state import ProjectState
+
+        return ProjectState(
+            messages=[
+                SystemMessage(content=f"""Expert embedded systems developer for Arduino, ESP32, Raspberry Pi.
+
+IMPORTANT Tool Usage Guidelines:
+- Use component_lookup_tool ONLY for specific sensors/modules (DHT22, HC-SR04, LED, etc.)
+- To find a part for a need ("measure distance underwater"), use component_lookup_tool with mode="semantic" before web_search_tool
+- Use pinout_lookup_tool for board pinouts (arduino_uno, esp32, raspberry_pi)
+- Use pin_capability_tool to pick pins by capability (adc, touch, pwm, boot_safe) or check a pin assignment for conflicts
+- Use library_resolve_tool once for all libraries a project needs (platform availability and install set)
+- Use web_search_tool for online tutorials and documentation; pass enrich=True to read the top pages instead of searching again
+- Do NOT use component_lookup_tool for platforms/boards themselves
+
+For direct questions, answer without tools. Be concise.
+Platform: {platform_name}
+"""),
+                HumanMessage(content=user_input)
+            ],
+            platform=platform_name,
+            requirements=user_input,
+            generated_code="",
+            validation_result=None,
+            documentation="",
+            project_name="",
+            current_step="processing",
+            context_chunks=None,
+            error_message="",
+            search_results=None
+        )
+
+    @staticmethod
+    def _graph_error(graph_error: Exception) -> Dict:
+        """Failure result for an exception raised while running the graph"""
+        error_msg = str(graph_error)
+        if "tool_use_failed" in error_msg or "Failed to call a function" in error_msg:
+            return {
+                "success": False,
+                "error": "I couldn't use the tools properly. Please rephrase your question or ask for specific information."
+            }
+        return {
+            "success": False,
+            "error": f"Processing error: {error_msg}"
+        }
+
+    async def _final_result(self, user_input: str, platform_name: str, final_message) -> Dict:
+        """Response dictionary for the last message of a graph run"""
+        from src.tools.tool_executor import run_blocking
+
+        # Get knowledge base sources if available (skipped while the model is still loading)
+        sources = []
+        if self.tools_instance.is_ready:
+            try:
+                kb_results = await run_blocking(self.tools_instance.search_knowledge, user_input, k=3)
+                sources = [{
+                    "file": r.get('source_file', 'Unknown'),
+                    "type": r.get('file_type', 'Unknown'),
+                    "relevance": r.get('relevance_score', 'N/A')
+                } for r in kb_results if r.get('source_file')]
+            except:
+                pass
+
+        return {
+            "success": True,
+            "response": final_message.content if hasattr(final_message, 'content') else str(final_message),
+            "platform": platform_name,
+            "timestamp": datetime.now().isoformat(),
+            "sources": sources
+        }
+
     async def process_request(self, user_input: str, platform: str = "") -> Dict:
         """Process user request through the LangGraph workflow
         
@@ -164,75 +252,20 @@ class EmbeddedSystemsAgent:
         try:
             # Validate platform
             platform_name = platform if platform else "general"
-            
-            # Create initial state
-            initial_state = ProjectState(
-                messages=[
-                    SystemMessage(content=f"""Expert embedded systems developer for Arduino, ESP32, Raspberry Pi.
 
-IMPORTANT Tool Usage Guidelines:
-- Use component_lookup_tool ONLY for specific sensors/modules (DHT22, HC-SR04, LED, etc.)
-- Use pinout_lookup_tool for board pinouts (arduino_uno, esp32, raspberry_pi)
-- Use web_search_tool for online tutorials and documentation
-- Do NOT use component_lookup_tool for platforms/boards themselves
-
-For direct questions, answer without tools. Be concise.
-Platform: {platform_name}
-"""),
-                    HumanMessage(content=user_input)
-                ],
-                platform=platform_name,
-                requirements=user_input,
-                generated_code="",
-                validation_result=None,
-                documentation="",
-                project_name="",
-                current_step="processing",
-                context_chunks=None,
-                error_message="",
-                search_results=None
-            )
+            fast_result = await self._answer_directly(user_input, platform)
+            if fast_result is not None:
+                return fast_result
 
             # Run the graph with error handling
             try:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, self.graph.invoke, initial_state
-                )
+                result = await self.graph.ainvoke(self._initial_state(user_input, platform_name))
             except Exception as graph_error:
                 # If tool execution fails, return a helpful error
-                error_msg = str(graph_error)
-                if "tool_use_failed" in error_msg or "Failed to call a function" in error_msg:
-                    return {
-                        "success": False,
-                        "error": "I couldn't use the tools properly. Please rephrase your question or ask for specific information."
-                    }
-                return {
-                    "success": False,
-                    "error": f"Processing error: {error_msg}"
-                }
+                return self._graph_error(graph_error)
 
             # Extract the final response
-            final_message = result["messages"][-1]
-            
-            # Get knowledge base sources if available
-            sources = []
-            try:
-                kb_results = self.tools_instance.search_knowledge(user_input, k=3)
-                sources = [{
-                    "file": r.get('source_file', 'Unknown'),
-                    "type": r.get('file_type', 'Unknown'),
-                    "relevance": r.get('relevance_score', 'N/A')
-                } for r in kb_results if r.get('source_file')]
-            except:
-                pass
-
-            return {
-                "success": True,
-                "response": final_message.content if hasattr(final_message, 'content') else str(final_message),
-                "platform": platform_name,
-                "timestamp": datetime.now().isoformat(),
-                "sources": sources
-            }
+            return await self._final_result(user_input, platform_name, result["messages"][-1])
 
         except Exception as e:
             return {
@@ -240,6 +273,94 @@ Platform: {platform_name}
                 "error": f"Request processing failed: {str(e)}"
             }
 
+    async def stream_request(self, user_input: str, platform: str = "") -> AsyncIterator[Dict]:
+        """Process a request like process_request, yielding progress as it happens
+        
+        Events are dicts with a "type":
+        - "token": {"text"} - a piece of the model's reply
+        - "tool_start": {"name", "input"} - a tool call began
+        - "tool_end": {"name", "output"} - a tool call finished
+        - "result": {"result"} - the process_request dictionary; always the last event
+        
+        Args:
+            user_input: User request text
+            platform: Target platform
+        """
+        platform_name = platform if platform else "general"
+        try:
+            if self.router is not None:
+                route = self.router.route(user_input, platform)
+                if route is not None:
+                    yield {"type": "tool_start", "name": route.tool, "input": route.args}
+                    fast_result = await self._answer_directly(user_input, platform, route)
+                    if fast_result is not None:
+                        yield {"type": "tool_end", "name": route.tool, "output": fast_result["response"]}
+                        yield {"type": "token", "text": fast_result["response"]}
+                        yield {"type": "result", "result": fast_result}
+                        return
+
+            final_state = None
+            async for event in self.graph.astream_events(
+                self._initial_state(user_input, platform_name), version="v2"
+            ):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    text = event["data"]["chunk"].content
+                    if isinstance(text, str) and text:
+                        yield {"type": "token", "text": text}
+                elif kind == "on_tool_start":
+                    yield {"type": "tool_start", "name": event["name"], "input": event["data"].get("input")}
+                elif kind == "on_tool_end":
+                    output = event["data"].get("output")
+                    yield {"type": "tool_end", "name": event["name"],
+                           "output": getattr(output, "content", output)}
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    final_state = event["data"].get("output")
+
+            if not final_state or not final_state.get("messages"):
+                yield {"type": "result", "result": {"success": False, "error": "Processing error: no response"}}
+                return
+            yield {"type": "result", "result": await self._final_result(user_input, platform_name,
+                                                                        final_state["messages"][-1])}
+
+        except Exception as e:
+            yield {"type": "result", "result": self._graph_error(e)}
+
+    async def _answer_directly(self, user_input: str, platform: str = "", route=None) -> Optional[Dict]:
+        """Answer a recognized lookup with one tool call and no LLM round-trip
+        
+        Args:
+            user_input: User request text
+            platform: Target platform
+            route: Route already chosen by the router
+            
+        Returns:
+            Response dictionary like process_request, or None to use the graph
+        """
+        if route is None and self.router is not None:
+            route = self.router.route(user_input, platform)
+        if route is None:
+            return None
+
+        from src.agent.router import format_result
+
+        tool = next((t for t in self.tools if t.name == route.tool), None)
+        if tool is None:
+            return None
+        try:
+            result = await tool.ainvoke(route.args)
+        except Exception:
+            return None  # The agent can still recover from a bad routing decision
+
+        return {
+            "success": True,
+            "response": format_result(result),
+            "platform": platform if platform else "general",
+            "timestamp": datetime.now().isoformat(),
+            "sources": [],
+            "routed_to": route.tool
+        }
+
     async def generate_project(self, platform: str, requirements: str,
                              project_name: str) -> Dict:
         """Generate complete project with code, documentation, and validation
@@ -368,6 +489,28 @@ Platform: {platform_name}
             "message": f"✅ Ingested {success} files" + (f" ({fail} failed)" if fail > 0 else "")
         }
     
+    async def rebuild_knowledge_base(self, directory_path: str = None, background: bool = False) -> Dict:
+        """Rebuild the knowledge base into a new index generation and swap to it
+        
+        Searches keep using the current index until the new one is validated.
+        
+        Args:
+            directory_path: Path to knowledge base (defaults to KNOWLEDGE_BASE_DIR)
+            background: Start the rebuild in a background thread and return immediately
+            
+        Returns:
+            Dict with rebuild results
+        """
+        from src.tools.index_generations import rebuild_index, rebuild_running, start_rebuild
+        
+        if background:
+            if rebuild_running():
+                return {"success": False, "message": "⚠️ Index rebuild already running; try again when it finishes"}
+            start_rebuild(directory_path)
+            return {"success": True, "message": "🔄 Rebuild started in the background"}
+        
+        return await rebuild_index(directory_path)
+    
     def scan_knowledge_base(self, directory_path: str = None) -> Dict:
         """Scan knowledge base without ingesting
         
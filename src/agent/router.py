@@ -0,0 +1,332 @@
+"""Deterministic fast path for lookup requests
+
+Requests like "show pinout for esp32" or "DHT22 library for arduino" need a
+single tool call and no reasoning. The router recognizes them without the
+LLM: a small classifier scores the request against example phrases of each
+intent, and rules extract the entities the tool needs (board, component,
+library, template, slot values). A request is routed only when one intent
+clearly wins, every required entity is found and no word is left over that
+could name something the tool call would ignore; anything else, including
+questions that ask why/how or to write code, goes to the LangGraph agent.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.config import ROUTER_MIN_CONFIDENCE, ROUTER_MIN_COVERAGE
+
+# Example phrases per intent; entity words (boards, parts) are left out
+INTENT_EXAMPLES = {
+    "pinout": [
+        "show pinout", "pinout for board", "pin diagram", "pin layout", "board pins", "gpio header pinout",
+        "pin map", "list the pins", "header pins", "pin out", "pinout information", "pin information",
+    ],
+    "component": [
+        "look up component", "component information", "tell me about sensor", "what is module",
+        "datasheet specs", "sensor details", "component specifications", "info on part", "lookup module",
+        "show sensor info", "tell me about part",
+    ],
+    "template": [
+        "code template", "starter template", "boilerplate code", "skeleton sketch", "basic template",
+        "template with sensor", "give me template", "starter sketch template", "template for board",
+    ],
+    "library": [
+        "library for", "which library", "install library", "arduino library", "library installation",
+        "library dependencies", "python package for", "library to use", "lookup library",
+    ],
+}
+
+# Requests that need reasoning or generation go to the agent
+_DEFER_RE = re.compile(
+    r"\b(why|how|explain|compare|difference|versus|vs|should|recommend|best|debug|fix|error|problem|"
+    r"troubleshoot|not working|doesn'?t|won'?t|can'?t|write|generate|create|build|make|modify|convert)\b"
+)
+# Template requests may ask to generate or create, as long as they name a template
+_GENERATION_RE = re.compile(r"\b(write|generate|create|build|make)\b")
+
+_STOPWORDS = {
+    "a", "an", "the", "for", "of", "on", "to", "in", "me", "my", "i", "is", "please", "with", "and", "about",
+    "give", "get", "show", "can", "you", "what", "are", "some", "this", "that", "using", "use",
+}
+# Words that carry neither intent nor an entity; any other word the router
+# does not recognize may name a board, part or capability it cannot handle
+_FILLER = {"need", "want", "like", "would", "could", "do", "it", "s", "there", "here", "just", "quick", "now", "it's"}
+
+_BOARDS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"\besp\s*-?\s*32\b"), "esp32"),
+    (re.compile(r"\b(raspberry[\s_]*pi|rpi)\b"), "raspberry_pi"),
+    (re.compile(r"\barduino(?:[\s_]*uno)?\b|\buno\b"), "arduino_uno"),
+]
+BOARD_PLATFORMS = {"arduino_uno": "arduino", "esp32": "esp32", "raspberry_pi": "raspberry_pi"}
+PLATFORM_BOARDS = {platform: board for board, platform in BOARD_PLATFORMS.items()}
+
+_TEMPLATE_NAMES: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"\bweb[\s_-]*server\b|\bhttp\b"), "webserver"),
+    (re.compile(r"\bbluetooth\b|\bbt\b"), "bluetooth"),
+    (re.compile(r"\bservo\b"), "servo"),
+    (re.compile(r"\bcamera\b"), "camera"),
+    (re.compile(r"\bgpio\b|\bbutton\b"), "gpio"),
+    (re.compile(r"\bsensor(?:[\s_-]*reading)?\b"), "sensor"),
+    (re.compile(r"\b(basic|blank|starter|minimal|hello)\b"), "basic"),
+]
+_PORT_RE = re.compile(r"\bport\s*:?\s*(\d+)\b")
+_BAUD_RE = re.compile(r"\b(\d{3,7})\s*baud\b|\bbaud(?:\s*rate)?\s*:?\s*(\d{3,7})\b")
+_PIN_RE = re.compile(r"\b(?:gpio\s*|pin\s*|a)\d+\b")
+_COMPONENT_PIN_RE = r"{name}\s+(?:on|at|to|pin)\s+(?:pin\s*)?((?:gpio\s*)?\d+|a\d+)\b"
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9\-_.]*")
+
+
+class Route(NamedTuple):
+    intent: str
+    tool: str
+    args: Dict
+    confidence: float
+
+
+def _tokens(text: str) -> List[str]:
+    words = (word.strip("-_.") for word in _WORD_RE.findall(text.lower()))
+    # Crude plural folding is enough for the example vocabulary
+    return [word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+            for word in words if word and word not in _STOPWORDS]
+
+
+class IntentClassifier:
+    """Multinomial naive Bayes over the example phrases
+
+    Only words seen in the examples are scored; `coverage` reports how much
+    of a request the classifier understood.
+    """
+
+    SMOOTHING = 0.1
+
+    def __init__(self, examples: Dict[str, List[str]] = INTENT_EXAMPLES):
+        counts = {intent: Counter(t for phrase in phrases for t in _tokens(phrase))
+                  for intent, phrases in examples.items()}
+        self.vocabulary = set(t for counter in counts.values() for t in counter)
+        self.log_likelihood: Dict[str, Dict[str, float]] = {}
+        for intent, counter in counts.items():
+            total = sum(counter.values()) + self.SMOOTHING * len(self.vocabulary)
+            self.log_likelihood[intent] = {
+                t: math.log((counter[t] + self.SMOOTHING) / total) for t in self.vocabulary
+            }
+
+    def classify(self, words: List[str]) -> Tuple[Optional[str], float, float]:
+        """(best intent, its posterior probability, share of words in the vocabulary)"""
+        known = [t for t in words if t in self.vocabulary]
+        if not known:
+            return None, 0.0, 0.0
+        scores = {intent: sum(likelihood[t] for t in known) for intent, likelihood in self.log_likelihood.items()}
+        best = max(scores, key=scores.get)
+        posterior = 1.0 / sum(math.exp(score - scores[best]) for score in scores.values())
+        return best, posterior, len(known) / len(words)
+
+
+class IntentRouter:
+    """Map a request to a single tool call, or None to use the agent"""
+
+    def __init__(self, min_confidence: float = ROUTER_MIN_CONFIDENCE, min_coverage: float = ROUTER_MIN_COVERAGE):
+        self.classifier = IntentClassifier()
+        self.min_confidence = min_confidence
+        self.min_coverage = min_coverage
+
+    def route(self, user_input: str, platform: str = "") -> Optional[Route]:
+        text = " ".join(user_input.lower().split())
+        if not text or len(text) > 200:
+            return None
+
+        board = self._find_board(text) or PLATFORM_BOARDS.get(platform.lower())
+        components, remainder = self._find_components(text)
+        # Boards, slot values and template names are entities, not intent words
+        for pattern in [pattern for pattern, _ in _BOARDS + _TEMPLATE_NAMES] + [_PORT_RE, _BAUD_RE, _PIN_RE]:
+            remainder = pattern.sub(" ", remainder)
+        words = [t for t in _tokens(_GENERATION_RE.sub(" ", remainder)) if not t.isdigit()]
+        intent, confidence, coverage = self.classifier.classify(words)
+        if intent is None or confidence < self.min_confidence or coverage < self.min_coverage:
+            return None
+        if _DEFER_RE.search(_GENERATION_RE.sub(" ", text) if intent == "template" else text):
+            return None
+
+        # "arduino mega", "pir sensor", "pins that support touch": an unrecognized
+        # word is an entity the tool call would silently drop
+        unknown = {t for t in words if t not in self.classifier.vocabulary and t not in _FILLER}
+        library = None
+        if intent == "library":
+            library = self._find_library(text, components, board)
+            if library is None:
+                return None
+            unknown -= set(_tokens(library))
+        if unknown:
+            return None
+        # Pin numbers are only understood as template slot values
+        if intent != "template" and _PIN_RE.search(text):
+            return None
+
+        if intent == "pinout":
+            if self._find_board(text):
+                # "dht22 pins on esp32" asks about wiring, which neither pinout answers
+                return Route(intent, "pinout_lookup_tool", {"platform": board}, confidence) \
+                    if not components else None
+            # "dht22 pinout" is about the part, not the current board
+            if components:
+                return Route("component", "component_lookup_tool", self._component_args(components), confidence)
+            return Route(intent, "pinout_lookup_tool", {"platform": board}, confidence) if board else None
+
+        if intent == "component":
+            return Route(intent, "component_lookup_tool", self._component_args(components), confidence) \
+                if components else None
+
+        if intent == "library":
+            return Route(intent, "library_lookup_tool",
+                         {"library_name": library, "platform": BOARD_PLATFORMS[board]}, confidence)
+
+        if intent == "template" and board:
+            args = self._template_args(text, BOARD_PLATFORMS[board], components)
+            return Route(intent, "code_template_tool", args, confidence) if args else None
+        return None
+
+    @staticmethod
+    def _find_board(text: str) -> Optional[str]:
+        for pattern, board in _BOARDS:
+            if pattern.search(text):
+                return board
+        return None
+
+    @staticmethod
+    def _find_components(text: str) -> Tuple[List[str], str]:
+        """Component keys named exactly (by key or alias) in the text, and the text without them"""
+        from src.data import get_index
+        from src.data.fuzzy import normalize_key
+
+        aliases = get_index("components")["aliases"]
+        words = text.split()
+        found: List[str] = []
+        rest: List[str] = []
+        i = 0
+        while i < len(words):
+            # Longest alias starting at this word wins ("temperature sensor" over "temperature")
+            for size in (3, 2, 1):
+                key = aliases.get(normalize_key(" ".join(words[i:i + size]))) if i + size <= len(words) else None
+                if key:
+                    if key not in found:
+                        found.append(key)
+                    i += size
+                    break
+            else:
+                rest.append(words[i])
+                i += 1
+        return found, " ".join(rest)
+
+    @staticmethod
+    def _component_args(components: List[str]) -> Dict:
+        if len(components) == 1:
+            return {"component_name": components[0]}
+        return {"component_names": components}
+
+    @staticmethod
+    def _find_library(text: str, components: List[str], board: Optional[str]) -> Optional[str]:
+        """Library named in the text, or the first library of a named component"""
+        from src.data import find_library, load_dataset
+
+        if board is None:
+            return None
+        platform = BOARD_PLATFORMS[board]
+        words = [w for w in text.split() if w not in ("library", "libraries", "lib")]
+        for size in (3, 2, 1):
+            for i in range(len(words) - size + 1):
+                name = " ".join(words[i:i + size])
+                if name not in _STOPWORDS and find_library(name, platform, min_score=1.0):
+                    return name
+        for key in components:
+            for name in load_dataset("components")[key].get("libraries", []):
+                if find_library(name, platform, min_score=1.0):
+                    return name
+        return None
+
+    @staticmethod
+    def _template_args(text: str, platform: str, components: List[str]) -> Optional[Dict]:
+        from src.data import load_dataset
+
+        templates = load_dataset("code_templates")[platform]
+        names = [name for pattern, name in _TEMPLATE_NAMES if pattern.search(text)]
+        # A component name such as "temperature sensor" is not the sensor template
+        template = next((name for name in names if name in templates and not (
+            name == "sensor" and components)), "basic")
+        if template not in templates:
+            return None
+
+        params: Dict = {}
+        slots = templates[template]["slots"]
+        port = _PORT_RE.search(text)
+        if port and "port" in slots:
+            params["port"] = int(port.group(1))
+        baud = _BAUD_RE.search(text)
+        if baud and "baud" in slots:
+            params["baud"] = int(baud.group(1) or baud.group(2))
+
+        # Every pin phrase must land in a slot; "unassigned" is the text not yet consumed
+        unassigned = text
+
+        def take_pin(name: str) -> Optional[str]:
+            nonlocal unassigned
+            match = re.search(_COMPONENT_PIN_RE.format(name=re.escape(name)), unassigned)
+            if match is None:
+                return None
+            unassigned = unassigned[:match.start(1)] + " " + unassigned[match.end(1):]
+            return match.group(1).replace(" ", "")
+
+        component_db = load_dataset("components")
+        for key in components:
+            snippet = component_db[key].get("snippets", {}).get("arduino" if platform != "raspberry_pi" else platform)
+            if snippet is None:
+                return None
+            pin_slots = [name for name, slot in snippet.get("slots", {}).items() if slot.get("type") == "pin"]
+            if len(pin_slots) != 1:
+                continue
+            for name in [key] + [alias.lower() for alias in component_db[key].get("aliases", [])]:
+                pin = take_pin(name)
+                if pin:
+                    params[f"{key}.{pin_slots[0]}"] = pin
+                    break
+        # Template pin slots by their name: "servo on pin 9" -> servo_pin
+        for slot_name, slot in slots.items():
+            if slot.get("type") == "pin" and slot_name.endswith("_pin"):
+                pin = take_pin(slot_name[:-len("_pin")])
+                if pin:
+                    params[slot_name] = pin
+        if _PIN_RE.search(unassigned):
+            return None
+
+        args = {"platform": platform, "template_type": template}
+        if params:
+            args["params"] = params
+        if components:
+            args["components"] = components
+        return args
+
+
+def format_result(result) -> str:
+    """Tool output as the chat response"""
+    if isinstance(result, str):
+        return result
+    if not isinstance(result, dict):
+        return str(result)
+    if result.get("error"):
+        return f"❌ {result['error']}"
+    library = result.get("library")
+    if library:
+        text = f"📚 **{library['name']}**\n\n{library.get('description', '')}\n"
+        if library.get("installation"):
+            text += f"\n**Installation:** {library['installation']}\n"
+        if library.get("platforms"):
+            text += f"**Platforms:** {', '.join(library['platforms'])}\n"
+        if library.get("depends"):
+            text += f"**Depends on:** {', '.join(library['depends'])}\n"
+        if library.get("github"):
+            text += f"**Source:** {library['github']}\n"
+        if library.get("example"):
+            text += f"\n**Example:**\n```cpp\n{library['example']}\n```\n"
+        return text
+    return "\n".join(f"**{key}:** {value}" for key, value in result.items() if key != "success")
@@ -2,9 +2,8 @@
 
 import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
-from src.agent import EmbeddedSystemsAgent
 from src.utils import save_code_to_file
 
 
@@ -18,6 +17,9 @@ class EmbeddedSystemsCLI:
             groq_api_key: Groq API key
             auto_ingest: Whether to auto-ingest knowledge base
         """
+        # Deferred so the CLI module imports without the LLM stack
+        from src.agent import EmbeddedSystemsAgent
+
         self.agent = EmbeddedSystemsAgent(groq_api_key, auto_ingest=auto_ingest)
         self.current_platform = ""
         self.session_history = []
@@ -79,10 +81,9 @@ class EmbeddedSystemsCLI:
             return
 
         print("🤔 Thinking...")
-        result = await self.agent.process_request(question, self.current_platform)
+        result = await self._stream_response(question, self.current_platform, "\n💡 ")
 
         if result["success"]:
-            print(f"\n💡 {result['response']}")
             self.session_history.append({
                 "type": "chat",
                 "question": question,
@@ -107,12 +108,9 @@ class EmbeddedSystemsCLI:
         print("⚡ Generating code...")
 
         request = f"Generate {platform} code for: {requirements}"
-        result = await self.agent.process_request(request, platform)
+        result = await self._stream_response(request, platform, f"\n✅ Code for {platform}:\n{'=' * 50}\n")
 
         if result["success"]:
-            print(f"\n✅ Code generated for {platform}:")
-            print("=" * 50)
-            print(result['response'])
             print("=" * 50)
 
             self.session_history.append({
@@ -131,6 +129,38 @@ class EmbeddedSystemsCLI:
         else:
             print(f"❌ Error: {result['error']}")
 
+    async def _stream_response(self, request: str, platform: str = "", prefix: str = "") -> Dict:
+        """Print the agent's reply as it streams in
+        
+        Args:
+            request: Request text
+            platform: Target platform
+            prefix: Printed before the first piece of the reply
+            
+        Returns:
+            The final result dictionary, as from process_request
+        """
+        result = {"success": False, "error": "No response"}
+        printed_prefix = False
+        at_line_start = True
+        async for event in self.agent.stream_request(request, platform):
+            if event["type"] == "token":
+                if not printed_prefix:
+                    print(prefix, end="")
+                    printed_prefix = True
+                print(event["text"], end="", flush=True)
+                at_line_start = event["text"].endswith("\n")
+            elif event["type"] == "tool_start":
+                if not at_line_start:
+                    print()
+                print(f"🔧 Using {event['name']}...", flush=True)
+                at_line_start = True
+            elif event["type"] == "result":
+                result = event["result"]
+        if not at_line_start:
+            print()
+        return result
+
     async def _handle_project(self):
         """Handle complete project generation"""
         if not self.current_platform:
@@ -219,9 +249,11 @@ class EmbeddedSystemsCLI:
             ("🌐 web_search_tool", "Search web for embedded systems information"),
             ("🔌 component_lookup_tool", "Look up electronic components and sensors"),
             ("📌 pinout_lookup_tool", "Get pinout information for microcontrollers"),
+            ("🧭 pin_capability_tool", "Find pins by capability and check pin conflicts"),
             ("📝 code_template_tool", "Get code templates for different platforms"),
             ("✅ code_validator_tool", "Validate code syntax and structure"),
             ("📚 library_lookup_tool", "Look up library information"),
+            ("🧩 library_resolve_tool", "Resolve libraries and dependencies for a platform"),
             ("📁 file_operations_tool", "File and directory operations"),
         ]
 
@@ -249,7 +281,7 @@ class EmbeddedSystemsCLI:
 
         elif tool_demo == "template":
             platform = input("Platform: ").strip()
-            template_type = input("Template type (basic/sensor_reading/web_server): ").strip()
+            template_type = input("Template type (basic/sensor/servo/webserver/bluetooth/gpio/camera): ").strip()
             if platform and template_type:
                 request = f"Get {template_type} template for {platform}"
                 result = await self.agent.process_request(request)
@@ -0,0 +1,10 @@
+"""Static datasets (components, pinouts, templates, libraries) and their loader"""
+
+from .loader import (
+    load_dataset, get_index, dataset_hash, search_components, find_library, resolve_libraries, DATASETS
+)
+
+__all__ = [
+    "load_dataset", "get_index", "dataset_hash", "search_components", "find_library",
+    "resolve_libraries", "DATASETS"
+]
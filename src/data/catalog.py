@@ -0,0 +1,325 @@
+"""SQLite parts and library catalog with FTS5 full-text search
+
+The catalog holds the same records as components.json and libraries.json,
+at any scale. Exact names and aliases are resolved through an indexed
+alias table; everything else goes through FTS5, ranked with bm25 over every
+match and cut to the requested number of results inside SQLite.
+"""
+
+import csv
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .fuzzy import normalize_key
+
+CATALOG_KINDS = ("components", "libraries")
+
+# Fields holding lists; CSV cells separate items with ";"
+LIST_FIELDS = {"pins", "libraries", "aliases", "depends"}
+
+# Fields every component record needs; the lookup tools display them
+COMPONENT_FIELDS = ("type", "description", "voltage", "pins")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS components (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    pins TEXT NOT NULL DEFAULT '',
+    libraries TEXT NOT NULL DEFAULT '',
+    aliases TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS component_aliases (
+    alias TEXT NOT NULL,
+    component_id INTEGER NOT NULL REFERENCES components(id) ON DELETE CASCADE,
+    PRIMARY KEY (alias, component_id)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
+    key, type, description, pins, libraries, aliases,
+    content='components', content_rowid='id', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS components_ai AFTER INSERT ON components BEGIN
+    INSERT INTO components_fts(rowid, key, type, description, pins, libraries, aliases)
+    VALUES (new.id, new.key, new.type, new.description, new.pins, new.libraries, new.aliases);
+END;
+CREATE TRIGGER IF NOT EXISTS components_ad AFTER DELETE ON components BEGIN
+    INSERT INTO components_fts(components_fts, rowid, key, type, description, pins, libraries, aliases)
+    VALUES ('delete', old.id, old.key, old.type, old.description, old.pins, old.libraries, old.aliases);
+END;
+
+CREATE TABLE IF NOT EXISTS libraries (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    aliases TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    UNIQUE (platform, key)
+);
+CREATE TABLE IF NOT EXISTS library_aliases (
+    platform TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    library_id INTEGER NOT NULL REFERENCES libraries(id) ON DELETE CASCADE,
+    PRIMARY KEY (platform, alias, library_id)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS libraries_fts USING fts5(
+    key, name, description, aliases,
+    content='libraries', content_rowid='id', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS libraries_ai AFTER INSERT ON libraries BEGIN
+    INSERT INTO libraries_fts(rowid, key, name, description, aliases)
+    VALUES (new.id, new.key, new.name, new.description, new.aliases);
+END;
+CREATE TRIGGER IF NOT EXISTS libraries_ad AFTER DELETE ON libraries BEGIN
+    INSERT INTO libraries_fts(libraries_fts, rowid, key, name, description, aliases)
+    VALUES ('delete', old.id, old.key, old.name, old.description, old.aliases);
+END;
+"""
+
+# Statement text is constant so sqlite3's statement cache reuses the
+# prepared statements across calls
+_COMPONENT_BY_ALIAS = """
+SELECT c.key, c.data FROM component_aliases a JOIN components c ON c.id = a.component_id
+WHERE a.alias = ? LIMIT 1
+"""
+_COMPONENT_SEARCH = """
+SELECT c.key, c.data, bm25(components_fts, 10.0, 5.0, 1.0, 0.5, 0.5, 5.0) AS rank
+FROM components_fts JOIN components c ON c.id = components_fts.rowid
+WHERE components_fts MATCH ? ORDER BY bm25(components_fts, 10.0, 5.0, 1.0, 0.5, 0.5, 5.0) LIMIT ?
+"""
+_LIBRARY_BY_ALIAS = """
+SELECT l.key, l.data FROM library_aliases a JOIN libraries l ON l.id = a.library_id
+WHERE a.platform = ? AND a.alias = ? LIMIT 1
+"""
+_LIBRARY_SEARCH = """
+SELECT l.key, l.data, bm25(libraries_fts, 10.0, 5.0, 1.0, 5.0) AS rank
+FROM libraries_fts JOIN libraries l ON l.id = libraries_fts.rowid
+WHERE libraries_fts MATCH ? AND l.platform = ? ORDER BY bm25(libraries_fts, 10.0, 5.0, 1.0, 5.0) LIMIT ?
+"""
+
+# Whole words first; prefix queries ("temp" -> "temperature") are slower on
+# common terms, so they only run when whole words find nothing
+_MATCH_MODES = ("words", "prefixes", "any_prefix")
+
+
+def _match_expression(text: str, mode: str) -> Optional[str]:
+    """FTS5 query for free text: every word, every word as a prefix, or any prefix"""
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return None
+    suffix = "" if mode == "words" else "*"
+    separator = " OR " if mode == "any_prefix" else " "
+    return separator.join(f'"{word}"{suffix}' for word in words)
+
+
+def _rank_scores(rows: List[Tuple]) -> List[Tuple[str, Dict, float]]:
+    """Turn bm25 ranks (negative, lower is better) into scores relative to the best hit
+
+    The best hit scores 0.99 (only exact aliases score 1.0) and weaker hits
+    scale down with their rank.
+    """
+    if not rows:
+        return []
+    best = rows[0][2] or -1e-9
+    return [(key, json.loads(data), round(0.99 * min(1.0, (rank or 0.0) / best), 2))
+            for key, data, rank in rows]
+
+
+class CatalogStore:
+    """Parts and library catalog stored in one SQLite file"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection; tools run on executor threads"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), cached_statements=64)
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._local.conn = conn
+        return conn
+
+    def import_components(self, records: Dict[str, Dict], replace: bool = False) -> int:
+        """Insert or update components
+
+        Args:
+            records: Component key -> record in the components.json format
+            replace: Delete every existing component first
+
+        Returns:
+            Number of components written
+
+        Raises:
+            ValueError: A record lacks one of COMPONENT_FIELDS; nothing is written
+        """
+        for key, info in records.items():
+            check_component(key, info)
+        conn = self._connection()
+        with conn:
+            if replace:
+                conn.execute("DELETE FROM components")
+            for key, info in records.items():
+                aliases = list(info.get("aliases", []))
+                conn.execute("DELETE FROM components WHERE key = ?", (key,))
+                cursor = conn.execute(
+                    "INSERT INTO components (key, type, description, pins, libraries, aliases, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, info.get("type", ""), info.get("description", ""),
+                     " ".join(info.get("pins", [])), " ".join(info.get("libraries", [])),
+                     " ".join(aliases), json.dumps(info))
+                )
+                names = {normalize_key(name) for name in [key, *aliases]} - {""}
+                conn.executemany(
+                    "INSERT OR IGNORE INTO component_aliases (alias, component_id) VALUES (?, ?)",
+                    [(name, cursor.lastrowid) for name in names]
+                )
+        return len(records)
+
+    def import_libraries(self, records: Dict[str, Dict[str, Dict]], replace: bool = False) -> int:
+        """Insert or update libraries
+
+        Args:
+            records: Platform -> library key -> record in the libraries.json format
+            replace: Delete every existing library first
+
+        Returns:
+            Number of libraries written
+        """
+        conn = self._connection()
+        count = 0
+        with conn:
+            if replace:
+                conn.execute("DELETE FROM libraries")
+            for platform, libs in records.items():
+                platform = platform.lower()
+                for key, info in libs.items():
+                    aliases = list(info.get("aliases", []))
+                    conn.execute("DELETE FROM libraries WHERE platform = ? AND key = ?", (platform, key))
+                    cursor = conn.execute(
+                        "INSERT INTO libraries (platform, key, name, description, aliases, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (platform, key, info.get("name", ""), info.get("description", ""),
+                         " ".join(aliases), json.dumps(info))
+                    )
+                    names = {normalize_key(name) for name in [key, info.get("name", ""), *aliases]} - {""}
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO library_aliases (platform, alias, library_id) VALUES (?, ?, ?)",
+                        [(platform, name, cursor.lastrowid) for name in names]
+                    )
+                    count += 1
+        return count
+
+    def _search(self, exact_sql: str, exact_args: Tuple, search_sql: str,
+                text: str, extra_args: Tuple, limit: int) -> List[Tuple[str, Dict, float]]:
+        conn = self._connection()
+        exact = conn.execute(exact_sql, exact_args).fetchone()
+        results = [(exact[0], json.loads(exact[1]), 1.0)] if exact else []
+
+        for mode in _MATCH_MODES:
+            expression = _match_expression(text, mode)
+            if expression is None or len(results) >= limit:
+                break
+            rows = conn.execute(search_sql, (expression, *extra_args, limit + 1)).fetchall()
+            seen = {key for key, _, _ in results}
+            results += [row for row in _rank_scores(rows) if row[0] not in seen]
+            if rows:
+                break
+        return results[:limit]
+
+    def find_components(self, query: str, limit: int = 5) -> List[Tuple[str, Dict, float]]:
+        """Ranked (key, record, score) matches for a part name, alias or description"""
+        return self._search(_COMPONENT_BY_ALIAS, (normalize_key(query),),
+                            _COMPONENT_SEARCH, query, (), limit)
+
+    def find_libraries(self, query: str, platform: str, limit: int = 5) -> List[Tuple[str, Dict, float]]:
+        """Ranked (key, record, score) matches for a library on one platform"""
+        platform = platform.lower()
+        return self._search(_LIBRARY_BY_ALIAS, (platform, normalize_key(query)),
+                            _LIBRARY_SEARCH, query, (platform,), limit)
+
+    def counts(self) -> Dict[str, int]:
+        conn = self._connection()
+        return {kind: conn.execute(f"SELECT COUNT(*) FROM {kind}").fetchone()[0] for kind in CATALOG_KINDS}
+
+
+def check_component(key: str, info: Dict) -> None:
+    """Raise ValueError if a component record lacks a required field"""
+    missing = [field for field in COMPONENT_FIELDS if not info.get(field)]
+    if missing:
+        raise ValueError(f"Component '{key}' is missing {', '.join(missing)}")
+
+
+def _split_list(value) -> List[str]:
+    if isinstance(value, list):
+        return value
+    return [item.strip() for item in str(value or "").split(";") if item.strip()]
+
+
+def _from_rows(rows: Iterable[Dict], kind: str) -> Dict:
+    """Convert flat records (CSV rows or a JSON list) to the dataset shape"""
+    records: Dict = {}
+    for row in rows:
+        row = {field: value for field, value in row.items() if value not in (None, "")}
+        for field in LIST_FIELDS & row.keys():
+            row[field] = _split_list(row[field])
+        key = row.pop("key", None) or row.get("name")
+        if not key:
+            raise ValueError(f"Catalog row without key or name: {row}")
+        if kind == "libraries":
+            platform = row.pop("platform", None)
+            if not platform:
+                raise ValueError(f"Library row without platform: {key}")
+            records.setdefault(platform.lower(), {})[key.lower()] = row
+        else:
+            check_component(key, row)
+            records[key.lower()] = row
+    return records
+
+
+def read_catalog_file(path: str, kind: str) -> Dict:
+    """Read a CSV or JSON catalog file
+
+    JSON files use the components.json / libraries.json shape or are a list
+    of flat records. CSV files have one record per row with a "key" column
+    (libraries also need "platform"); list columns separate items with ";".
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return _from_rows(csv.DictReader(f), kind)
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return _from_rows(data, kind) if isinstance(data, list) else data
+
+
+_stores: Dict[str, CatalogStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_catalog(path: Optional[str] = None) -> Optional[CatalogStore]:
+    """Return the configured catalog store, or None when no catalog is set up"""
+    if path is None:
+        from src.config import PARTS_CATALOG_DB
+        path = PARTS_CATALOG_DB
+    if not path or not Path(path).exists():
+        return None
+
+    with _stores_lock:
+        store = _stores.get(str(path))
+        if store is None:
+            store = _stores[str(path)] = CatalogStore(path)
+    return store
@@ -0,0 +1,140 @@
+"""Alias and trigram indexes for ranked fuzzy lookups
+
+Indexes are plain dicts and lists so the dataset loader can cache them in
+its compiled pickle. Trigram postings point at distinct terms (names and
+description words), not at entries, and a lookup scores at most
+MAX_CANDIDATES terms, so cost depends on the query, not on the catalog size.
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+
+# Word aliases (e.g. "temperature" from a type) rank below full-name aliases
+WORD_WEIGHT = 0.8
+MIN_SCORE = 0.35
+# Trigrams shared by more terms than this (" se", "sor") only generate
+# candidates when the query has no rarer trigram
+COMMON_GRAM_POSTINGS = 256
+# Terms scored per lookup, those sharing the most query trigrams first
+MAX_CANDIDATES = 64
+# Description words found in more entries than this ("module", "sensor")
+# do not identify a part and are not indexed
+COMMON_WORD_KEYS = 32
+
+
+def normalize_key(name: str) -> str:
+    """Normalize a part, board or library name for lookups"""
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+def trigrams(text: str) -> List[str]:
+    """Padded character trigrams of a normalized string"""
+    padded = f"  {text} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _words(text: str) -> List[str]:
+    word = []
+    words = []
+    for ch in text.lower():
+        if ch.isalnum():
+            word.append(ch)
+        elif word:
+            words.append("".join(word))
+            word = []
+    if word:
+        words.append("".join(word))
+    return [w for w in words if len(w) >= 3]
+
+
+def build_fuzzy_index(items: Iterable[Tuple[str, List[str], List[str]]]) -> Dict:
+    """Build alias and trigram indexes
+
+    Args:
+        items: (key, names, descriptive_texts) per entry. Names are indexed as
+            whole aliases; descriptive texts contribute individual words.
+
+    Returns:
+        Dict with "aliases" (normalized alias -> key, unique aliases only),
+        "terms", "term_keys" (term id -> [(key, weight)]) and "trigrams"
+        (trigram -> term ids)
+    """
+    names: Dict[str, Dict[str, float]] = defaultdict(dict)
+    words: Dict[str, Dict[str, float]] = defaultdict(dict)
+    keys = set()
+    for key, entry_names, texts in items:
+        keys.add(normalize_key(key))
+        for name in entry_names:
+            normalized = normalize_key(name)
+            if normalized:
+                names[normalized][key] = 1.0
+        for text in texts:
+            for word in _words(text):
+                words[word].setdefault(key, WORD_WEIGHT)
+
+    # A name is an exact alias only if it names one entry ("motor driver" may
+    # be the type of hundreds); a key always resolves to its own entry
+    aliases = {name: next(iter(owners)) for name, owners in names.items()
+               if len(owners) == 1 or name in keys}
+    for name in keys & aliases.keys():
+        aliases[name] = next(key for key in names[name] if normalize_key(key) == name)
+
+    term_keys: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+    for name, owners in names.items():
+        term_keys[name].extend(owners.items())
+    for word, owners in words.items():
+        if len(owners) <= COMMON_WORD_KEYS:
+            term_keys[word].extend(owners.items())
+
+    terms = sorted(term_keys)
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for term_id, term in enumerate(terms):
+        for gram in set(trigrams(term)):
+            postings[gram].append(term_id)
+
+    return {
+        "aliases": aliases,
+        "terms": terms,
+        "term_keys": [sorted(term_keys[term]) for term in terms],
+        "trigrams": dict(postings),
+    }
+
+
+def fuzzy_search(index: Dict, query: str, limit: int = 5, min_score: float = MIN_SCORE) -> List[Tuple[str, float]]:
+    """Rank keys for a query
+
+    An exact alias scores 1.0. Otherwise each candidate term is scored by
+    trigram overlap: Dice similarity for whole names, containment for
+    words, so "temp" finds "temperature" but a close full name wins.
+
+    Returns:
+        (key, score) pairs, best first
+    """
+    normalized = normalize_key(query)
+    if not normalized:
+        return []
+
+    scores: Dict[str, float] = {}
+    exact = index["aliases"].get(normalized)
+    if exact:
+        scores[exact] = 1.0
+
+    query_grams = set(trigrams(normalized))
+    postings = [index["trigrams"][gram] for gram in query_grams if gram in index["trigrams"]]
+    rare = [p for p in postings if len(p) <= COMMON_GRAM_POSTINGS] or postings
+    shared = Counter(term_id for posting in rare for term_id in posting)
+
+    for term_id, _ in shared.most_common(MAX_CANDIDATES):
+        term = index["terms"][term_id]
+        term_grams = set(trigrams(term))
+        overlap = len(query_grams & term_grams)
+        dice = 2 * overlap / (len(query_grams) + len(term_grams))
+        containment = overlap / len(query_grams)
+        for key, weight in index["term_keys"][term_id]:
+            score = dice if weight == 1.0 else weight * containment
+            score = min(score, 0.99)  # Only exact aliases score 1.0
+            if score >= min_score and score > scores.get(key, 0.0):
+                scores[key] = score
+
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
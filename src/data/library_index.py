@@ -0,0 +1,122 @@
+"""Library availability, alias and dependency index
+
+libraries.json groups libraries by the platform they are published for.
+An entry's "platforms" lists every platform it works on, "aliases" the
+other names it is asked for by (header files, package names) and
+"depends" the libraries it needs, by key or alias. The index maps each
+platform to a fuzzy index over the libraries available on it, so a
+library's platform, aliases and dependencies resolve without scanning.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .fuzzy import build_fuzzy_index, fuzzy_search
+
+# (name, platform, min_score) -> (library id, record) or None.
+# Library ids are "<home platform>/<key>".
+LibraryLookup = Callable[[str, str, float], Optional[Tuple[str, Dict]]]
+
+
+def library_id(platform: str, key: str) -> str:
+    return f"{platform}/{key}"
+
+
+def split_library_id(lib_id: str) -> Tuple[str, str]:
+    platform, key = lib_id.split("/", 1)
+    return platform, key
+
+
+def build_library_index(data: Dict) -> Dict:
+    """Per-platform fuzzy indexes over every library available on the platform
+
+    Libraries published for a platform are added before libraries that
+    also work there, so their names and aliases take precedence.
+    """
+    available: Dict[str, List[Tuple[bool, str, Dict]]] = {}
+    for home, libs in data.items():
+        for key, info in libs.items():
+            for platform in info.get("platforms", [home]):
+                available.setdefault(platform, []).append((platform != home, library_id(home, key), info))
+
+    return {
+        "by_platform": {
+            platform: build_fuzzy_index(
+                (lib_id, [split_library_id(lib_id)[1], info["name"], *info.get("aliases", [])], [info["description"]])
+                for _, lib_id, info in sorted(entries, key=lambda entry: entry[0])
+            )
+            for platform, entries in available.items()
+        }
+    }
+
+
+def find_library(index: Dict, name: str, platform: str, min_score: float = 1.0) -> Optional[Tuple[str, float]]:
+    """Best (library id, score) for a name on a platform
+
+    The default min_score only accepts keys, names and aliases; lower it
+    to accept fuzzy matches.
+    """
+    platform_index = index["by_platform"].get(platform.lower())
+    if platform_index is None:
+        return None
+    matches = fuzzy_search(platform_index, name, limit=1, min_score=min_score)
+    return matches[0] if matches else None
+
+
+def resolve_install_set(names: List[str], platform: str, lookup: LibraryLookup,
+                        min_score: float = 1.0) -> Dict:
+    """Resolve libraries and their dependency closure for one platform
+
+    Args:
+        names: Requested library names, keys or aliases
+        platform: Target platform
+        lookup: Finds a library available on the platform
+        min_score: Match score requested names need; dependencies always
+            match exactly
+
+    Returns:
+        Dict with "resolved" (requested name -> library id), "install_set"
+        (records, dependencies before dependents), "missing" (names not
+        available on the platform) and "cycles"
+    """
+    resolved: Dict[str, str] = {}
+    records: Dict[str, Dict] = {}
+    install_order: List[str] = []
+    missing: List[str] = []
+    cycles: List[List[str]] = []
+    state: Dict[str, str] = {}  # library id -> "visiting" | "done"
+
+    def visit(lib_id: str, path: List[str]):
+        if state.get(lib_id) == "done":
+            return
+        if state.get(lib_id) == "visiting":
+            cycles.append(path[path.index(lib_id):] + [lib_id])
+            return
+        state[lib_id] = "visiting"
+        for dependency in records[lib_id].get("depends", []):
+            found = lookup(dependency, platform, 1.0)
+            if found is None:
+                missing.append(f"{dependency} (required by {lib_id})")
+                continue
+            dep_id, dep_info = found
+            records.setdefault(dep_id, dep_info)
+            visit(dep_id, path + [lib_id])
+        state[lib_id] = "done"
+        install_order.append(lib_id)
+
+    for name in names:
+        found = lookup(name, platform, min_score)
+        if found is None:
+            missing.append(name)
+            continue
+        lib_id, info = found
+        resolved[name] = lib_id
+        records.setdefault(lib_id, info)
+        visit(lib_id, [])
+
+    return {
+        "platform": platform,
+        "resolved": resolved,
+        "install_set": [dict(records[lib_id], id=lib_id) for lib_id in install_order],
+        "missing": missing,
+        "cycles": cycles,
+    }
@@ -0,0 +1,165 @@
+"""Lazy dataset loader with a compiled cache keyed by file hash
+
+Each dataset lives in a JSON file next to this module. The first access in a
+process loads it, builds its lookup indexes and stores both as a pickle in
+DATA_CACHE_DIR. Later processes load the pickle directly as long as the
+JSON file's hash is unchanged.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config import DATA_CACHE_DIR, LIBRARY_RESOLVE_MIN_SCORE
+from .fuzzy import build_fuzzy_index, fuzzy_search, normalize_key
+from .library_index import (
+    build_library_index, find_library as _find_library, library_id, resolve_install_set, split_library_id
+)
+from .pins import build_pin_table
+
+DATA_DIR = Path(__file__).parent
+
+DATASETS = {
+    "components": "components.json",
+    "pinouts": "pinouts.json",
+    "code_templates": "code_templates.json",
+    "libraries": "libraries.json",
+}
+
+# Bump when an index builder changes so stale compiled caches are rebuilt
+INDEX_VERSION = 6
+
+_loaded: Dict[str, Dict] = {}
+_lock = threading.Lock()
+
+
+def _index_components(data: Dict) -> Dict:
+    return build_fuzzy_index(
+        (key, [key, info["type"], *info.get("aliases", [])], [info["type"], info["description"]])
+        for key, info in data.items()
+    )
+
+
+def _index_pinouts(data: Dict) -> Dict:
+    return {
+        "by_key": {normalize_key(key): key for key in data},
+        "pins": {key: build_pin_table(info) for key, info in data.items()},
+    }
+
+
+def _index_libraries(data: Dict) -> Dict:
+    return build_library_index(data)
+
+
+_INDEX_BUILDERS: Dict[str, Callable[[Dict], Dict]] = {
+    "components": _index_components,
+    "pinouts": _index_pinouts,
+    "libraries": _index_libraries,
+}
+
+
+def dataset_hash(name: str) -> str:
+    """SHA-256 of a dataset file, used to key compiled caches"""
+    digest = hashlib.sha256((DATA_DIR / DATASETS[name]).read_bytes())
+    digest.update(str(INDEX_VERSION).encode())
+    return digest.hexdigest()
+
+
+def _compile(name: str, file_hash: str) -> Dict:
+    """Load a dataset from its compiled cache, or parse and index it"""
+    cache_path = DATA_CACHE_DIR / f"{name}-{file_hash[:16]}.pickle"
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, unreadable or stale caches (moved names) are rebuilt from JSON
+        pass
+
+    with open(DATA_DIR / DATASETS[name], "r", encoding="utf-8") as f:
+        data = json.load(f)
+    builder = _INDEX_BUILDERS.get(name)
+    compiled = {"data": data, "index": builder(data) if builder else {}}
+
+    # Cache write failures (read-only installs) only cost the rebuild next time
+    try:
+        DATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return compiled
+
+
+def _get(name: str) -> Dict:
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}. Available: {', '.join(DATASETS)}")
+
+    compiled = _loaded.get(name)
+    if compiled is None:
+        with _lock:
+            compiled = _loaded.get(name)
+            if compiled is None:
+                compiled = _loaded[name] = _compile(name, dataset_hash(name))
+    return compiled
+
+
+def load_dataset(name: str) -> Dict:
+    """Return a dataset, loading it on first use"""
+    return _get(name)["data"]
+
+
+def get_index(name: str) -> Dict:
+    """Return the lookup indexes built for a dataset"""
+    return _get(name)["index"]
+
+
+def search_components(query: str, limit: int = 5) -> List[Tuple[str, float]]:
+    """Rank component keys for a name, alias or partial description"""
+    return fuzzy_search(get_index("components"), query, limit)
+
+
+def find_library(name: str, platform: str, min_score: float = 1.0) -> Optional[Tuple[str, Dict, float]]:
+    """(library id, record, score) of a library available on a platform, or None"""
+    match = _find_library(get_index("libraries"), name, platform, min_score)
+    if match is None:
+        return None
+    lib_id, score = match
+    home, key = split_library_id(lib_id)
+    return lib_id, load_dataset("libraries")[home][key], score
+
+
+def resolve_libraries(names: List[str], platform: str, min_score: float = LIBRARY_RESOLVE_MIN_SCORE) -> Dict:
+    """Resolve several libraries for a platform with their dependency closure
+
+    Names are matched against keys, names and aliases of the libraries
+    available on the platform, then fuzzily down to min_score. Libraries
+    missing from the bundled dataset are looked up in the parts catalog.
+    See library_index.resolve_install_set for the result.
+    """
+    from .catalog import get_catalog
+
+    catalog = get_catalog()
+
+    def lookup(name: str, target: str, threshold: float) -> Optional[Tuple[str, Dict]]:
+        match = find_library(name, target, threshold)
+        if match:
+            return match[0], match[1]
+        candidates = {key: info for key, info, _ in (catalog.find_libraries(name, target) if catalog else [])}
+        if not candidates:
+            return None
+        # Catalog scores are relative to the best hit, so rescore the candidates'
+        # names on the bundled index's absolute scale before applying the threshold
+        index = build_fuzzy_index((key, [key, info.get("name", ""), *info.get("aliases", [])], [])
+                                  for key, info in candidates.items())
+        for key, _ in fuzzy_search(index, name, limit=1, min_score=threshold):
+            return library_id(target, key), candidates[key]
+        return None
+
+    return resolve_install_set(names, platform.lower(), lookup, min_score)
@@ -0,0 +1,193 @@
+"""Pin-capability tables parsed from the pinout dataset
+
+The pinout entries describe pins as text ("32-39, 25-27 (12-bit ADC)",
+"GPIO 2 (pin 3)") and may list every real pin in "gpios". build_pin_table
+turns one board entry into pin -> capabilities, functions and constraints,
+so capability and conflict questions are answered by set operations
+instead of reading the text.
+"""
+
+import re
+from typing import Dict, Iterable, List
+
+# Pinout fields that list pins, and the capability they grant
+PIN_FIELDS = {
+    "digital_pins": "digital",
+    "gpio_pins": "digital",
+    "analog_pins": "adc",
+    "pwm_pins": "pwm",
+    "touch_pins": "touch",
+}
+
+CAPABILITY_NAMES = {"digital", "input", "output", "adc", "pwm", "touch", "i2c", "spi", "uart", "led"}
+
+# Constraints that make a pin unsafe to drive while the board boots
+BOOT_UNSAFE = {"strapping", "flash", "serial"}
+
+CAPABILITY_ALIASES = {
+    "analog": "adc",
+    "gpio": "digital",
+    "i2c_sda": "i2c",
+    "i2c_scl": "i2c",
+    "sda": "i2c",
+    "scl": "i2c",
+    "touch_sensor": "touch",
+    "led_builtin": "led",
+    "built_in_led": "led",
+}
+
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_PIN_RANGE = re.compile(r"\b(A|GPIO\s*)?(\d+)(?:\s*-\s*(?:A|GPIO\s*)?(\d+))?\b")
+
+
+def normalize_capability(name: str) -> str:
+    """Canonical capability name ("Analog" -> "adc", "I2C SDA" -> "i2c")"""
+    key = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    return CAPABILITY_ALIASES.get(key, key)
+
+
+def resolve_pin(table: Dict, pin) -> str:
+    """Canonical pin name in a board table ("gpio 4" -> "GPIO4", "a0" -> "A0")
+
+    Bare numbers on boards that name pins "GPIO<n>" resolve to that GPIO,
+    and "GPIO<n>" on boards that name pins by number resolves to "<n>".
+    """
+    name = re.sub(r"\s+", "", str(pin)).upper()
+    if name not in table and name.isdigit() and f"GPIO{name}" in table:
+        return f"GPIO{name}"
+    if name not in table and name.startswith("GPIO") and name[4:] in table:
+        return name[4:]
+    return name
+
+
+def parse_pin_list(text: str) -> List[str]:
+    """Pins named in a pinout string; parenthetical remarks are ignored"""
+    pins = []
+    for prefix, start, end in _PIN_RANGE.findall(_PARENTHETICAL.sub("", text)):
+        prefix = prefix.replace(" ", "")
+        last = int(end) if end else int(start)
+        pins.extend(f"{prefix}{number}" for number in range(int(start), last + 1))
+    return pins
+
+
+def _capability_of_function(function: str) -> str:
+    """Capability a special function belongs to ("SPI MOSI" -> "spi", "PWM0" -> "pwm")"""
+    if "LED" in function.upper():
+        return "led"
+    bus = re.match(r"[A-Za-z0-9]+", function).group(0)
+    return normalize_capability(re.sub(r"\d+$", "", bus))
+
+
+def build_pin_table(info: Dict) -> Dict[str, Dict[str, List[str]]]:
+    """Pin -> {"capabilities", "functions", "constraints"} for one board entry"""
+    table: Dict[str, Dict[str, set]] = {}
+
+    def pin_entry(pin: str) -> Dict[str, set]:
+        return table.setdefault(pin, {"capabilities": set(), "functions": set(), "constraints": set()})
+
+    for field, capability in PIN_FIELDS.items():
+        text = info.get(field)
+        if not text:
+            continue
+        if text.lower().startswith("all digital pins"):
+            continue  # Applied below, once every digital pin is known
+        for pin in parse_pin_list(text):
+            pin_entry(pin)["capabilities"].update({capability, "digital"})
+
+    for function, text in info.get("special_pins", {}).items():
+        for pin in parse_pin_list(text):
+            entry = pin_entry(pin)
+            entry["functions"].add(function)
+            entry["capabilities"].add(_capability_of_function(function))
+
+    for constraint, text in info.get("pin_constraints", {}).items():
+        for pin in parse_pin_list(text):
+            pin_entry(pin)["constraints"].add(constraint)
+
+    # An explicit GPIO list is authoritative; ranges such as "0-39" in the
+    # text fields must not add pins the chip does not have
+    if "gpios" in info:
+        gpios = {str(pin) for pin in info["gpios"]}
+        table = {pin: entry for pin, entry in table.items() if pin in gpios}
+
+    if info.get("pwm_pins", "").lower().startswith("all digital pins"):
+        for entry in table.values():
+            if "digital" in entry["capabilities"]:
+                entry["capabilities"].add("pwm")
+
+    for pin, entry in table.items():
+        if "digital" in entry["capabilities"]:
+            entry["capabilities"].add("input")
+            if "input_only" not in entry["constraints"] and "flash" not in entry["constraints"]:
+                entry["capabilities"].add("output")
+        if "input_only" in entry["constraints"]:
+            entry["capabilities"].discard("pwm")
+
+    return {
+        pin: {field: sorted(values) for field, values in entry.items()}
+        for pin, entry in table.items()
+    }
+
+
+def board_pin_map(info: Dict) -> Dict[int, str]:
+    """Physical header pin -> GPIO name, for boards whose entry has a board_pins map"""
+    return {int(pin): f"GPIO{gpio}" for pin, gpio in info.get("board_pins", {}).items()}
+
+
+def _pin_sort_key(pin: str):
+    match = re.match(r"([A-Z]*)(\d+)$", pin)
+    return (match.group(1), int(match.group(2))) if match else (pin, 0)
+
+
+def is_boot_safe(entry: Dict[str, List[str]]) -> bool:
+    return not BOOT_UNSAFE.intersection(entry["constraints"])
+
+
+def find_pins(table: Dict, capabilities: Iterable[str], boot_safe: bool = False) -> List[str]:
+    """Pins that have every requested capability, usable (not flash) pins only"""
+    wanted = {normalize_capability(c) for c in capabilities}
+    return sorted(
+        (pin for pin, entry in table.items()
+         if wanted <= set(entry["capabilities"]) and "flash" not in entry["constraints"]
+         and (not boot_safe or is_boot_safe(entry))),
+        key=_pin_sort_key
+    )
+
+
+def check_pin_assignment(table: Dict, assignments: Dict[str, str]) -> List[str]:
+    """Conflicts in a pin -> purpose assignment
+
+    Args:
+        table: Pin table from build_pin_table
+        assignments: Pin -> purpose, where the purpose may name a capability
+            ("adc", "pwm", "output") that the pin must provide
+
+    Returns:
+        Human-readable conflicts, empty when the assignment is sound
+    """
+    conflicts = []
+    for pin, purpose in assignments.items():
+        pin = resolve_pin(table, pin)
+        entry = table.get(pin)
+        if entry is None:
+            conflicts.append(f"{pin}: not a GPIO pin on this board")
+            continue
+
+        capability = normalize_capability(purpose) if purpose else ""
+        if "input_only" in entry["constraints"] and capability in ("output", "pwm"):
+            conflicts.append(f"{pin}: input-only pin cannot drive {capability}")
+        elif capability in CAPABILITY_NAMES and capability not in entry["capabilities"]:
+            conflicts.append(f"{pin}: does not support {capability}")
+        if "flash" in entry["constraints"]:
+            conflicts.append(f"{pin}: connected to flash memory, do not use")
+        if "strapping" in entry["constraints"]:
+            conflicts.append(f"{pin}: strapping pin, external pull-ups/downs can change boot mode")
+        if "serial" in entry["constraints"]:
+            conflicts.append(f"{pin}: shared with the USB serial port")
+        if "pull_up" in entry["constraints"] and capability in ("input", "adc"):
+            conflicts.append(f"{pin}: has a fixed pull-up resistor")
+        for function in entry["functions"]:
+            if _capability_of_function(function) not in (capability, "led"):
+                conflicts.append(f"{pin}: also used as {function}")
+    return conflicts
+
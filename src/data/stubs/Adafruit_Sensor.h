@@ -0,0 +1,37 @@
+// Declaration-only stand-in for the Adafruit Unified Sensor library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+typedef struct {
+    int32_t version;
+    int32_t sensor_id;
+    int32_t type;
+    int32_t timestamp;
+    union {
+        float data[4];
+        float temperature;
+        float relative_humidity;
+        float pressure;
+        float light;
+        float distance;
+    };
+} sensors_event_t;
+
+typedef struct {
+    char name[12];
+    int32_t version;
+    int32_t sensor_id;
+    int32_t type;
+    float max_value;
+    float min_value;
+    float resolution;
+    int32_t min_delay;
+} sensor_t;
+
+class Adafruit_Sensor {
+public:
+    virtual ~Adafruit_Sensor() {}
+    virtual bool getEvent(sensors_event_t* event) = 0;
+    virtual void getSensor(sensor_t* sensor) = 0;
+};
@@ -0,0 +1,224 @@
+// Declaration-only stand-in for the Arduino core, used by `g++ -fsyntax-only`
+// compile checks. Covers the AVR core API plus common ESP32 additions.
+#pragma once
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+
+typedef uint8_t byte;
+typedef bool boolean;
+typedef uint16_t word;
+
+#define HIGH 0x1
+#define LOW 0x0
+#define INPUT 0x0
+#define OUTPUT 0x1
+#define INPUT_PULLUP 0x2
+#define INPUT_PULLDOWN 0x9
+#define CHANGE 1
+#define FALLING 2
+#define RISING 3
+#define LED_BUILTIN 2
+#define PI 3.1415926535897932384626433832795
+#define DEC 10
+#define HEX 16
+#define OCT 8
+#define BIN 2
+#define LSBFIRST 0
+#define MSBFIRST 1
+
+#define A0 14
+#define A1 15
+#define A2 16
+#define A3 17
+#define A4 18
+#define A5 19
+#define A6 20
+#define A7 21
+
+#define PROGMEM
+#define IRAM_ATTR
+#define F(string_literal) (string_literal)
+#define digitalPinToInterrupt(p) (p)
+#define bitRead(value, bit) (((value) >> (bit)) & 0x01)
+#define bitSet(value, bit) ((value) |= (1UL << (bit)))
+#define bitClear(value, bit) ((value) &= ~(1UL << (bit)))
+#define bitWrite(value, bit, bitvalue) ((bitvalue) ? bitSet(value, bit) : bitClear(value, bit))
+#define lowByte(w) ((uint8_t)((w) & 0xff))
+#define highByte(w) ((uint8_t)((w) >> 8))
+#define noInterrupts()
+#define interrupts()
+
+template <typename T, typename U> auto min(const T& a, const U& b) -> decltype(a < b ? a : b);
+template <typename T, typename U> auto max(const T& a, const U& b) -> decltype(a > b ? a : b);
+template <typename T, typename L, typename H> T constrain(T x, L low, H high);
+
+void pinMode(uint8_t pin, uint8_t mode);
+void digitalWrite(uint8_t pin, uint8_t value);
+int digitalRead(uint8_t pin);
+int analogRead(uint8_t pin);
+void analogWrite(uint8_t pin, int value);
+void analogReference(uint8_t mode);
+void analogReadResolution(int bits);
+
+unsigned long millis();
+unsigned long micros();
+void delay(unsigned long ms);
+void delayMicroseconds(unsigned int us);
+
+long map(long x, long in_min, long in_max, long out_min, long out_max);
+long random(long max);
+long random(long min, long max);
+void randomSeed(unsigned long seed);
+
+void tone(uint8_t pin, unsigned int frequency, unsigned long duration = 0);
+void noTone(uint8_t pin);
+unsigned long pulseIn(uint8_t pin, uint8_t state, unsigned long timeout = 1000000L);
+void shiftOut(uint8_t data_pin, uint8_t clock_pin, uint8_t bit_order, uint8_t value);
+uint8_t shiftIn(uint8_t data_pin, uint8_t clock_pin, uint8_t bit_order);
+
+void attachInterrupt(uint8_t interrupt, void (*handler)(void), int mode);
+void detachInterrupt(uint8_t interrupt);
+
+void setup(void);
+void loop(void);
+
+class String {
+public:
+    String(const char* value = "");
+    String(const String& value);
+    explicit String(char value);
+    explicit String(int value, unsigned char base = 10);
+    explicit String(unsigned int value, unsigned char base = 10);
+    explicit String(long value, unsigned char base = 10);
+    explicit String(unsigned long value, unsigned char base = 10);
+    explicit String(float value, unsigned char decimals = 2);
+    explicit String(double value, unsigned char decimals = 2);
+
+    String& operator=(const String& other);
+    String& operator=(const char* other);
+    template <typename T> String& operator+=(const T& value);
+    bool operator==(const String& other) const;
+    bool operator==(const char* other) const;
+    bool operator!=(const String& other) const;
+    bool operator!=(const char* other) const;
+    bool operator<(const String& other) const;
+    char operator[](unsigned int index) const;
+    char& operator[](unsigned int index);
+
+    template <typename T> bool concat(const T& value);
+    unsigned int length() const;
+    const char* c_str() const;
+    char charAt(unsigned int index) const;
+    void setCharAt(unsigned int index, char c);
+    bool equals(const String& other) const;
+    bool equalsIgnoreCase(const String& other) const;
+    bool startsWith(const String& prefix) const;
+    bool endsWith(const String& suffix) const;
+    int indexOf(char c, unsigned int from = 0) const;
+    int indexOf(const String& s, unsigned int from = 0) const;
+    int lastIndexOf(char c) const;
+    int lastIndexOf(const String& s) const;
+    String substring(unsigned int begin) const;
+    String substring(unsigned int begin, unsigned int end) const;
+    void replace(const String& find, const String& replacement);
+    void remove(unsigned int index, unsigned int count = 1);
+    void toLowerCase();
+    void toUpperCase();
+    void trim();
+    long toInt() const;
+    float toFloat() const;
+    double toDouble() const;
+    void reserve(unsigned int size);
+    bool isEmpty() const;
+};
+
+String operator+(const String& lhs, const String& rhs);
+template <typename T> String operator+(const String& lhs, const T& rhs);
+template <typename T> String operator+(const T& lhs, const String& rhs);
+
+class Print {
+public:
+    template <typename T> size_t print(const T& value);
+    template <typename T> size_t print(const T& value, int format);
+    size_t println();
+    template <typename T> size_t println(const T& value);
+    template <typename T> size_t println(const T& value, int format);
+    size_t printf(const char* format, ...);
+    virtual size_t write(uint8_t value);
+    size_t write(const uint8_t* buffer, size_t size);
+    size_t write(const char* str);
+    virtual void flush();
+};
+
+class Stream : public Print {
+public:
+    virtual int available();
+    virtual int read();
+    virtual int peek();
+    void setTimeout(unsigned long timeout);
+    bool find(const char* target);
+    long parseInt();
+    float parseFloat();
+    size_t readBytes(char* buffer, size_t length);
+    size_t readBytesUntil(char terminator, char* buffer, size_t length);
+    String readString();
+    String readStringUntil(char terminator);
+};
+
+class HardwareSerial : public Stream {
+public:
+    void begin(unsigned long baud);
+    void begin(unsigned long baud, uint32_t config, int8_t rx_pin = -1, int8_t tx_pin = -1);
+    void end();
+    explicit operator bool() const;
+};
+
+#define SERIAL_8N1 0x800001c
+
+extern HardwareSerial Serial;
+extern HardwareSerial Serial1;
+extern HardwareSerial Serial2;
+
+#ifdef ESP32
+#define ADC_11db 3
+#define ESP_SLEEP_WAKEUP_TIMER 4
+
+void ledcSetup(uint8_t channel, uint32_t frequency, uint8_t resolution_bits);
+void ledcAttachPin(uint8_t pin, uint8_t channel);
+bool ledcAttach(uint8_t pin, uint32_t frequency, uint8_t resolution_bits);
+void ledcWrite(uint8_t channel_or_pin, uint32_t duty);
+void ledcDetachPin(uint8_t pin);
+void dacWrite(uint8_t pin, uint8_t value);
+uint16_t touchRead(uint8_t pin);
+void analogSetAttenuation(int attenuation);
+void analogSetPinAttenuation(uint8_t pin, int attenuation);
+
+void esp_sleep_enable_timer_wakeup(uint64_t time_in_us);
+void esp_sleep_enable_ext0_wakeup(int pin, int level);
+void esp_deep_sleep_start();
+void esp_light_sleep_start();
+int esp_sleep_get_wakeup_cause();
+
+class EspClass {
+public:
+    void restart();
+    uint32_t getFreeHeap();
+    uint32_t getHeapSize();
+    uint32_t getChipId();
+    const char* getChipModel();
+    uint32_t getCpuFreqMHz();
+    uint64_t getEfuseMac();
+};
+
+extern EspClass ESP;
+
+#define xTaskCreate(...) 1
+#define xTaskCreatePinnedToCore(...) 1
+#define vTaskDelay(ticks) ((void)(ticks))
+#define pdMS_TO_TICKS(ms) (ms)
+#define portTICK_PERIOD_MS 1
+#endif
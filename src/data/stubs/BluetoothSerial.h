@@ -0,0 +1,20 @@
+// Declaration-only stand-in for the ESP32 BluetoothSerial library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+class BluetoothSerial : public Stream {
+public:
+    BluetoothSerial();
+    bool begin(const String& local_name = String("ESP32"), bool is_master = false);
+    void end();
+    bool connect(const String& remote_name);
+    bool connected(int timeout = 0);
+    bool hasClient();
+    bool disconnect();
+    int available() override;
+    int read() override;
+    int peek() override;
+    size_t write(uint8_t value) override;
+    void flush() override;
+};
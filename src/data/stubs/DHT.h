@@ -0,0 +1,22 @@
+// Declaration-only stand-in for the Adafruit DHT library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+#define DHT11 11
+#define DHT12 12
+#define DHT22 22
+#define DHT21 21
+#define AM2301 21
+
+class DHT {
+public:
+    DHT(uint8_t pin, uint8_t type, uint8_t count = 6);
+    void begin(uint8_t usec = 55);
+    float readTemperature(bool fahrenheit = false, bool force = false);
+    float readHumidity(bool force = false);
+    float convertCtoF(float celsius);
+    float convertFtoC(float fahrenheit);
+    float computeHeatIndex(float temperature, float humidity, bool fahrenheit = true);
+    bool read(bool force = false);
+};
@@ -0,0 +1,23 @@
+// Declaration-only stand-in for the ESP32Servo library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+class ESP32PWM {
+public:
+    static void allocateTimer(int timer);
+};
+
+class Servo {
+public:
+    Servo();
+    int attach(int pin);
+    int attach(int pin, int min_us, int max_us);
+    void detach();
+    void write(int value);
+    void writeMicroseconds(int value);
+    int read();
+    int readMicroseconds();
+    bool attached();
+    void setPeriodHertz(int hertz);
+};
@@ -0,0 +1,21 @@
+// Declaration-only stand-in for the ESP32 HTTPClient library (compile checks only)
+#pragma once
+
+#include <WiFi.h>
+
+#define HTTP_CODE_OK 200
+
+class HTTPClient {
+public:
+    bool begin(const String& url);
+    bool begin(WiFiClient& client, const String& url);
+    void end();
+    void addHeader(const String& name, const String& value);
+    void setTimeout(uint16_t timeout);
+    int GET();
+    int POST(const String& payload);
+    int PUT(const String& payload);
+    String getString();
+    int getSize();
+    static String errorToString(int error);
+};
@@ -0,0 +1,24 @@
+// Declaration-only stand-in for the LiquidCrystal_I2C library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+class LiquidCrystal_I2C : public Print {
+public:
+    LiquidCrystal_I2C(uint8_t address, uint8_t columns, uint8_t rows);
+    void init();
+    void begin(uint8_t columns = 16, uint8_t rows = 2);
+    void clear();
+    void home();
+    void setCursor(uint8_t column, uint8_t row);
+    void backlight();
+    void noBacklight();
+    void display();
+    void noDisplay();
+    void cursor();
+    void noCursor();
+    void blink();
+    void noBlink();
+    void createChar(uint8_t location, uint8_t charmap[]);
+    size_t write(uint8_t value) override;
+};
@@ -0,0 +1,30 @@
+// Declaration-only stand-in for the Arduino SPI library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+#define SPI_MODE0 0x00
+#define SPI_MODE1 0x01
+#define SPI_MODE2 0x02
+#define SPI_MODE3 0x03
+
+class SPISettings {
+public:
+    SPISettings();
+    SPISettings(uint32_t clock, uint8_t bit_order, uint8_t data_mode);
+};
+
+class SPIClass {
+public:
+    void begin();
+    void begin(int8_t sck, int8_t miso, int8_t mosi, int8_t ss = -1);
+    void end();
+    void beginTransaction(SPISettings settings);
+    void endTransaction();
+    uint8_t transfer(uint8_t data);
+    uint16_t transfer16(uint16_t data);
+    void transfer(void* buffer, size_t count);
+    void setFrequency(uint32_t frequency);
+};
+
+extern SPIClass SPI;
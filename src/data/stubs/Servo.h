@@ -0,0 +1,17 @@
+// Declaration-only stand-in for the Arduino Servo library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+class Servo {
+public:
+    Servo();
+    uint8_t attach(int pin);
+    uint8_t attach(int pin, int min_us, int max_us);
+    void detach();
+    void write(int value);
+    void writeMicroseconds(int value);
+    int read();
+    int readMicroseconds();
+    bool attached();
+};
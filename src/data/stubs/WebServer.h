@@ -0,0 +1,27 @@
+// Declaration-only stand-in for the ESP32 WebServer library (compile checks only)
+#pragma once
+
+#include <WiFi.h>
+
+typedef enum { HTTP_ANY, HTTP_GET, HTTP_HEAD, HTTP_POST, HTTP_PUT, HTTP_PATCH, HTTP_DELETE, HTTP_OPTIONS } HTTPMethod;
+
+class WebServer {
+public:
+    typedef void (*THandlerFunction)(void);
+
+    explicit WebServer(int port = 80);
+    void begin();
+    void stop();
+    void handleClient();
+    void on(const String& uri, THandlerFunction handler);
+    void on(const String& uri, HTTPMethod method, THandlerFunction handler);
+    void onNotFound(THandlerFunction handler);
+    void send(int code, const char* content_type = nullptr, const String& content = String(""));
+    void sendHeader(const String& name, const String& value, bool first = false);
+    String arg(const String& name);
+    String arg(int index);
+    bool hasArg(const String& name);
+    int args();
+    String uri();
+    HTTPMethod method();
+};
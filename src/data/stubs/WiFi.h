@@ -0,0 +1,71 @@
+// Declaration-only stand-in for the ESP32 WiFi library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+typedef enum {
+    WL_IDLE_STATUS = 0,
+    WL_NO_SSID_AVAIL = 1,
+    WL_SCAN_COMPLETED = 2,
+    WL_CONNECTED = 3,
+    WL_CONNECT_FAILED = 4,
+    WL_CONNECTION_LOST = 5,
+    WL_DISCONNECTED = 6
+} wl_status_t;
+
+typedef enum { WIFI_OFF = 0, WIFI_STA = 1, WIFI_AP = 2, WIFI_AP_STA = 3 } wifi_mode_t;
+
+class IPAddress {
+public:
+    IPAddress();
+    IPAddress(uint8_t a, uint8_t b, uint8_t c, uint8_t d);
+    String toString() const;
+    uint8_t operator[](int index) const;
+};
+
+class WiFiClient : public Stream {
+public:
+    WiFiClient();
+    int connect(const char* host, uint16_t port);
+    int connect(IPAddress ip, uint16_t port);
+    uint8_t connected();
+    void stop();
+    IPAddress remoteIP() const;
+    explicit operator bool();
+};
+
+class WiFiServer {
+public:
+    explicit WiFiServer(uint16_t port = 80);
+    void begin();
+    WiFiClient available();
+    WiFiClient accept();
+    void stop();
+};
+
+class WiFiClass {
+public:
+    wl_status_t begin(const char* ssid, const char* passphrase = nullptr);
+    wl_status_t begin(const String& ssid, const String& passphrase);
+    wl_status_t status();
+    bool disconnect(bool wifi_off = false);
+    bool reconnect();
+    bool mode(wifi_mode_t mode);
+    bool config(IPAddress local_ip, IPAddress gateway, IPAddress subnet,
+                IPAddress dns1 = IPAddress(), IPAddress dns2 = IPAddress());
+    bool setHostname(const char* hostname);
+    bool setAutoReconnect(bool enabled);
+    bool softAP(const char* ssid, const char* passphrase = nullptr, int channel = 1, int hidden = 0,
+                int max_connections = 4);
+    IPAddress softAPIP();
+    IPAddress localIP();
+    IPAddress gatewayIP();
+    String SSID();
+    String macAddress();
+    int32_t RSSI();
+    int16_t scanNetworks();
+    String SSID(uint8_t index);
+    int32_t RSSI(uint8_t index);
+};
+
+extern WiFiClass WiFi;
@@ -0,0 +1,25 @@
+// Declaration-only stand-in for the Arduino Wire (I2C) library (compile checks only)
+#pragma once
+
+#include <Arduino.h>
+
+class TwoWire : public Stream {
+public:
+    bool begin();
+    bool begin(int sda, int scl, uint32_t frequency = 0);
+    void begin(uint8_t address);
+    void end();
+    void setClock(uint32_t frequency);
+    void beginTransmission(uint8_t address);
+    uint8_t endTransmission(bool send_stop = true);
+    uint8_t requestFrom(uint8_t address, uint8_t quantity, bool send_stop = true);
+    size_t write(uint8_t value) override;
+    size_t write(const uint8_t* data, size_t quantity);
+    int available() override;
+    int read() override;
+    void onReceive(void (*handler)(int));
+    void onRequest(void (*handler)(void));
+};
+
+extern TwoWire Wire;
+extern TwoWire Wire1;
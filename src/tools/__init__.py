@@ -1,23 +1,30 @@
-"""Tools package"""
+"""Tools package
 
-from .base import EmbeddedSystemsTools
-from .embedded_tools import (
-    web_search_tool,
-    component_lookup_tool,
-    pinout_lookup_tool,
-    code_template_tool,
-    code_validator_tool,
-    library_lookup_tool,
-    file_operations_tool
-)
+Exports are resolved on first access so importing one tool does not pull in
+the LangChain/Chroma/HuggingFace stack needed by the others.
+"""
 
-__all__ = [
-    "EmbeddedSystemsTools",
-    "web_search_tool",
-    "component_lookup_tool",
-    "pinout_lookup_tool",
-    "code_template_tool",
-    "code_validator_tool",
-    "library_lookup_tool",
-    "file_operations_tool"
-]
+import importlib
+
+_EXPORTS = {
+    "EmbeddedSystemsTools": ".base",
+    "web_search_tool": ".embedded_tools",
+    "component_lookup_tool": ".embedded_tools",
+    "pinout_lookup_tool": ".embedded_tools",
+    "pin_capability_tool": ".embedded_tools",
+    "code_template_tool": ".embedded_tools",
+    "code_validator_tool": ".embedded_tools",
+    "library_lookup_tool": ".embedded_tools",
+    "library_resolve_tool": ".embedded_tools",
+    "file_operations_tool": ".embedded_tools",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
@@ -1,19 +1,29 @@
 """Base tools class for embedded systems"""
 
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
+from src.tools.index_generations import alias_version, resolve_active_index
 from src.config import (
-    KNOWLEDGE_BASE_DIR, EMBEDDINGS_MODEL, CHROMA_DB_PATH,
-    TEXT_SPLITTER_CHUNK_SIZE, TEXT_SPLITTER_CHUNK_OVERLAP
+    KNOWLEDGE_BASE_DIR, CHROMA_DB_PATH,
+    TEXT_SPLITTER_CHUNK_SIZE, TEXT_SPLITTER_CHUNK_OVERLAP,
+    RETRIEVAL_NEIGHBOR_WINDOW, EMBEDDINGS_DIMENSIONS, EMBEDDINGS_MODELS_DIR, EMBEDDINGS_REDUCTION,
+    PROJECTION_FIT_SAMPLES, KNOWLEDGE_WARMUP_IN_BACKGROUND
 )
 
 
+MANIFEST_FILE = "manifest.json"
+# Shortest shared text treated as splitter overlap when joining neighbor chunks
+MIN_JOIN_OVERLAP = 16
+
+
 class EmbeddedSystemsTools:
     """Collection of tools for embedded systems development"""
 
@@ -68,32 +78,203 @@ class EmbeddedSystemsTools:
         '.idx', '.pack', '.rev'  # Git objects
     }
 
-    def __init__(self, knowledge_base_path: str = None):
+    def __init__(self, knowledge_base_path: str = None, index_path: str = None):
+        """Initialize tools
+        
+        Args:
+            knowledge_base_path: Directory holding knowledge files
+            index_path: Fixed index directory; by default the active generation
+                behind the CHROMA_DB_PATH alias is used and followed across swaps
+        """
         if knowledge_base_path is None:
             knowledge_base_path = str(KNOWLEDGE_BASE_DIR)
             
         self.knowledge_base_path = Path(knowledge_base_path)
         self.knowledge_base_path.mkdir(exist_ok=True)
 
-        # Initialize embeddings and vector store
-        try:
-            self.embeddings = HuggingFaceEmbeddings(model_name=EMBEDDINGS_MODEL)
-            self.vectorstore = Chroma(
-                persist_directory=str(CHROMA_DB_PATH),
-                embedding_function=self.embeddings
-            )
-        except Exception as e:
-            print(f"⚠️ Vector store initialization failed: {e}")
-            self.vectorstore = None
+        # Embeddings and vector store load on first use (see warm_up)
+        self.follow_alias = index_path is None
+        self._alias_version = alias_version(CHROMA_DB_PATH)
+        self._bulk_ingest = False
+        self._load_lock = threading.Lock()
+        self._open_index(Path(index_path) if index_path else resolve_active_index(CHROMA_DB_PATH))
 
         # Text splitter for documents
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=TEXT_SPLITTER_CHUNK_SIZE,
             chunk_overlap=TEXT_SPLITTER_CHUNK_OVERLAP
         )
+
+    def _open_index(self, index_path: Path) -> None:
+        """Point at one index directory; its model and vector store load lazily"""
+        with self._load_lock:
+            self.index_path = index_path
+            
+            # Track ingested files, persisted next to the index
+            self.ingested_files: Dict[str, Dict] = self._load_manifest()
+            
+            self._embeddings = None
+            self._vectorstore = None
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Load the embedding model and vector store once, on first use"""
+        if self._loaded:
+            return
+        
+        with self._load_lock:
+            if self._loaded:
+                return  # Loaded by another thread while waiting
+            try:
+                from langchain_chroma import Chroma
+                
+                self._embeddings = self._create_embeddings(self.index_path)
+                self._vectorstore = Chroma(
+                    persist_directory=str(self.index_path),
+                    embedding_function=self._embeddings
+                )
+                mismatch = self._dimension_mismatch(self._vectorstore, self._embeddings)
+                if mismatch:
+                    print(f"⚠️ {mismatch}; run `python manage.py reindex` to rebuild it")
+                    self._vectorstore = None
+            except Exception as e:
+                print(f"⚠️ Vector store initialization failed: {e}")
+                self._vectorstore = None
+            self._loaded = True
+
+    @staticmethod
+    def _dimension_mismatch(vectorstore, embeddings) -> Optional[str]:
+        """Why stored vectors cannot be searched with the configured embeddings, if they cannot
+        
+        Changing EMBEDDINGS_DIMENSIONS (or the model) leaves the existing
+        collection at its old width, which Chroma only rejects at query time.
+        """
+        stored = vectorstore._collection.get(limit=1, include=["embeddings"])["embeddings"]
+        if stored is None or len(stored) == 0:
+            return None  # Empty index: the first add sets its dimension
+        stored_dims = len(stored[0])
         
-        # Track ingested files
-        self.ingested_files: Dict[str, Dict] = {}
+        expected = getattr(embeddings, "dims", None)
+        if expected is None:
+            expected = len(embeddings.embed_query("dimension check"))
+        if stored_dims != expected:
+            return f"Index stores {stored_dims}-dimension vectors but the embedding config produces {expected}"
+        return None
+
+    @property
+    def embeddings(self):
+        """Embedding model, loaded on first access"""
+        self._ensure_loaded()
+        return self._embeddings
+
+    @property
+    def vectorstore(self):
+        """Chroma vector store, loaded on first access (None if unavailable)"""
+        self._ensure_loaded()
+        return self._vectorstore
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether knowledge search can run without waiting for the model to load"""
+        return self._loaded and self._vectorstore is not None
+
+    def warm_up(self, background: bool = KNOWLEDGE_WARMUP_IN_BACKGROUND) -> Optional[threading.Thread]:
+        """Load the embedding model and vector store ahead of the first search
+        
+        Args:
+            background: Load in a daemon thread and return immediately
+            
+        Returns:
+            The warm-up thread when running in the background
+        """
+        if not background:
+            self._ensure_loaded()
+            return None
+        
+        thread = threading.Thread(target=self._ensure_loaded, name="knowledge-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """Load the ingestion manifest of the current index, if any"""
+        manifest_path = self.index_path / MANIFEST_FILE
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_manifest(self) -> None:
+        """Persist the ingestion manifest next to the index"""
+        self.index_path.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.index_path / MANIFEST_FILE
+        tmp_path = manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.ingested_files, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+    @contextmanager
+    def bulk_ingest(self):
+        """Write the manifest once when the block ends instead of after every added file"""
+        self._bulk_ingest = True
+        try:
+            yield
+        finally:
+            self._bulk_ingest = False
+            if self.vectorstore:
+                self.save_manifest()
+
+    def _sync_active_index(self) -> None:
+        """Reopen the vector store if a rebuild swapped the active generation"""
+        if not self.follow_alias:
+            return
+        
+        version = alias_version(CHROMA_DB_PATH)
+        if version != self._alias_version:
+            self._alias_version = version
+            self._open_index(resolve_active_index(CHROMA_DB_PATH))
+
+    @staticmethod
+    def _create_embeddings(index_path: Path):
+        """The process-wide embeddings (service or local model), shared across index generations
+        
+        When EMBEDDINGS_DIMENSIONS is set, the model is wrapped with the
+        projection persisted next to the index in index_path.
+        """
+        from src.tools.embeddings import get_shared_embeddings
+
+        embeddings = get_shared_embeddings()
+
+        if EMBEDDINGS_DIMENSIONS:
+            from src.tools.dim_reduction import ReducedEmbeddings, PROJECTION_FILE
+
+            embeddings = ReducedEmbeddings(
+                embeddings, EMBEDDINGS_REDUCTION, EMBEDDINGS_DIMENSIONS, index_path / PROJECTION_FILE
+            )
+        return embeddings
+
+    def _ensure_projection(self, sample_texts: List[str]) -> bool:
+        """Fit the reduced-dimension projection on sample chunks if it is still missing
+        
+        Returns:
+            True if documents can be embedded
+        """
+        if not getattr(self.embeddings, "is_fitted", True):
+            if len(sample_texts) < self.embeddings.dims:
+                return False
+            self.embeddings.fit(sample_texts[:PROJECTION_FIT_SAMPLES])
+        return True
+
+    def _sample_chunks(self, files: List[Path], limit: int = PROJECTION_FIT_SAMPLES) -> List[str]:
+        """Collect chunk texts from files, in order, until limit chunks are gathered"""
+        texts = []
+        for file_path in files:
+            documents = self._load_file(file_path)
+            if documents:
+                texts.extend(doc.page_content for doc in self.text_splitter.split_documents(documents))
+            if len(texts) >= limit:
+                break
+        return texts[:limit]
 
     async def add_knowledge(self, file_path: str) -> Tuple[bool, str]:
         """Add documents to the knowledge base with source tracking
@@ -131,7 +312,8 @@ class EmbeddedSystemsTools:
             if not texts:
                 return False, f"No text chunks created from {file_path.name}"
             
-            # Add source information to metadata
+            # Add source information and neighbor links to metadata
+            ids = self._link_chunks(texts, file_path)
             for doc in texts:
                 doc.metadata['source_file'] = str(file_path.name)
                 doc.metadata['source_path'] = str(file_path)
@@ -139,8 +321,13 @@ class EmbeddedSystemsTools:
                 doc.metadata['chunk_size'] = len(doc.page_content)
 
             # Add to vector store
+            self._sync_active_index()
             if self.vectorstore:
-                self.vectorstore.add_documents(texts)
+                if not self._ensure_projection([doc.page_content for doc in texts]):
+                    return False, "Embedding projection not fitted yet; run a bulk ingest first"
+                
+                self._drop_stale_chunks(ids)
+                self.vectorstore.add_documents(texts, ids=ids)
                 
                 # Track the ingested file
                 self.ingested_files[str(file_path.name)] = {
@@ -149,6 +336,8 @@ class EmbeddedSystemsTools:
                     'chunks': len(texts),
                     'size': file_path.stat().st_size
                 }
+                if not self._bulk_ingest:
+                    self.save_manifest()
                 
                 message = f"✅ Added {len(texts)} chunks from {file_path.name} ({self.SUPPORTED_EXTENSIONS[file_ext]})"
                 return True, message
@@ -158,6 +347,68 @@ class EmbeddedSystemsTools:
         except Exception as e:
             return False, f"Error: {str(e)[:100]}"
 
+    @staticmethod
+    def _chunk_id(file_key: str, index: int) -> str:
+        """Build the stable vector store ID of a chunk"""
+        return f"{file_key}:{index}"
+
+    def _link_chunks(self, texts: List[Document], file_path: Path) -> List[str]:
+        """Record chunk ordinal and neighbor IDs so context can be expanded by ID
+        
+        Args:
+            texts: Chunks of one file, in document order
+            file_path: File the chunks were split from
+            
+        Returns:
+            List of chunk IDs matching the order of texts
+        """
+        file_key = hashlib.sha1(str(file_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        count = len(texts)
+        ids = [self._chunk_id(file_key, i) for i in range(count)]
+
+        for i, doc in enumerate(texts):
+            # Chroma metadata values cannot be None, so missing links are empty strings
+            doc.metadata['chunk_id'] = ids[i]
+            doc.metadata['chunk_index'] = i
+            doc.metadata['chunk_count'] = count
+            doc.metadata['prev_chunk_id'] = ids[i - 1] if i > 0 else ""
+            doc.metadata['next_chunk_id'] = ids[i + 1] if i < count - 1 else ""
+
+        return ids
+
+    def _drop_stale_chunks(self, ids: List[str]) -> None:
+        """Delete chunks left over from a longer earlier version of the same file
+        
+        Chunk IDs are positional, so re-ingesting a file that shrank overwrites
+        only the first len(ids) chunks; the tail would otherwise stay searchable.
+        
+        Args:
+            ids: New chunk IDs of the file, as returned by _link_chunks
+        """
+        file_key = ids[0].rsplit(":", 1)[0]
+        previous = self._chunk_counts([file_key]).get(file_key, 0)
+        if previous > len(ids):
+            self.vectorstore.delete(ids=[self._chunk_id(file_key, i) for i in range(len(ids), previous)])
+
+    def _chunk_counts(self, file_keys: List[str]) -> Dict[str, int]:
+        """Look up the stored chunk count of each file from its first chunk
+        
+        The first chunk is rewritten on every ingest, so its count is current
+        even when other chunks of the file still carry an older one.
+        
+        Args:
+            file_keys: File keys from chunk IDs
+            
+        Returns:
+            Mapping of file key to chunk count, for files that are in the index
+        """
+        fetched = self.vectorstore.get(ids=[self._chunk_id(key, 0) for key in file_keys], include=["metadatas"])
+        counts = {}
+        for chunk_id, metadata in zip(fetched.get("ids", []), fetched.get("metadatas", [])):
+            if metadata and metadata.get("chunk_count") is not None:
+                counts[chunk_id.rsplit(":", 1)[0]] = int(metadata["chunk_count"])
+        return counts
+
     def _load_file(self, file_path: Path) -> Optional[List[Document]]:
         """Load file based on its extension with comprehensive support"""
         import sys
@@ -190,6 +441,8 @@ class EmbeddedSystemsTools:
                     sys.stdout = io.StringIO()
                     
                     try:
+                        from langchain_community.document_loaders import PyPDFLoader
+                        
                         loader = PyPDFLoader(str(file_path))
                         docs = loader.load()
                     finally:
@@ -236,19 +489,25 @@ class EmbeddedSystemsTools:
         except Exception as e:
             return None  # Silent fail for unreadable files
 
-    def search_knowledge(self, query: str, k: int = 3) -> List[Dict]:
+    def search_knowledge(self, query: str, k: int = 3, neighbors: int = None) -> List[Dict]:
         """Search the knowledge base with source references
         
         Args:
             query: Search query
             k: Number of results
+            neighbors: Adjacent chunks to add on each side of a hit
+                (defaults to RETRIEVAL_NEIGHBOR_WINDOW)
             
         Returns:
             List of results with content and source information
         """
+        self._sync_active_index()
         if not self.vectorstore:
             return [{"content": "Knowledge base not available", "source": "N/A"}]
         
+        if neighbors is None:
+            neighbors = RETRIEVAL_NEIGHBOR_WINDOW
+        
         try:
             # Search with metadata
             docs = self.vectorstore.similarity_search_with_score(query, k=k)
@@ -261,15 +520,95 @@ class EmbeddedSystemsTools:
                     "file_type": doc.metadata.get('file_type', 'Unknown'),
                     "source_path": doc.metadata.get('source_path', 'N/A'),
                     "relevance_score": f"{(1 - score):.2%}",  # Convert distance to similarity %
-                    "chunk_size": doc.metadata.get('chunk_size', 'N/A')
+                    "chunk_size": doc.metadata.get('chunk_size', 'N/A'),
+                    "chunk_id": doc.metadata.get('chunk_id', ''),
+                    "chunk_index": doc.metadata.get('chunk_index')
                 }
                 results.append(result)
             
+            if neighbors > 0:
+                self._expand_neighbors(results, neighbors)
+            
             return results
             
         except Exception as e:
             return [{"content": f"Knowledge search error: {str(e)}", "source": "N/A"}]
+
+    def _expand_neighbors(self, results: List[Dict], window: int) -> None:
+        """Attach adjacent chunks to each hit, fetched by ID in a single lookup
+        
+        Adds a "context" entry with the hit and its neighbors joined in
+        document order, plus the "context_chunk_ids" that were used.
+        
+        Args:
+            results: Results from search_knowledge, updated in place
+            window: Number of chunks to add on each side of a hit
+        """
+        hits = []
+        for idx, result in enumerate(results):
+            chunk_id = result.get("chunk_id")
+            index = result.get("chunk_index")
+            if not chunk_id or index is None:
+                continue  # Ingested before neighbor links were recorded
+            hits.append((idx, chunk_id.rsplit(":", 1)[0], index))
+        
+        if not hits:
+            return
+        
+        counts = self._chunk_counts(sorted({file_key for _, file_key, _ in hits}))
+        wanted: Dict[int, List[str]] = {}
+        for idx, file_key, index in hits:
+            # Clip to the file as it is now, not as it was when the hit was written
+            count = counts.get(file_key, index + 1)
+            if index >= count:
+                continue
+            start = max(0, index - window)
+            end = min(count, index + window + 1)
+            wanted[idx] = [self._chunk_id(file_key, i) for i in range(start, end)]
+        
+        if not wanted:
+            return
+        
+        lookup_ids = sorted({cid for ids in wanted.values() for cid in ids})
+        fetched = self.vectorstore.get(ids=lookup_ids, include=["documents"])
+        chunks = dict(zip(fetched.get("ids", []), fetched.get("documents", [])))
+        
+        for idx, ids in wanted.items():
+            present = [cid for cid in ids if cid in chunks]
+            results[idx]["context_chunk_ids"] = present
+            context = ""
+            for cid in present:
+                context = self._join_overlapping(context, chunks[cid])
+            results[idx]["context"] = context
     
+    @staticmethod
+    def _join_overlapping(head: str, tail: str) -> str:
+        """Append a chunk to the text before it, dropping the overlap they share
+        
+        Args:
+            head: Text joined so far
+            tail: Next chunk in document order
+            
+        Returns:
+            Joined text, with the splitter overlap included only once
+        """
+        if not head:
+            return tail
+        # Very short matches are more likely coincidence than splitter overlap
+        for size in range(min(TEXT_SPLITTER_CHUNK_OVERLAP, len(head), len(tail)), MIN_JOIN_OVERLAP - 1, -1):
+            if head.endswith(tail[:size]):
+                return head + tail[size:]
+        return head + "\n" + tail
+    
+    @staticmethod
+    def _is_internal_path(file_path: Path) -> bool:
+        """Check whether a file belongs to the index or model store rather than the knowledge"""
+        resolved = file_path.resolve()
+        return any(
+            internal in resolved.parents
+            for internal in (CHROMA_DB_PATH.resolve(), EMBEDDINGS_MODELS_DIR.resolve())
+        )
+
     def get_ingested_files(self) -> List[Dict]:
         """Get list of ingested files with statistics"""
         return list(self.ingested_files.values())
@@ -307,7 +646,7 @@ class EmbeddedSystemsTools:
         
         all_files = []
         for file_path in dir_path.glob(file_pattern):
-            if not file_path.is_file():
+            if not file_path.is_file() or self._is_internal_path(file_path):
                 continue
             
             file_ext = file_path.suffix.lower()
@@ -330,27 +669,34 @@ class EmbeddedSystemsTools:
         if total_files == 0:
             return 0, 0, ["No supported files found in directory"]
         
-        for idx, file_path in enumerate(all_files, 1):
-            # Avoid processing same file twice
-            file_id = str(file_path.resolve())
-            if file_id in processed_files:
-                continue
-            processed_files.add(file_id)
-            
-            # Show progress every 50 files
-            if idx % 50 == 0 or idx == total_files:
-                print(f"  Processing {idx}/{total_files}...", end='\r')
-            
-            # Ingest the file
-            success, message = await self.add_knowledge(str(file_path))
-            
-            if success:
-                success_count += 1
-            else:
-                fail_count += 1
-                # Only keep track of real errors, not "no content" messages
-                if "No content extracted" not in message and "Binary file skipped" not in message:
-                    errors.append(f"{file_path.name}: {message}")
+        # Reduced-dimension indexes fit their projection on the corpus before the first add
+        if self.vectorstore and not getattr(self.embeddings, "is_fitted", True):
+            if not self._ensure_projection(self._sample_chunks(all_files)):
+                return 0, total_files, ["Not enough chunks to fit the embedding projection"]
+        
+        # Write the manifest once at the end instead of after every file
+        with self.bulk_ingest():
+            for idx, file_path in enumerate(all_files, 1):
+                # Avoid processing same file twice
+                file_id = str(file_path.resolve())
+                if file_id in processed_files:
+                    continue
+                processed_files.add(file_id)
+                
+                # Show progress every 50 files
+                if idx % 50 == 0 or idx == total_files:
+                    print(f"  Processing {idx}/{total_files}...", end='\r')
+                
+                # Ingest the file
+                success, message = await self.add_knowledge(str(file_path))
+                
+                if success:
+                    success_count += 1
+                else:
+                    fail_count += 1
+                    # Only keep track of real errors, not "no content" messages
+                    if "No content extracted" not in message and "Binary file skipped" not in message:
+                        errors.append(f"{file_path.name}: {message}")
         
         print()  # New line after progress
         return success_count, fail_count, errors
@@ -384,7 +730,7 @@ class EmbeddedSystemsTools:
             file_pattern = "*"
         
         for file_path in dir_path.glob(file_pattern):
-            if not file_path.is_file():
+            if not file_path.is_file() or self._is_internal_path(file_path):
                 continue
             
             file_ext = file_path.suffix.lower()
@@ -0,0 +1,132 @@
+"""Code validation for generated sketches and scripts, single or in bulk"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.tools.cpp_rules import CPP_PLATFORMS, lint
+
+# Platform a file is validated for when none is given
+PLATFORM_BY_SUFFIX = {
+    ".ino": "arduino",
+    ".pde": "arduino",
+    ".cpp": "arduino",
+    ".cc": "arduino",
+    ".c": "arduino",
+    ".h": "arduino",
+    ".hpp": "arduino",
+    ".py": "raspberry_pi",
+}
+
+_RESULT_KEYS = {"error": "errors", "warning": "warnings", "suggestion": "suggestions"}
+
+
+def format_finding(item: Dict) -> str:
+    if item["line"] is None:
+        return item["message"]
+    return f"Line {item['line']}, col {item['column']}: {item['message']}"
+
+
+def _add_findings(result: Dict, findings: List[Dict]) -> None:
+    for item in findings:
+        result["issues"].append(item)
+        result[_RESULT_KEYS[item["severity"]]].append(format_finding(item))
+    result["success"] = not result["errors"]
+
+
+def _add_compile_check(result: Dict, check: Dict) -> None:
+    if not check["available"]:
+        result["suggestions"].append(f"Compile check skipped: {check['error']}")
+        return
+    result["compiled"] = True
+    _add_findings(result, check["findings"])
+
+
+def validate_code(code: str, platform: str, filename: Optional[str] = None, compile_check: bool = False) -> Dict:
+    """Validate one source for a platform
+
+    Args:
+        code: Source code
+        platform: arduino, esp32 or raspberry_pi
+        filename: Source file name, when validating a file
+        compile_check: Also syntax-check Arduino/ESP32 code with the host C++ compiler
+
+    Returns:
+        Dict with "success", "errors", "warnings" and "suggestions" (messages
+        prefixed with their line and column) and "issues" (structured findings)
+    """
+    platform = platform.lower()
+    if platform in CPP_PLATFORMS:
+        findings = lint(code, platform, filename)
+    elif platform == "raspberry_pi":
+        from src.tools.python_rules import lint_python
+
+        findings = lint_python(code)
+    else:
+        return {"success": False, "error": f"Platform '{platform}' not supported for validation"}
+
+    result = {"success": True, "warnings": [], "errors": [], "suggestions": [], "issues": []}
+    _add_findings(result, findings)
+    if compile_check and platform in CPP_PLATFORMS:
+        from src.tools.compile_check import compile_source, is_compiled
+
+        if is_compiled(filename):
+            _add_compile_check(result, compile_source(code, platform, filename))
+    return result
+
+
+def expand_paths(paths: Iterable[str]) -> List[Path]:
+    """Files to validate; directories contribute every file with a known suffix"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in PLATFORM_BY_SUFFIX))
+        else:
+            files.append(path)
+    return files
+
+
+def validate_files(paths: Iterable[str], platform: Optional[str] = None, compile_check: bool = False) -> Dict:
+    """Validate many files
+
+    Args:
+        paths: Files or directories
+        platform: Platform for every file; by default inferred from each file's suffix
+        compile_check: Also syntax-check Arduino/ESP32 files, in parallel
+
+    Returns:
+        Dict with "success", per-file results under "files" and a "summary"
+        of files, errors and warnings
+    """
+    files = {}
+    compile_jobs = []  # (path, code, platform)
+    for path in expand_paths(paths):
+        file_platform = platform or PLATFORM_BY_SUFFIX.get(path.suffix.lower())
+        if file_platform is None:
+            result = {"success": False, "error": f"Unknown file type '{path.suffix}'; pass a platform"}
+        else:
+            try:
+                code = path.read_text(encoding="utf-8", errors="replace")
+            except OSError as e:
+                result = {"success": False, "error": f"Cannot read file: {e}"}
+            else:
+                result = validate_code(code, file_platform, filename=path.name)
+                if compile_check and file_platform.lower() in CPP_PLATFORMS:
+                    compile_jobs.append((path, code, file_platform.lower()))
+        files[str(path)] = result
+
+    if compile_jobs:
+        from src.tools.compile_check import compile_sources, is_compiled
+
+        compile_jobs = [job for job in compile_jobs if is_compiled(job[0].name)]
+        checks = compile_sources([(code, file_platform, path.name, str(path.parent))
+                                  for path, code, file_platform in compile_jobs])
+        for (path, _, _), check in zip(compile_jobs, checks):
+            _add_compile_check(files[str(path)], check)
+
+    summary = {"files": 0, "errors": 0, "warnings": 0}
+    for result in files.values():
+        summary["files"] += 1
+        summary["errors"] += len(result.get("errors", [])) + ("error" in result)
+        summary["warnings"] += len(result.get("warnings", []))
+
+    return {"success": all(result["success"] for result in files.values()), "files": files, "summary": summary}
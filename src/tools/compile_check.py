@@ -0,0 +1,239 @@
+"""Syntax-only compile checks of Arduino/ESP32 code with the host C++ compiler
+
+Sources are compiled with `-fsyntax-only` against the declaration-only stub
+headers in src/data/stubs (Arduino.h, WiFi.h, DHT.h, ...), so real type and
+syntax errors are caught offline without a board toolchain. Sketches get
+the same treatment as in the Arduino IDE: Arduino.h is included and
+prototypes of the sketch's functions are declared before the first one.
+
+Results are cached on disk by a hash of the code, platform, compiler
+version and stub headers. Batches of uncached sources run in a process pool.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.config import COMPILE_CHECK_COMPILER, COMPILE_CHECK_WORKERS, COMPILE_CHECK_TIMEOUT, COMPILE_CACHE_DIR
+from src.tools.cpp_rules import Sketch
+
+STUBS_DIR = Path(__file__).resolve().parent.parent / "data" / "stubs"
+
+# Suffixes compiled as a translation unit; headers are checked through them
+COMPILED_SUFFIXES = (".ino", ".pde", ".cpp", ".cc", ".cxx")
+SKETCH_SUFFIXES = (".ino", ".pde")
+
+PLATFORM_DEFINES = {
+    "arduino": ["-DARDUINO=10819", "-DARDUINO_ARCH_AVR", "-DARDUINO_AVR_UNO"],
+    "esp32": ["-DARDUINO=10819", "-DARDUINO_ARCH_ESP32", "-DESP32"],
+}
+
+_DIAGNOSTIC_RE = re.compile(
+    r"^(?P<file>[^:\n]+):(?P<line>\d+):(?P<column>\d+): (?P<severity>fatal error|error|warning): (?P<message>.*)$",
+    re.MULTILINE
+)
+_MISSING_HEADER_RE = re.compile(r"^(?P<header>\S+): No such file or directory")
+
+# (code, platform, filename or None, include directory or None)
+CompileSource = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def find_compiler(name: str = COMPILE_CHECK_COMPILER) -> Optional[str]:
+    """Path of the configured compiler, falling back to g++ and clang++"""
+    for candidate in (name, "g++", "clang++"):
+        path = shutil.which(candidate)
+        if path:
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def _compiler_version(compiler: str) -> str:
+    result = subprocess.run([compiler, "--version"], capture_output=True, text=True, timeout=10)
+    return result.stdout.splitlines()[0] if result.stdout else compiler
+
+
+@lru_cache(maxsize=1)
+def _stubs_digest() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(STUBS_DIR.glob("*.h")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _headers_digest(directory: Optional[str]) -> str:
+    """Local headers a source may include change its result too"""
+    if not directory:
+        return ""
+    digest = hashlib.sha256()
+    for path in sorted(Path(directory).glob("*.h*")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def is_compiled(filename: Optional[str]) -> bool:
+    return filename is None or filename.lower().endswith(COMPILED_SUFFIXES)
+
+
+def prepare_source(code: str, platform: str, filename: Optional[str] = None) -> Tuple[str, str]:
+    """Translation unit and the file name diagnostics should report
+
+    Sketches get `#include <Arduino.h>` and prototypes of their functions,
+    with #line directives so diagnostics keep the sketch's line numbers.
+    """
+    name = filename or "sketch.ino"
+    if not name.lower().endswith(SKETCH_SUFFIXES):
+        return f'#line 1 "{name}"\n{code}', name
+
+    sketch = Sketch(code, platform, name)
+    header = f'#include <Arduino.h>\n#line 1 "{name}"\n'
+    if not sketch.prototypes:
+        return header + code, name
+    line = sketch.first_definition_line
+    split = sketch.lines[line - 1][0]
+    prototypes = "\n".join(sketch.prototypes)
+    return f'{header}{code[:split]}{prototypes}\n#line {line} "{name}"\n{code[split:]}', name
+
+
+def _run_compiler(compiler: str, code: str, platform: str, filename: Optional[str],
+                  include_dir: Optional[str], timeout: float) -> List[Dict]:
+    """Compile one source and return findings in it (runs in the process pool)"""
+    source, name = prepare_source(code, platform, filename)
+    error_limit = "-ferror-limit=20" if "clang" in Path(compiler).name else "-fmax-errors=20"
+    with tempfile.TemporaryDirectory(prefix="compile-check-") as tmp:
+        path = Path(tmp) / "check.cpp"
+        path.write_text(source, encoding="utf-8")
+        command = [compiler, "-fsyntax-only", "-std=gnu++17", "-x", "c++", error_limit,
+                   "-fdiagnostics-color=never", "-I", str(STUBS_DIR)]
+        if include_dir:
+            command += ["-I", include_dir]
+        command += PLATFORM_DEFINES.get(platform, []) + [str(path)]
+        try:
+            # C locale keeps diagnostics in plain ASCII quotes
+            result = subprocess.run(command, capture_output=True, text=True, timeout=timeout,
+                                    env=dict(os.environ, LC_ALL="C"))
+        except subprocess.TimeoutExpired:
+            return [{"rule": "compile-timeout", "severity": "warning", "message": f"Compile check timed out after {timeout}s",
+                     "line": None, "column": None}]
+
+    findings = []
+    for match in _DIAGNOSTIC_RE.finditer(result.stderr):
+        if Path(match.group("file")).name != name:
+            continue  # Notes and follow-ups inside the stub headers
+        message, severity = match.group("message"), match.group("severity")
+        missing = _MISSING_HEADER_RE.match(message)
+        if missing:
+            message = f"No stub header for {missing.group('header')}; the compile check stopped here"
+            severity = "warning"
+        findings.append({"rule": "compiler", "severity": "warning" if severity == "warning" else "error",
+                         "message": message, "line": int(match.group("line")), "column": int(match.group("column"))})
+
+    if result.returncode != 0 and not any(f["severity"] == "error" or f["message"].startswith("No stub") for f in findings):
+        first_line = result.stderr.strip().splitlines()[0] if result.stderr.strip() else "unknown error"
+        findings.append({"rule": "compiler", "severity": "error", "message": f"Compiler failed: {first_line}",
+                         "line": None, "column": None})
+    return findings
+
+
+class CompileCache:
+    """Compile findings on disk, one JSON file per source hash"""
+
+    def __init__(self, cache_dir: Path = COMPILE_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, findings: List[Dict]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(findings, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # A failed cache write only costs a recompile next time
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_compile_pool() -> ProcessPoolExecutor:
+    """Process-wide compile pool, started on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=COMPILE_CHECK_WORKERS)
+    return _pool
+
+
+def compile_sources(sources: Sequence[CompileSource], cache: CompileCache = None,
+                    timeout: float = COMPILE_CHECK_TIMEOUT) -> List[Dict]:
+    """Syntax-check sources, cached ones from disk and the rest in parallel
+
+    Returns:
+        One dict per source, in order: "available" (False when no compiler
+        is installed), "cached" and "findings"
+    """
+    compiler = find_compiler()
+    if compiler is None:
+        return [{"available": False, "cached": False, "findings": [],
+                 "error": "No C++ compiler found; install g++ or set CXX"} for _ in sources]
+
+    cache = cache or CompileCache()
+    version = _compiler_version(compiler)
+    results: List[Optional[Dict]] = []
+    misses = []
+    for index, (code, platform, filename, include_dir) in enumerate(sources):
+        kind = "sketch" if (filename or ".ino").lower().endswith(SKETCH_SUFFIXES) else Path(filename).name
+        key = hashlib.sha256("\0".join([
+            version, _stubs_digest(), platform, kind, include_dir or "", _headers_digest(include_dir), code
+        ]).encode("utf-8")).hexdigest()
+        findings = cache.get(key)
+        if findings is None:
+            misses.append((index, key))
+            results.append(None)
+        else:
+            results.append({"available": True, "cached": True, "findings": findings})
+
+    if len(misses) == 1:
+        index, _ = misses[0]
+        computed = [_run_compiler(compiler, *sources[index], timeout)]
+    elif misses:
+        pool = get_compile_pool()
+        futures = [pool.submit(_run_compiler, compiler, *sources[index], timeout) for index, _ in misses]
+        computed = [future.result() for future in futures]
+    else:
+        computed = []
+
+    for (index, key), findings in zip(misses, computed):
+        if not any(f["rule"] == "compile-timeout" for f in findings):
+            cache.set(key, findings)
+        results[index] = {"available": True, "cached": False, "findings": findings}
+    return results
+
+
+def compile_source(code: str, platform: str, filename: Optional[str] = None,
+                   include_dir: Optional[str] = None) -> Dict:
+    """Syntax-check one source; see compile_sources"""
+    return compile_sources([(code, platform, filename, include_dir)])[0]
@@ -0,0 +1,267 @@
+"""Single-pass C/C++ lexer and rule engine for Arduino/ESP32 sketches
+
+The sketch is tokenized once; comments and string contents never reach the
+rules, so "setup()" in a comment does not count as a setup function. One
+more pass over the tokens collects facts (includes, top-level function
+definitions, member uses, calls, bracket balance), and each rule only reads
+those facts. Adding rules therefore keeps validation linear in code size.
+
+Rules are registered with @rule and return findings:
+{"rule", "severity" ("error" | "warning" | "suggestion"), "message", "line", "column"}
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+CPP_PLATFORMS = ("arduino", "esp32")
+
+MAX_LINE_LENGTH = 120
+
+_TOKEN_RE = re.compile(r"""
+    (?P<newline>\n)
+  | (?P<space>[ \t\r\f\v]+|\\\n)
+  | (?P<comment>//(?:[^\n\\]|\\[\s\S])*|/\*[\s\S]*?\*/)
+  | (?P<open_comment>/\*)
+  | (?P<directive>\#(?:[^\n\\]|\\[\s\S])*)
+  | (?P<raw_string>(?:u8|u|U|L)?R"(?P<delim>[^()\\\s]{0,16})\([\s\S]*?\)(?P=delim)")
+  | (?P<string>(?:u8|u|U|L)?"(?:[^"\\\n]|\\[\s\S])*")
+  | (?P<char>(?:u8|u|U|L)?'(?:[^'\\\n]|\\[\s\S])*')
+  | (?P<open_string>(?:u8|u|U|L)?["'][^\n]*)
+  | (?P<identifier>[A-Za-z_]\w*)
+  | (?P<number>\.?\d(?:[eEpP][+-]|[\w.'])*)
+  | (?P<punct>::|->|\+\+|--|<<=|>>=|<<|>>|<=|>=|==|!=|&&|\|\||[-+*/%&|^]=|[\s\S])
+""", re.VERBOSE)
+
+_INCLUDE_RE = re.compile(r"#\s*include\s*[<\"]([^>\"]+)[>\"]")
+
+_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+_CLOSING = {close: open_ for open_, close in _BRACKETS.items()}
+
+# Tokens allowed between a parameter list and the body of a definition
+_DEFINITION_QUALIFIERS = {"const", "override", "final", "noexcept", "volatile", "IRAM_ATTR"}
+
+
+class Token(NamedTuple):
+    kind: str  # identifier, number, string, char, punct or directive
+    text: str
+    line: int
+    column: int
+
+
+def finding(rule_name: str, severity: str, message: str, token: Optional[Token] = None,
+            line: Optional[int] = None, column: Optional[int] = None) -> Dict:
+    if token is not None:
+        line, column = token.line, token.column
+    return {"rule": rule_name, "severity": severity, "message": message, "line": line, "column": column}
+
+
+def tokenize(code: str) -> Tuple[List[Token], List[Tuple[int, int]], List[Dict]]:
+    """Tokenize C/C++ source in one pass
+
+    Returns:
+        Tokens without whitespace and comments, the (start, end) offsets of
+        every line, and findings for unterminated comments and strings
+    """
+    tokens: List[Token] = []
+    lines: List[Tuple[int, int]] = []
+    problems: List[Dict] = []
+    line, line_start = 1, 0
+
+    for match in _TOKEN_RE.finditer(code):
+        kind, start, end = match.lastgroup, match.start(), match.end()
+        column = start - line_start + 1
+
+        if kind == "open_comment":
+            problems.append(finding("syntax", "error", "Unterminated /* comment", line=line, column=column))
+            end = len(code)
+        elif kind == "open_string":
+            problems.append(finding("syntax", "error", "Unterminated string or character literal",
+                                    line=line, column=column))
+        elif kind not in ("newline", "space", "comment"):
+            text = match.group(0)
+            if kind == "raw_string":
+                kind = "string"
+            tokens.append(Token(kind, text.strip() if kind == "directive" else text, line, column))
+
+        if kind in ("newline", "space", "comment", "directive", "string", "open_comment"):
+            newline = code.find("\n", start, end)
+            while newline != -1:
+                lines.append((line_start, newline))
+                line, line_start = line + 1, newline + 1
+                newline = code.find("\n", line_start, end)
+        if kind == "open_comment":
+            break
+
+    lines.append((line_start, len(code)))
+    return tokens, lines, problems
+
+
+class Sketch:
+    """Facts about one C/C++ source collected in a single pass over its tokens"""
+
+    def __init__(self, code: str, platform: str, filename: Optional[str] = None):
+        self.code = code
+        self.platform = platform.lower()
+        self.filename = filename
+        # Headers and helper files have no setup()/loop() of their own
+        self.is_sketch = filename is None or filename.lower().endswith((".ino", ".pde"))
+        self.tokens, self.lines, self.problems = tokenize(code)
+
+        self.includes: Dict[str, Token] = {}
+        self.definitions: Dict[str, Token] = {}  # Top-level function name -> name token
+        self.members: Dict[str, Token] = {}  # "Serial" and "Serial.begin" -> first use
+        self.calls: Dict[str, Token] = {}  # Called function name -> first call
+        self.prototypes: List[str] = []  # Declarations of top-level functions, as the Arduino builder adds
+        self.first_definition_line: Optional[int] = None
+        self.bracket_errors: List[Dict] = []
+        self._collect()
+
+    def _collect(self) -> None:
+        tokens = self.tokens
+        stack: List[Token] = []
+        candidate: Optional[Token] = None  # Identifier before a top-level "("
+        params_of: Optional[Token] = None  # Set after its ")" until "{" or another token
+        params_end = 0
+        statement_start = 0  # First token of the current top-level declaration
+
+        for i, token in enumerate(tokens):
+            text = token.text
+            following = tokens[i + 1].text if i + 1 < len(tokens) else ""
+
+            if token.kind == "directive":
+                include = _INCLUDE_RE.match(text)
+                if include:
+                    self.includes.setdefault(include.group(1).strip(), token)
+                if not stack:
+                    statement_start = i + 1
+                continue
+
+            if params_of is not None:
+                if text == "{":
+                    self._add_definition(params_of, tokens[statement_start:params_end + 1])
+                if text not in _DEFINITION_QUALIFIERS:
+                    params_of = None
+
+            if token.kind == "identifier":
+                if following in (".", "->", "::") and i + 2 < len(tokens):
+                    self.members.setdefault(text, token)
+                    self.members.setdefault(f"{text}.{tokens[i + 2].text}", token)
+                if following == "(":
+                    self.calls.setdefault(text, token)
+                    if not stack:
+                        candidate = token
+
+            if text in _BRACKETS:
+                stack.append(token)
+            elif text in _CLOSING:
+                if not stack or stack[-1].text != _CLOSING[text]:
+                    expected = f"'{_BRACKETS[stack[-1].text]}'" if stack else "nothing"
+                    self.bracket_errors.append(finding(
+                        "brackets", "error", f"Unexpected '{text}' (expected {expected})", token))
+                    continue
+                stack.pop()
+                if text == ")" and not stack and candidate is not None:
+                    params_of, params_end, candidate = candidate, i, None
+                elif text == "}" and not stack:
+                    statement_start = i + 1
+            elif text == ";" and not stack:
+                statement_start = i + 1
+
+        for token in stack:
+            self.bracket_errors.append(finding("brackets", "error", f"Unclosed '{token.text}'", token))
+
+    def _add_definition(self, name: Token, declaration: List[Token]) -> None:
+        if name.text in self.definitions:
+            return
+        self.definitions[name.text] = name
+        if self.first_definition_line is None:
+            self.first_definition_line = declaration[0].line
+        # Methods defined outside their class are already declared in it, and
+        # repeating default arguments in a second declaration is an error
+        if not any(token.text in ("::", "=") for token in declaration):
+            self.prototypes.append(" ".join(token.text for token in declaration) + ";")
+
+    def includes_header(self, *names: str) -> bool:
+        return any(header.rsplit("/", 1)[-1] in names for header in self.includes)
+
+
+RuleFunction = Callable[[Sketch], Iterable[Dict]]
+
+
+class Rule(NamedTuple):
+    name: str
+    platforms: Tuple[str, ...]
+    check: RuleFunction
+
+
+RULES: List[Rule] = []
+
+
+def rule(name: str, platforms: Tuple[str, ...] = CPP_PLATFORMS) -> Callable[[RuleFunction], RuleFunction]:
+    """Register a rule for the given platforms"""
+    def register(check: RuleFunction) -> RuleFunction:
+        RULES.append(Rule(name, tuple(platforms), check))
+        return check
+    return register
+
+
+@rule("syntax")
+def _syntax(sketch: Sketch) -> Iterable[Dict]:
+    return sketch.problems + sketch.bracket_errors
+
+
+@rule("entry-points")
+def _entry_points(sketch: Sketch) -> Iterable[Dict]:
+    if not sketch.is_sketch:
+        return []
+    return [
+        finding("entry-points", "error", f"Missing required {name}() function")
+        for name in ("setup", "loop") if name not in sketch.definitions
+    ]
+
+
+@rule("serial-include")
+def _serial_include(sketch: Sketch) -> Iterable[Dict]:
+    use = sketch.members.get("Serial.begin")
+    if use and not sketch.includes_header("Arduino.h") and not any(h.endswith("Serial.h") for h in sketch.includes):
+        return [finding("serial-include", "warning", "Using Serial without including Arduino.h", use)]
+    return []
+
+
+@rule("wifi-include")
+def _wifi_include(sketch: Sketch) -> Iterable[Dict]:
+    use = sketch.members.get("WiFi")
+    if use and not sketch.includes_header("WiFi.h", "ESP8266WiFi.h"):
+        return [finding("wifi-include", "error", "Using WiFi functions without including WiFi.h", use)]
+    return []
+
+
+@rule("line-length")
+def _line_length(sketch: Sketch) -> Iterable[Dict]:
+    code = sketch.code
+    return [
+        finding("line-length", "warning", f"Line is very long (>{MAX_LINE_LENGTH} chars)",
+                line=number, column=MAX_LINE_LENGTH + 1)
+        for number, (start, end) in enumerate(sketch.lines, 1)
+        if end - start > MAX_LINE_LENGTH and len(code[start:end].strip()) > MAX_LINE_LENGTH
+    ]
+
+
+def lint(code: str, platform: str, filename: Optional[str] = None, rules: Iterable[Rule] = None) -> List[Dict]:
+    """Run the registered rules for a platform over one source
+
+    Args:
+        code: C/C++ source
+        platform: Target platform; rules registered for other platforms are skipped
+        filename: Source file name; .h/.cpp files are not required to define setup()/loop()
+        rules: Rules to run instead of the registered ones
+
+    Returns:
+        Findings ordered by position (findings without a position first)
+    """
+    sketch = Sketch(code, platform, filename)
+    findings = []
+    for registered in RULES if rules is None else rules:
+        if sketch.platform in registered.platforms:
+            findings.extend(registered.check(sketch))
+    return sorted(findings, key=lambda f: (f["line"] or 0, f["column"] or 0))
@@ -0,0 +1,295 @@
+"""Documentation crawler that fills the knowledge base ahead of time
+
+Seeds (pages or sitemaps) go into a persistent SQLite frontier, so an
+interrupted crawl resumes where it stopped. Workers fetch with bounded
+concurrency, honour robots.txt and a per-host delay, and skip pages whose
+extracted text was already seen. Each new page is written as Markdown
+under CRAWLED_DOCS_DIR and ingested right away.
+"""
+
+import asyncio
+import hashlib
+import re
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from src.config import (
+    CRAWL_CONCURRENCY, CRAWL_DELAY_SECONDS, CRAWL_MAX_PAGES, CRAWL_MAX_DEPTH, CRAWL_STATE_DIR,
+    CRAWLED_DOCS_DIR
+)
+from src.tools.page_fetch import PageFetcher, USER_AGENT, parse_html
+
+# Links to these are never pages worth ingesting
+_SKIP_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".zip", ".tar", ".gz", ".exe",
+                  ".bin", ".mp4", ".mp3", ".woff", ".woff2", ".ttf", ".css", ".js")
+
+_FRONTIER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    depth INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    added REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS frontier_status ON frontier (status, added);
+CREATE TABLE IF NOT EXISTS content (
+    hash TEXT PRIMARY KEY,
+    url TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scope (
+    prefix TEXT PRIMARY KEY
+);
+"""
+
+
+class Frontier:
+    """Persistent crawl queue, seen-content hashes and crawl scope"""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(_FRONTIER_SCHEMA)
+        self.scope = [row[0] for row in self.conn.execute("SELECT prefix FROM scope")]
+        # Pages in flight when a previous run stopped are fetched again
+        with self.conn:
+            self.conn.execute("UPDATE frontier SET status = 'queued' WHERE status = 'fetching'")
+
+    def add_scope(self, prefixes: Iterable[str]) -> None:
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO scope (prefix) VALUES (?)", [(p,) for p in prefixes])
+        self.scope = [row[0] for row in self.conn.execute("SELECT prefix FROM scope")]
+
+    def in_scope(self, url: str) -> bool:
+        return any(url.startswith(prefix) for prefix in self.scope)
+
+    def add(self, urls: Iterable[str], depth: int) -> int:
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO frontier (url, depth, added) VALUES (?, ?, ?)",
+                [(url, depth, time.time()) for url in urls]
+            )
+        return cursor.rowcount
+
+    def next(self) -> Optional[tuple]:
+        """Claim the oldest queued URL; returns (url, depth) or None"""
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT url, depth FROM frontier WHERE status = 'queued' ORDER BY added LIMIT 1"
+            ).fetchone()
+            if row:
+                self.conn.execute("UPDATE frontier SET status = 'fetching' WHERE url = ?", (row[0],))
+        return row
+
+    def finish(self, url: str, status: str) -> None:
+        with self.conn:
+            self.conn.execute("UPDATE frontier SET status = ? WHERE url = ?", (status, url))
+
+    def seen_content(self, content_hash: str, url: str) -> bool:
+        """Record a content hash; True if another URL already had it"""
+        with self.conn:
+            cursor = self.conn.execute("INSERT OR IGNORE INTO content (hash, url) VALUES (?, ?)", (content_hash, url))
+        return cursor.rowcount == 0
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall())
+
+
+def default_scope(url: str) -> str:
+    """Crawl scope of a seed: its host and directory ("https://h/docs/a.html" -> "https://h/docs/")"""
+    parsed = urlparse(url)
+    directory = parsed.path.rsplit("/", 1)[0] + "/"
+    return f"{parsed.scheme}://{parsed.netloc}{directory}"
+
+
+def page_file_name(url: str) -> str:
+    """Markdown file name for a crawled URL, unique per URL"""
+    parsed = urlparse(url)
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", f"{parsed.netloc}{parsed.path}").strip("-")[:80] or "page"
+    return f"{slug}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]}.md"
+
+
+class Crawler:
+    """Crawl documentation sites into the knowledge base"""
+
+    def __init__(self, tools=None, state_name: str = "default", output_dir: Path = CRAWLED_DOCS_DIR,
+                 state_dir: Path = CRAWL_STATE_DIR, concurrency: int = CRAWL_CONCURRENCY, delay: float = CRAWL_DELAY_SECONDS,
+                 max_pages: int = CRAWL_MAX_PAGES, max_depth: int = CRAWL_MAX_DEPTH,
+                 fetcher: PageFetcher = None):
+        """
+        Args:
+            tools: EmbeddedSystemsTools to ingest into; None only writes files
+            state_name: Frontier to use; the same name resumes a previous crawl
+            output_dir: Where crawled pages are written as Markdown
+            state_dir: Where frontiers are kept
+            concurrency: Pages fetched at the same time
+            delay: Minimum seconds between requests to one host
+            max_pages: Pages fetched in this run
+            max_depth: Link hops followed from a seed (0 = seeds only)
+        """
+        self.tools = tools
+        self.frontier = Frontier(Path(state_dir) / f"{state_name}.sqlite")
+        self.output_dir = Path(output_dir)
+        self.concurrency = concurrency
+        self.delay = delay
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.fetcher = fetcher or PageFetcher(concurrency=concurrency)
+        self.stats = {"fetched": 0, "ingested": 0, "duplicates": 0, "failed": 0, "disallowed": 0}
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+        self._next_request: Dict[str, float] = {}
+        self._host_lock = asyncio.Lock()
+
+    def add_seeds(self, urls: List[str], scope: List[str] = None) -> int:
+        """Queue seed pages; scope defaults to each seed's directory"""
+        self.frontier.add_scope(scope or [default_scope(url) for url in urls])
+        return self.frontier.add(urls, depth=0)
+
+    def add_sitemap(self, sitemap_url: str, scope: List[str] = None, limit: int = 10000) -> int:
+        """Queue every page listed in a sitemap (nested sitemap indexes included)
+
+        A nested sitemap that cannot be downloaded or parsed is reported and
+        skipped; the rest of the index is still queued.
+
+        Raises:
+            ValueError: No sitemap could be read; the message names each failure
+        """
+        pending, pages, failures = [sitemap_url], [], []
+        while pending and len(pages) < limit:
+            url = pending.pop()
+            try:
+                _, body = self.fetcher.download(url)
+                root = ET.fromstring(body)
+            except Exception as e:
+                failures.append(f"{url}: {str(e)[:100]}")
+                print(f"⚠️ Sitemap {url} failed: {str(e)[:100]}")
+                continue
+            namespace = root.tag.split("}")[0] + "}" if root.tag.startswith("{") else ""
+            locations = [loc.text.strip() for loc in root.iter(f"{namespace}loc") if loc.text]
+            if root.tag.endswith("sitemapindex"):
+                pending.extend(locations)
+            else:
+                pages.extend(locations)
+        if failures and not pages:
+            raise ValueError(f"No sitemap could be read ({'; '.join(failures)})")
+        pages = pages[:limit]
+        self.frontier.add_scope(scope or sorted({default_scope(url) for url in pages}))
+        return self.frontier.add(pages, depth=0)
+
+    def _allowed(self, url: str) -> bool:
+        """robots.txt check; hosts whose robots.txt cannot be read are allowed"""
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+        if host not in self._robots:
+            parser = RobotFileParser()
+            try:
+                response, body = self.fetcher.download(f"{host}/robots.txt")
+                parser.parse(body.decode("utf-8", errors="replace").splitlines())
+                self._robots[host] = parser
+            except Exception:
+                self._robots[host] = None
+        parser = self._robots[host]
+        return parser is None or parser.can_fetch(USER_AGENT, url)
+
+    async def _wait_turn(self, url: str) -> None:
+        """Politeness: space requests to one host by the crawl delay (or robots Crawl-delay)"""
+        host = urlparse(url).netloc
+        parser = self._robots.get(f"{urlparse(url).scheme}://{host}")
+        delay = max(self.delay, (parser.crawl_delay(USER_AGENT) or 0) if parser else 0)
+        async with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request.get(host, now))
+            self._next_request[host] = start + delay
+        await asyncio.sleep(start - now)
+
+    def _fetch(self, url: str) -> Dict:
+        """Blocking fetch and parse of one page (runs on the fetcher's pool)"""
+        response, body = self.fetcher.download(url)
+        content_type = response.headers.get("Content-Type", "")
+        if "html" not in content_type and "text/plain" not in content_type:
+            return {"status": "skipped"}
+        encoding = response.encoding if "charset" in content_type.lower() else "utf-8"
+        html = body.decode(encoding, errors="replace")
+        if "html" in content_type:
+            title, text, links = parse_html(html, response.url)
+        else:
+            title, text, links = "", html, []
+        return {"status": "fetched", "url": response.url, "title": title, "text": text, "links": links}
+
+    def _follow(self, links: List[str], depth: int) -> None:
+        if depth > self.max_depth:
+            return
+        wanted = [link for link in dict.fromkeys(links)
+                  if self.frontier.in_scope(link) and not urlparse(link).path.lower().endswith(_SKIP_SUFFIXES)]
+        self.frontier.add(wanted, depth)
+
+    async def _store(self, page: Dict) -> None:
+        """Write a page as Markdown and stream it into ingestion"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / page_file_name(page["url"])
+        heading = f"# {page['title']}\n\n" if page["title"] else ""
+        path.write_text(f"{heading}Source: {page['url']}\n\n{page['text']}\n", encoding="utf-8")
+        if self.tools is not None:
+            success, message = await self.tools.add_knowledge(str(path))
+            if success:
+                self.stats["ingested"] += 1
+            else:
+                print(f"⚠️ {page['url']}: {message}")
+
+    async def _worker(self, budget: List[int]) -> None:
+        loop = asyncio.get_running_loop()
+        while budget[0] > 0:
+            claimed = self.frontier.next()
+            if claimed is None:
+                return
+            budget[0] -= 1
+            url, depth = claimed
+
+            # robots.txt is read before the first page of a host, so its
+            # Crawl-delay already spaces that host's first requests
+            if not await loop.run_in_executor(self.fetcher.executor, self._allowed, url):
+                self.stats["disallowed"] += 1
+                self.frontier.finish(url, "disallowed")
+                continue
+
+            await self._wait_turn(url)
+            try:
+                page = await loop.run_in_executor(self.fetcher.executor, self._fetch, url)
+            except Exception as e:
+                self.stats["failed"] += 1
+                self.frontier.finish(url, "failed")
+                print(f"❌ {url}: {str(e)[:100]}")
+                continue
+
+            if page["status"] != "fetched":
+                self.frontier.finish(url, page["status"])
+                continue
+
+            self.stats["fetched"] += 1
+            self._follow(page["links"], depth + 1)
+            content_hash = hashlib.sha256(page["text"].encode("utf-8")).hexdigest()
+            if not page["text"].strip() or self.frontier.seen_content(content_hash, url):
+                self.stats["duplicates"] += 1
+                self.frontier.finish(url, "duplicate")
+                continue
+
+            await self._store(page)
+            self.frontier.finish(url, "done")
+
+    async def run(self) -> Dict:
+        """Crawl until the frontier is empty or max_pages were fetched
+
+        Returns:
+            Run statistics plus the frontier's status counts
+        """
+        budget = [self.max_pages]
+        with self.tools.bulk_ingest() if self.tools is not None else nullcontext():
+            # Workers stop when the queue is momentarily empty, so keep
+            # starting rounds while links found by the last round are queued
+            while budget[0] > 0 and self.frontier.counts().get("queued"):
+                await asyncio.gather(*(self._worker(budget) for _ in range(self.concurrency)))
+        return dict(self.stats, frontier=self.frontier.counts())
@@ -0,0 +1,177 @@
+"""Reduced-dimension embeddings for a smaller, faster vector index"""
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+PROJECTION_FILE = "projection.npz"
+
+
+class Projection:
+    """Linear map from full model vectors to a reduced dimension
+
+    PCA projections store the corpus mean and principal axes; truncation
+    keeps the leading dimensions of a Matryoshka-style model.
+    """
+
+    def __init__(self, method: str, dims: int, mean: np.ndarray = None, components: np.ndarray = None):
+        self.method = method
+        self.dims = dims
+        self.mean = mean
+        self.components = components
+
+    @classmethod
+    def fit_pca(cls, vectors: List[List[float]], dims: int) -> "Projection":
+        """Fit principal axes on corpus vectors
+
+        Args:
+            vectors: Full-dimension embeddings sampled from the corpus
+            dims: Target dimension (must not exceed the sample count)
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.shape[0] < dims:
+            raise ValueError(f"Need at least {dims} sample chunks to fit PCA, got {matrix.shape[0]}")
+
+        mean = matrix.mean(axis=0)
+        _, _, vt = np.linalg.svd(matrix - mean, full_matrices=False)
+        return cls("pca", dims, mean, vt[:dims].astype(np.float32))
+
+    @classmethod
+    def truncate(cls, dims: int) -> "Projection":
+        return cls("truncate", dims)
+
+    def apply(self, vectors: List[List[float]]) -> List[List[float]]:
+        """Project vectors and re-normalize them for cosine search"""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if self.method == "pca":
+            reduced = (matrix - self.mean) @ self.components.T
+        else:
+            reduced = matrix[:, :self.dims]
+
+        norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (reduced / norms).tolist()
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {"method": np.array(self.method), "dims": np.array(self.dims)}
+        if self.method == "pca":
+            arrays.update(mean=self.mean, components=self.components)
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["Projection"]:
+        if not path.exists():
+            return None
+        data = np.load(path)
+        method = str(data["method"])
+        if method == "pca":
+            return cls(method, int(data["dims"]), data["mean"], data["components"])
+        return cls(method, int(data["dims"]))
+
+
+class ReducedEmbeddings(Embeddings):
+    """Wrap a model so documents and queries share one persisted projection"""
+
+    def __init__(self, base: Embeddings, method: str, dims: int, projection_path: Path):
+        self.base = base
+        self.method = method
+        self.dims = dims
+        self.projection_path = projection_path
+        self.projection = Projection.load(projection_path)
+
+        if self.projection is None and method == "truncate":
+            self.projection = Projection.truncate(dims)
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.projection is not None
+
+    def fit(self, texts: List[str]) -> None:
+        """Fit the PCA projection on sample corpus texts and persist it with the index"""
+        self.projection = Projection.fit_pca(self.base.embed_documents(texts), self.dims)
+        self.projection.save(self.projection_path)
+
+    def _project(self, vectors: List[List[float]]) -> List[List[float]]:
+        if self.projection is None:
+            raise RuntimeError("Embedding projection not fitted; run a bulk ingest first")
+        return self.projection.apply(vectors)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._project(self.base.embed_documents(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._project([self.base.embed_query(text)])[0]
+
+
+def benchmark_dimensions(base: Embeddings, corpus: List[str], queries: List[str],
+                         dims_list: List[int], k: int = 5, method: str = "pca") -> List[Dict]:
+    """Measure recall@k and search latency of reduced indexes against full vectors
+
+    Args:
+        base: Full-dimension embedding model
+        corpus: Chunk texts to index
+        queries: Queries to search with
+        dims_list: Reduced dimensions to evaluate
+        k: Number of neighbors compared
+        method: "pca" or "truncate"
+
+    Returns:
+        One dict per dimension with recall_at_k, latency_ms and index_mb, or
+        with "skipped" giving the reason a dimension could not be evaluated
+    """
+    doc_vectors = np.asarray(base.embed_documents(corpus), dtype=np.float32)
+    query_vectors = np.asarray(base.embed_documents(queries), dtype=np.float32)
+    full_dims = doc_vectors.shape[1]
+    k = min(k, len(corpus))
+
+    def top_k(docs: np.ndarray, qs: np.ndarray) -> np.ndarray:
+        return np.argsort(-(qs @ docs.T), axis=1)[:, :k]
+
+    def normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    reference = top_k(normalize(doc_vectors), normalize(query_vectors))
+
+    report = []
+    evaluated = [full_dims]
+    for dims in dims_list:
+        if dims >= full_dims:
+            report.append({"dims": dims, "skipped": f"not below the model's {full_dims} dimensions"})
+        elif method == "pca" and dims > len(corpus):
+            report.append({"dims": dims, "skipped": f"PCA needs at least {dims} chunks, got {len(corpus)}"})
+        else:
+            evaluated.append(dims)
+
+    for dims in evaluated:
+        if dims == full_dims:
+            docs, qs = normalize(doc_vectors), normalize(query_vectors)
+        else:
+            if method == "pca":
+                projection = Projection.fit_pca(doc_vectors, dims)
+            else:
+                projection = Projection.truncate(dims)
+            docs = np.asarray(projection.apply(doc_vectors), dtype=np.float32)
+            qs = np.asarray(projection.apply(query_vectors), dtype=np.float32)
+
+        start = time.perf_counter()
+        hits = top_k(docs, qs)
+        latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        recall = np.mean([len(set(h) & set(r)) / k for h, r in zip(hits, reference)])
+        report.append({
+            "dims": dims,
+            "recall_at_k": float(recall),
+            "latency_ms": latency_ms,
+            "index_mb": docs.nbytes / (1024 * 1024)
+        })
+
+    return sorted(report, key=lambda row: -row["dims"])
@@ -1,91 +1,144 @@
 """Tool definitions using LangChain's @tool decorator"""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from langchain_core.tools import tool
-try:
-    from ddgs import DDGS
-except ImportError:
-    from duckduckgo_search import DDGS
 
 from src.config import (
-    COMPONENT_DB, PINOUTS, CODE_TEMPLATES, LIBRARY_DATABASE, WEB_SEARCH_MAX_RESULTS
+    WEB_SEARCH_MAX_RESULTS, WEB_ENRICH_TOP_N, WEB_ENRICH_EXCERPT_CHARS, COMPONENT_LOOKUP_CANDIDATES,
+    LIBRARY_RESOLVE_MIN_SCORE
 )
+from src.data import load_dataset, get_index, search_components, find_library, resolve_libraries
+from src.data.catalog import get_catalog
+from src.data.library_index import split_library_id
+from src.data.loader import normalize_key
+from src.data.pins import check_pin_assignment, find_pins
 
-# Check if web search is available
-try:
-    DDGS()
-    WEB_SEARCH_AVAILABLE = True
-except Exception:
-    WEB_SEARCH_AVAILABLE = False
+
+def _get_ddgs_class():
+    """Import the search client on first use; returns None if not installed"""
+    try:
+        from ddgs import DDGS
+    except ImportError:
+        try:
+            from duckduckgo_search import DDGS
+        except ImportError:
+            return None
+    return DDGS
 
 
 @tool
-def web_search_tool(query: str, max_results: int = WEB_SEARCH_MAX_RESULTS) -> str:
-    """Search the web for embedded systems information, tutorials, and documentation"""
-    if not WEB_SEARCH_AVAILABLE:
+def web_search_tool(query: str, max_results: int = WEB_SEARCH_MAX_RESULTS, enrich: bool = False) -> str:
+    """Search the web for embedded systems information, tutorials, and documentation.
+    Set enrich=True to also fetch the top result pages and include their main text,
+    which usually answers the question without further searches."""
+    DDGS = _get_ddgs_class()
+    if DDGS is None:
         return "Web search not available. Please install duckduckgo-search package."
 
-    try:
-        ddgs = DDGS()
-        results = []
-        enhanced_query = f"{query} embedded systems arduino esp32 raspberry pi"
-
-        search_results = ddgs.text(enhanced_query, max_results=max_results)
-
-        for result in search_results:
-            results.append({
-                "title": result.get("title", ""),
-                "url": result.get("href", ""),
-                "snippet": result.get("body", "")
-            })
-
-        # Format results as string
-        formatted_results = "🔍 Web Search Results:\n\n"
-        for i, result in enumerate(results, 1):
-            formatted_results += f"{i}. **{result['title']}**\n"
-            formatted_results += f"   URL: {result['url']}\n"
+    from src.tools.web_search import get_web_search
+
+    response = get_web_search(DDGS).search(query, max_results)
+    if "error" in response:
+        return f"Web search failed: {response['error']}"
+
+    pages = {}
+    if enrich:
+        from src.tools.page_fetch import get_page_fetcher
+
+        urls = [result["url"] for result in response["results"][:WEB_ENRICH_TOP_N] if result["url"]]
+        pages = {page["url"]: page for page in get_page_fetcher().fetch_many(urls) if page.get("text")}
+
+    # Format results as string
+    formatted_results = "🔍 Web Search Results:\n\n"
+    if response["source"] != "network":
+        formatted_results = "🔍 Web Search Results (cached):\n\n"
+    for i, result in enumerate(response["results"], 1):
+        formatted_results += f"{i}. **{result['title']}**\n"
+        formatted_results += f"   URL: {result['url']}\n"
+        page = pages.get(result["url"])
+        if page:
+            formatted_results += f"   Page content:\n{page['text'][:WEB_ENRICH_EXCERPT_CHARS]}\n\n"
+        else:
             formatted_results += f"   {result['snippet'][:200]}...\n\n"
 
-        return formatted_results
+    return formatted_results
 
-    except Exception as e:
-        return f"Web search failed: {str(e)}"
 
+def _format_component(info: Dict) -> str:
+    result = f"🔌 **{info.get('type', 'Unknown component')}**\n\n"
+    result += f"**Description:** {info.get('description', 'Not available')}\n"
+    result += f"**Voltage:** {info.get('voltage', 'Not specified')}\n"
+    result += f"**Pins:** {', '.join(info.get('pins', [])) or 'Not specified'}\n"
 
-@tool
-def component_lookup_tool(component_name: str) -> str:
-    """Look up information about electronic components, sensors, and modules"""
-    component_key = component_name.lower().replace("-", "").replace(" ", "")
+    if 'libraries' in info:
+        result += f"**Libraries:** {', '.join(info['libraries'])}\n"
+
+    if 'arduino_code' in info:
+        result += f"\n**Arduino Code:**\n```cpp\n{info['arduino_code']}\n```\n"
+
+    if 'raspberry_pi_code' in info:
+        result += f"\n**Raspberry Pi Code:**\n```python\n{info['raspberry_pi_code']}\n```\n"
+
+    return result
 
-    # Find matching component
-    for key, info in COMPONENT_DB.items():
-        if component_key in key or component_name.lower() in info["type"].lower():
-            result = f"🔌 **{info['type']}**\n\n"
-            result += f"**Description:** {info['description']}\n"
-            result += f"**Voltage:** {info['voltage']}\n"
-            result += f"**Pins:** {', '.join(info['pins'])}\n"
 
-            if 'libraries' in info:
-                result += f"**Libraries:** {', '.join(info['libraries'])}\n"
+def _lookup_component(component_name: str, component_db: Dict) -> str:
+    catalog = get_catalog()
+    matches = catalog.find_components(component_name, COMPONENT_LOOKUP_CANDIDATES) if catalog else []
+    if not matches:
+        matches = [(key, component_db[key], score)
+                   for key, score in search_components(component_name, COMPONENT_LOOKUP_CANDIDATES)]
+    if not matches:
+        return (f"❌ Component '{component_name}' not found in database. Try: DHT22, HC-SR04, LED, "
+                f"or mode='semantic' to describe what the part should do")
 
-            if 'arduino_code' in info:
-                result += f"\n**Arduino Code:**\n```cpp\n{info['arduino_code']}\n```\n"
+    result = _format_component(matches[0][1])
+    if len(matches) > 1:
+        others = ", ".join(f"{info['type']} ({score:.2f})" for _, info, score in matches[1:])
+        result += f"\n**Other matches:** {others}\n"
+    return result
 
-            if 'raspberry_pi_code' in info:
-                result += f"\n**Raspberry Pi Code:**\n```python\n{info['raspberry_pi_code']}\n```\n"
 
-            return result
+def _semantic_component(description: str, component_db: Dict) -> str:
+    from src.tools.semantic_catalog import semantic_search
 
-    return f"❌ Component '{component_name}' not found in database. Try: DHT22, HC-SR04, LED"
+    matches = semantic_search(description, "components", limit=COMPONENT_LOOKUP_CANDIDATES)
+    if not matches:
+        return f"❌ No component matches '{description}'"
+
+    result = _format_component(component_db[matches[0]["key"]])
+    if len(matches) > 1:
+        others = ", ".join(f"{component_db[m['key']]['type']} ({m['score']:.2f})" for m in matches[1:])
+        result += f"\n**Other matches:** {others}\n"
+    return result
+
+
+@tool
+def component_lookup_tool(component_name: str = "", component_names: Optional[List[str]] = None,
+                          mode: str = "name") -> str:
+    """Look up information about electronic components, sensors, and modules.
+    Pass several parts in component_names to look them up in one call.
+    Use mode="semantic" with a description of the need (e.g. "measure distance
+    underwater") to find suitable parts without knowing their names."""
+    component_db = load_dataset("components")
+    names = list(component_names or [])
+    if component_name:
+        names.insert(0, component_name)
+    if not names:
+        return "❌ Provide component_name or component_names"
+
+    lookup = _semantic_component if mode == "semantic" else _lookup_component
+    return "\n---\n\n".join(lookup(name, component_db) for name in names)
 
 
 @tool
 def pinout_lookup_tool(platform: str) -> str:
     """Get detailed pinout information for microcontrollers and development boards"""
-    platform_key = platform.lower().replace("-", "_").replace(" ", "_")
+    pinouts = load_dataset("pinouts")
+    platform_key = get_index("pinouts")["by_key"].get(normalize_key(platform))
 
-    if platform_key in PINOUTS:
-        info = PINOUTS[platform_key]
+    if platform_key:
+        info = pinouts[platform_key]
         result = f"📌 **{info['description']}**\n\n"
 
         if 'digital_pins' in info:
@@ -107,132 +160,150 @@ def pinout_lookup_tool(platform: str) -> str:
 
         return result
     else:
-        available = list(PINOUTS.keys())
+        available = list(pinouts.keys())
         return f"❌ Pinout for '{platform}' not found. Available: {', '.join(available)}"
 
 
 @tool
-def code_template_tool(platform: str, template_type: str) -> str:
-    """Get code templates for different platforms and use cases"""
-    platform_key = platform.lower()
-    template_key = template_type.lower()
-
-    if platform_key in CODE_TEMPLATES:
-        if template_key in CODE_TEMPLATES[platform_key]:
-            template_code = CODE_TEMPLATES[platform_key][template_key]
-            lang = "cpp" if platform_key in ["arduino", "esp32"] else "python"
-            return f"📝 **{platform.title()} {template_type.title()} Template**\n\n```{lang}\n{template_code.strip()}\n```"
-        else:
-            available = list(CODE_TEMPLATES[platform_key].keys())
-            return f"❌ Template '{template_type}' not found for {platform}. Available: {', '.join(available)}"
-    else:
-        available = list(CODE_TEMPLATES.keys())
-        return f"❌ Platform '{platform}' not supported. Available: {', '.join(available)}"
+def pin_capability_tool(platform: str, capabilities: Optional[List[str]] = None,
+                        pins: Optional[Dict[str, str]] = None, boot_safe: bool = False) -> Dict:
+    """Answer pin questions for a board from its pin-capability table.
+    capabilities: pins supporting all of them (adc, pwm, touch, i2c, spi, uart, output, ...).
+    pins: pin -> intended use (e.g. {"34": "output"}) to check for conflicts.
+    boot_safe: only return pins that are safe to use while the board boots."""
+    platform_key = get_index("pinouts")["by_key"].get(normalize_key(platform))
+    if not platform_key:
+        available = list(load_dataset("pinouts").keys())
+        return {"error": f"Pinout for '{platform}' not found. Available: {', '.join(available)}"}
+
+    table = get_index("pinouts")["pins"][platform_key]
+    result = {"success": True, "platform": platform_key}
+
+    if capabilities:
+        matching = find_pins(table, capabilities, boot_safe=boot_safe)
+        result["pins"] = {pin: table[pin] for pin in matching}
+    if pins:
+        result["conflicts"] = check_pin_assignment(table, pins)
+    if not capabilities and not pins:
+        result["pins"] = table
+    return result
 
 
 @tool
-def code_validator_tool(code: str, platform: str) -> Dict:
-    """Validate code syntax and structure for embedded platforms"""
-    try:
-        validation_result = {
-            "success": True,
-            "warnings": [],
-            "errors": [],
-            "suggestions": []
-        }
+def code_template_tool(platform: str, template_type: str, params: Optional[Dict] = None,
+                       components: Optional[List[str]] = None) -> str:
+    """Get code templates for different platforms and use cases.
+    Fill template slots with params, e.g. {"port": 8080, "led_pin": "GPIO2"}, and
+    merge component snippets with components, e.g. ["dht22"]; component slots are
+    set as "dht22.pin". Pins are checked against the board's pinout."""
+    from src.tools.template_engine import render_template, list_templates
+
+    result = render_template(platform, template_type, params, components)
+    if not result["success"]:
+        return "❌ " + "\n❌ ".join(result["errors"])
+
+    lang = "cpp" if platform.lower() in ["arduino", "esp32"] else "python"
+    output = f"📝 **{platform.title()} {template_type.title()} Template**\n\n```{lang}\n{result['code'].strip()}\n```"
+    for warning in result["warnings"]:
+        output += f"\n⚠️ {warning}"
+    slots = list_templates(platform.lower())[platform.lower()][template_type.lower()]["slots"]
+    if slots:
+        output += "\n\n**Parameters:** " + ", ".join(
+            f"{name}={result['params'][name]}" for name in slots if name in result["params"])
+    return output
 
-        if platform.lower() in ["arduino", "esp32"]:
-            # Arduino/ESP32 C++ validation
-            if "setup()" not in code:
-                validation_result["errors"].append("Missing required setup() function")
 
-            if "loop()" not in code and platform.lower() != "library":
-                validation_result["errors"].append("Missing required loop() function")
-
-            # Check for common issues
-            if "Serial.begin" in code and "Serial.h" not in code and "#include <Arduino.h>" not in code:
-                validation_result["warnings"].append("Using Serial without including Arduino.h")
-
-            # Check for WiFi usage without include
-            if "WiFi." in code and "#include <WiFi.h>" not in code:
-                validation_result["errors"].append("Using WiFi functions without including WiFi.h")
-
-        elif platform.lower() == "raspberry_pi":
-            # Python validation
-            try:
-                compile(code, '<string>', 'exec')
-            except SyntaxError as e:
-                validation_result["errors"].append(f"Python syntax error: {str(e)}")
-
-            # Check for GPIO usage
-            if "GPIO." in code and "import RPi.GPIO" not in code:
-                validation_result["warnings"].append("Using GPIO without importing RPi.GPIO")
-
-            if "GPIO.cleanup()" not in code and "GPIO." in code:
-                validation_result["suggestions"].append("Consider adding GPIO.cleanup() for proper resource cleanup")
-
-        # General checks
-        lines = code.split('\n')
-        for i, line in enumerate(lines, 1):
-            if len(line.strip()) > 120:
-                validation_result["warnings"].append(f"Line {i} is very long (>120 chars)")
-
-        if validation_result["errors"]:
-            validation_result["success"] = False
+@tool
+def code_validator_tool(code: str = "", platform: str = "", file_paths: Optional[List[str]] = None,
+                        compile_check: bool = False) -> Dict:
+    """Validate code syntax and structure for embedded platforms.
+    Pass file_paths (files or directories) to validate many files in one call;
+    the platform is then inferred from each file's extension unless given.
+    Set compile_check=True to also compile Arduino/ESP32 code in syntax-only mode,
+    which reports real compiler errors with line numbers."""
+    from src.tools.code_validation import validate_code, validate_files
 
-        return validation_result
+    try:
+        if file_paths:
+            return validate_files(file_paths, platform or None, compile_check=compile_check)
+        if not platform:
+            return {"success": False, "error": "Provide a platform to validate code"}
+        return validate_code(code, platform, compile_check=compile_check)
 
     except Exception as e:
         return {"success": False, "error": f"Validation failed: {str(e)}"}
 
 
 @tool
-def library_lookup_tool(library_name: str, platform: str) -> Dict:
-    """Look up library information and installation instructions"""
-    platform_libs = LIBRARY_DATABASE.get(platform.lower(), {})
-    lib_key = library_name.lower().replace("-", "").replace("_", "").replace(".", "")
+def library_lookup_tool(library_name: str, platform: str, mode: str = "name") -> Dict:
+    """Look up library information and installation instructions.
+    Use mode="semantic" with a description of the task to find candidate libraries."""
+    if mode == "semantic":
+        from src.tools.semantic_catalog import semantic_search
+
+        libraries = load_dataset("libraries")
+        matches = semantic_search(library_name, "libraries", limit=COMPONENT_LOOKUP_CANDIDATES, platform=platform)
+        if not matches:
+            return {"error": f"No libraries for platform '{platform}'"}
+        return {
+            "success": True,
+            "libraries": [
+                dict(libraries[home][key], id=m["key"], score=round(m["score"], 2))
+                for m in matches for home, key in [split_library_id(m["key"])]
+            ]
+        }
+
+    catalog = get_catalog()
+    matches = catalog.find_libraries(library_name, platform, limit=1) if catalog else []
+    if matches:
+        return {"success": True, "library": matches[0][1]}
 
-    for key, info in platform_libs.items():
-        if lib_key in key or library_name.lower() in info["name"].lower():
-            return {"success": True, "library": info}
+    match = find_library(library_name, platform, min_score=LIBRARY_RESOLVE_MIN_SCORE)
+    if match:
+        lib_id, info, _ = match
+        return {"success": True, "library": dict(info, id=lib_id)}
 
     return {"error": f"Library '{library_name}' not found for platform '{platform}'"}
 
 
 @tool
-def file_operations_tool(operation: str, file_path: str, content: str = "") -> Dict:
-    """Perform file operations like read, write, create directories"""
-    from pathlib import Path
-    
-    try:
-        path = Path(file_path)
+def library_resolve_tool(library_names: List[str], platform: str) -> Dict:
+    """Resolve several libraries for one platform in a single call.
+    Returns which libraries are available on the platform, the full install set
+    including dependencies (dependencies first) and any that are missing."""
+    result = resolve_libraries(library_names, platform)
+    result["success"] = not result["missing"] and not result["cycles"]
+    return result
+
 
+@tool
+def file_operations_tool(operation: str, file_path: str, content: str = "", offset: int = 0, limit: int = 0,
+                         pattern: str = "*") -> Dict:
+    """Perform file operations like read, write, create directories.
+    Operations: read (offset/limit in lines; follow next_offset for more), write, append
+    (write large files in chunks: write the first chunk, append the rest), create_dir,
+    list (glob pattern such as "*.ino" or "**/*.py"; offset/limit page through entries).
+    Paths are relative to the workspace directory."""
+    from src.tools.file_ops import OutsideRootError, list_page, read_page, resolve_path, write_chunk
+
+    try:
         if operation == "read":
-            if path.exists():
-                with open(path, 'r', encoding='utf-8') as f:
-                    return {"success": True, "content": f.read()}
-            else:
-                return {"error": f"File {file_path} not found"}
-
-        elif operation == "write":
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return {"success": True, "message": f"File written to {file_path}"}
+            return read_page(file_path, offset, limit)
+
+        elif operation in ("write", "append"):
+            return write_chunk(file_path, content, append=operation == "append")
 
         elif operation == "create_dir":
-            path.mkdir(parents=True, exist_ok=True)
+            resolve_path(file_path).mkdir(parents=True, exist_ok=True)
             return {"success": True, "message": f"Directory created: {file_path}"}
 
         elif operation == "list":
-            if path.exists() and path.is_dir():
-                files = [str(f) for f in path.iterdir()]
-                return {"success": True, "files": files}
-            else:
-                return {"error": f"Directory {file_path} not found"}
+            return list_page(file_path, pattern, offset, limit)
 
         else:
             return {"error": f"Unknown operation: {operation}"}
 
+    except OutsideRootError as e:
+        return {"error": str(e)}
     except Exception as e:
         return {"error": f"File operation failed: {str(e)}"}
@@ -0,0 +1,214 @@
+"""Shared embedding service with dynamic micro-batching over a Unix socket"""
+
+import asyncio
+import json
+import socket
+import struct
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from src.config import (
+    EMBEDDING_SERVICE_SOCKET, EMBEDDING_SERVICE_BATCH_WINDOW_MS,
+    EMBEDDING_SERVICE_MAX_BATCH
+)
+
+# Each message is a 4-byte big-endian length followed by a JSON payload
+_HEADER = struct.Struct("!I")
+
+
+def _encode(payload: dict) -> bytes:
+    data = json.dumps(payload).encode("utf-8")
+    return _HEADER.pack(len(data)) + data
+
+
+class EmbeddingServer:
+    """Holds one embedding model and serves batched requests to many clients"""
+
+    def __init__(self, embeddings: Embeddings, socket_path: str = EMBEDDING_SERVICE_SOCKET,
+                 batch_window_ms: float = EMBEDDING_SERVICE_BATCH_WINDOW_MS,
+                 max_batch_size: int = EMBEDDING_SERVICE_MAX_BATCH):
+        """Initialize the server
+
+        Args:
+            embeddings: Model used to embed every batch
+            socket_path: Unix socket to listen on
+            batch_window_ms: How long to collect concurrent requests into one batch
+            max_batch_size: Maximum number of texts embedded in one model call
+        """
+        self.embeddings = embeddings
+        self.socket_path = socket_path
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+
+    async def serve_forever(self):
+        """Listen on the socket and process batches until cancelled"""
+        path = Path(self.socket_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()  # Stale socket from a previous run
+
+        self._queue = asyncio.Queue()
+        batcher = asyncio.create_task(self._batch_loop())
+        server = await asyncio.start_unix_server(self._handle_client, path=str(path))
+        print(f"🧠 Embedding service listening on {path}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if path.exists():
+                path.unlink()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests from one connection until the client disconnects"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                header = await reader.readexactly(_HEADER.size)
+                (length,) = _HEADER.unpack(header)
+                request = json.loads(await reader.readexactly(length))
+
+                future = loop.create_future()
+                await self._queue.put((request.get("texts", []), future))
+                try:
+                    response = {"embeddings": await future}
+                except Exception as e:
+                    response = {"error": str(e)}
+
+                writer.write(_encode(response))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def _batch_loop(self):
+        """Collect queued requests for a short window and embed them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending: List[Tuple[List[str], asyncio.Future]] = [await self._queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.batch_window
+
+            while size < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            texts = [text for batch, _ in pending for text in batch]
+            try:
+                # Model calls are blocking; keep the event loop free to accept requests
+                vectors = await loop.run_in_executor(None, self.embeddings.embed_documents, texts)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for batch, future in pending:
+                if not future.done():
+                    future.set_result([list(map(float, v)) for v in vectors[offset:offset + len(batch)]])
+                offset += len(batch)
+
+
+class EmbeddingServiceClient(Embeddings):
+    """LangChain embeddings backed by a running EmbeddingServer"""
+
+    def __init__(self, socket_path: str = EMBEDDING_SERVICE_SOCKET, timeout: float = 60.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()  # One persistent connection per thread
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+
+    def _recv_exactly(self, sock: socket.socket, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Embedding service closed the connection")
+            data.extend(chunk)
+        return bytes(data)
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(2):
+            sock = getattr(self._local, "sock", None)
+            try:
+                if sock is None:
+                    sock = self._local.sock = self._connect()
+                sock.sendall(_encode({"texts": texts}))
+                (length,) = _HEADER.unpack(self._recv_exactly(sock, _HEADER.size))
+                response = json.loads(self._recv_exactly(sock, length))
+                break
+            except (ConnectionError, FileNotFoundError):
+                # Server restarted since the last call; reconnect once
+                self._drop_connection(sock)
+                if attempt == 1:
+                    raise
+            except BaseException:
+                # A timeout leaves a late response on the stream, so the
+                # connection cannot be reused; the request is not sent again
+                self._drop_connection(sock)
+                raise
+
+        if "error" in response:
+            raise RuntimeError(f"Embedding service error: {response['error']}")
+        return response["embeddings"]
+
+    def _drop_connection(self, sock: Optional[socket.socket]):
+        if sock is not None:
+            sock.close()
+        self._local.sock = None
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._request(list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._request([text])[0]
+
+
+def embedding_service_available(socket_path: str = EMBEDDING_SERVICE_SOCKET) -> bool:
+    """Check whether an embedding service is accepting connections"""
+    if not socket_path or not Path(socket_path).exists():
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(socket_path)
+        return True
+    except (ConnectionError, FileNotFoundError):
+        return False
+    except OSError as e:
+        # Timeouts and unusable socket paths (permissions, not a socket) fall back too
+        print(f"⚠️ Embedding service at {socket_path} is unusable ({e}); using a local model")
+        return False
+
+
+def run_embedding_server(socket_path: str = EMBEDDING_SERVICE_SOCKET):
+    """Load the embedding model once and serve it until interrupted"""
+    from src.tools.embeddings import create_embeddings
+
+    embeddings = create_embeddings()
+    server = EmbeddingServer(embeddings, socket_path)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n👋 Embedding service stopped")
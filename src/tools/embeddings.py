@@ -0,0 +1,174 @@
+"""Embedding backend selection for CPU-only deployments"""
+
+import math
+import os
+import platform
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config import (
+    EMBEDDINGS_MODEL, EMBEDDINGS_BACKEND, EMBEDDINGS_NUM_THREADS,
+    EMBEDDINGS_ONNX_INT8_FILE, EMBEDDINGS_ONNX_INT8_FILES, EMBEDDINGS_MODELS_DIR, EMBEDDING_SERVICE_SOCKET
+)
+
+EMBEDDING_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+# Representative queries and passages used to compare backends
+PARITY_SAMPLE_TEXTS = [
+    "How do I read temperature and humidity from a DHT22 on an ESP32?",
+    "Ultrasonic distance sensor HC-SR04 trigger and echo timing",
+    "Blink the built-in LED on an Arduino Uno every second",
+    "Raspberry Pi GPIO pins are 3.3V only and not 5V tolerant",
+    "Configure I2C SDA and SCL pins for a BME280 sensor",
+    "Start a web server on port 80 and toggle an LED from the browser",
+    "Use PWM to control the speed of a DC motor with analogWrite",
+    "Strapping pins on the ESP32 affect the boot mode",
+]
+
+
+def configure_threads(num_threads: int = EMBEDDINGS_NUM_THREADS) -> None:
+    """Pin intra-op threads so embedding does not oversubscribe ingestion workers
+
+    Must run before the model is loaded; OpenMP reads its setting once.
+    """
+    if num_threads <= 0:
+        return
+
+    os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+
+def resolve_model_path(model_name: str = EMBEDDINGS_MODEL) -> str:
+    """Prefer locally installed weights so startup needs no network"""
+    local_model = EMBEDDINGS_MODELS_DIR / model_name
+    if local_model.is_dir():
+        return str(local_model)
+    return model_name
+
+
+def onnx_int8_file() -> str:
+    """Int8 ONNX graph for this CPU (EMBEDDINGS_ONNX_INT8_FILE overrides it)"""
+    if EMBEDDINGS_ONNX_INT8_FILE:
+        return EMBEDDINGS_ONNX_INT8_FILE
+    arm = platform.machine().lower() in ("arm64", "aarch64")
+    return EMBEDDINGS_ONNX_INT8_FILES["arm64" if arm else "x86"]
+
+
+def _onnx_model_kwargs(num_threads: int, file_name: Optional[str] = None) -> Dict:
+    """Build SentenceTransformer kwargs for the ONNX Runtime backend"""
+    model_kwargs: Dict = {"provider": "CPUExecutionProvider"}
+    if file_name:
+        model_kwargs["file_name"] = file_name
+
+    if num_threads > 0:
+        import onnxruntime
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = num_threads
+        session_options.inter_op_num_threads = 1
+        model_kwargs["session_options"] = session_options
+
+    return {"device": "cpu", "backend": "onnx", "model_kwargs": model_kwargs}
+
+
+def create_embeddings(backend: str = EMBEDDINGS_BACKEND, num_threads: int = EMBEDDINGS_NUM_THREADS,
+                      model_name: str = EMBEDDINGS_MODEL):
+    """Create HuggingFace embeddings running on the selected CPU backend
+
+    Args:
+        backend: "torch" (reference), "onnx" or "onnx-int8" (the model's prebuilt
+            int8 graph for this CPU, see onnx_int8_file)
+        num_threads: Intra-op threads for the runtime (0 keeps the library default)
+        model_name: Sentence-transformers model name or local path
+
+    Returns:
+        LangChain embeddings instance
+    """
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend: {backend}. Must be one of: {', '.join(EMBEDDING_BACKENDS)}")
+
+    configure_threads(num_threads)
+
+    if backend == "torch":
+        model_kwargs = {"device": "cpu"}
+    elif backend == "onnx":
+        model_kwargs = _onnx_model_kwargs(num_threads)
+    else:
+        model_kwargs = _onnx_model_kwargs(num_threads, onnx_int8_file())
+
+    model_path = resolve_model_path(model_name)
+    if Path(model_path).is_dir():
+        # Only this model load stays offline; other Hugging Face downloads in the process are unaffected
+        model_kwargs["local_files_only"] = True
+    return HuggingFaceEmbeddings(model_name=model_path, model_kwargs=model_kwargs)
+
+
+_shared_embeddings = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_embeddings():
+    """Process-wide embeddings: the shared embedding service if running, else one local model
+
+    The knowledge base and the semantic catalog both use this instance, so
+    the model weights are loaded once per process.
+    """
+    global _shared_embeddings
+    with _shared_lock:
+        if _shared_embeddings is None:
+            from src.tools.embedding_service import EmbeddingServiceClient, embedding_service_available
+
+            if embedding_service_available(EMBEDDING_SERVICE_SOCKET):
+                _shared_embeddings = EmbeddingServiceClient(EMBEDDING_SERVICE_SOCKET)
+            else:
+                _shared_embeddings = create_embeddings()
+    return _shared_embeddings
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def check_backend_parity(backend: str = EMBEDDINGS_BACKEND, texts: List[str] = None,
+                         reference: str = "torch") -> Dict:
+    """Compare a backend's embeddings against the reference backend
+
+    Args:
+        backend: Backend under test
+        texts: Texts to embed (defaults to PARITY_SAMPLE_TEXTS)
+        reference: Backend treated as ground truth
+
+    Returns:
+        Dict with mean/min cosine agreement and nearest-neighbor agreement
+    """
+    texts = texts or PARITY_SAMPLE_TEXTS
+
+    ref_vectors = create_embeddings(reference).embed_documents(texts)
+    test_vectors = create_embeddings(backend).embed_documents(texts)
+
+    cosines = [_cosine(r, t) for r, t in zip(ref_vectors, test_vectors)]
+
+    # Nearest neighbor of each text among the others should not change
+    def nearest(vectors: List[List[float]], i: int) -> int:
+        scores = [(_cosine(vectors[i], v), j) for j, v in enumerate(vectors) if j != i]
+        return max(scores)[1]
+
+    neighbor_matches = sum(nearest(ref_vectors, i) == nearest(test_vectors, i) for i in range(len(texts)))
+
+    return {
+        "backend": backend,
+        "reference": reference,
+        "samples": len(texts),
+        "mean_cosine": sum(cosines) / len(cosines),
+        "min_cosine": min(cosines),
+        "neighbor_agreement": neighbor_matches / len(texts)
+    }
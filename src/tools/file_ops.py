@@ -0,0 +1,164 @@
+"""Bounded file operations for file_operations_tool
+
+Every path resolves inside FILE_OPS_ROOT (symlinks included). Reads return
+a page of lines capped at FILE_READ_MAX_CHARS, listings a page of sorted
+entries, and writes accept one chunk per call so large files are streamed
+with "write" followed by "append". No call reads a whole file or directory
+into memory.
+"""
+
+import heapq
+import os
+from pathlib import Path
+from typing import Dict, Iterator, TextIO
+
+from src.config import (
+    FILE_OPS_ROOT, FILE_READ_DEFAULT_LINES, FILE_READ_MAX_CHARS, FILE_WRITE_MAX_CHARS, FILE_LIST_PAGE_SIZE
+)
+
+TRUNCATION_MARKER = "\n[... line {line} truncated, {remaining} more characters not shown ...]\n"
+
+
+class OutsideRootError(ValueError):
+    """A path resolves outside FILE_OPS_ROOT"""
+
+
+def resolve_path(file_path: str, root: Path = FILE_OPS_ROOT) -> Path:
+    """Absolute path inside the root; relative paths are taken from the root
+
+    Raises:
+        OutsideRootError: If the path (after resolving symlinks and "..") leaves the root
+    """
+    root = Path(root).resolve()
+    path = (root / file_path).resolve()
+    if path != root and root not in path.parents:
+        raise OutsideRootError(f"Path {file_path} is outside the allowed directory {root}")
+    return path
+
+
+def _relative(path: Path, root: Path) -> str:
+    return path.relative_to(root).as_posix() or "."
+
+
+def _finish_line(f: TextIO, line: str) -> int:
+    """Consume the rest of a line read in part; returns the characters skipped"""
+    skipped = 0
+    while line and not line.endswith(("\n", "\r")):
+        line = f.readline(FILE_READ_MAX_CHARS + 1)
+        skipped += len(line)
+    return skipped
+
+
+def read_page(file_path: str, offset: int = 0, limit: int = 0, root: Path = FILE_OPS_ROOT) -> Dict:
+    """Read up to `limit` lines starting at line `offset` (0-based)
+
+    Lines are read in pieces of at most FILE_READ_MAX_CHARS + 1 characters,
+    so a file with one huge line costs no more memory than a short one.
+
+    Returns:
+        Dict with "content", "offset", "lines" (returned), "next_offset"
+        (None at the end of the file) and "truncated" (content was capped)
+    """
+    path = resolve_path(file_path, root)
+    if not path.is_file():
+        return {"error": f"File {file_path} not found"}
+
+    offset, limit = max(0, offset), limit if limit > 0 else FILE_READ_DEFAULT_LINES
+    budget = FILE_READ_MAX_CHARS
+    parts = []
+    line_number = offset
+    truncated = False
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        for _ in range(offset):
+            line = f.readline(FILE_READ_MAX_CHARS + 1)
+            if not line:
+                break
+            _finish_line(f, line)
+        while line_number < offset + limit:
+            line = f.readline(budget + 1)
+            if not line:
+                break
+            if len(line) > budget:
+                remaining = len(line) - budget + _finish_line(f, line)
+                parts.append(line[:budget])
+                parts.append(TRUNCATION_MARKER.format(line=line_number + 1, remaining=remaining))
+                line_number += 1
+                truncated = True
+                break
+            parts.append(line)
+            budget -= len(line)
+            line_number += 1
+        more = f.readline(FILE_READ_MAX_CHARS + 1) != ""
+
+    return {
+        "success": True,
+        "content": "".join(parts),
+        "offset": offset,
+        "lines": line_number - offset,
+        "next_offset": line_number if more else None,
+        "truncated": truncated,
+    }
+
+
+def write_chunk(file_path: str, content: str, append: bool = False, root: Path = FILE_OPS_ROOT) -> Dict:
+    """Write (or append) one chunk of at most FILE_WRITE_MAX_CHARS characters
+
+    A plain write replaces the file atomically; larger files are written as
+    a "write" of the first chunk followed by "append" calls.
+    """
+    if len(content) > FILE_WRITE_MAX_CHARS:
+        return {"error": f"Content is {len(content)} characters; write at most {FILE_WRITE_MAX_CHARS} per call "
+                         f"and add the rest with operation='append'"}
+    path = resolve_path(file_path, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if append:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(content)
+    else:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    return {
+        "success": True,
+        "message": f"{'Appended to' if append else 'File written to'} {file_path}",
+        "size": path.stat().st_size,
+    }
+
+
+def list_page(dir_path: str, pattern: str = "*", offset: int = 0, limit: int = 0,
+              root: Path = FILE_OPS_ROOT) -> Dict:
+    """One page of directory entries matching a glob, sorted by path
+
+    Patterns with "**" match recursively. Directories end with "/". Only
+    offset + limit entries are kept in memory while the directory is scanned.
+
+    Returns:
+        Dict with "files" (paths relative to the root), "total" matches and
+        "next_offset" (None on the last page)
+    """
+    root_path = Path(root).resolve()
+    path = resolve_path(dir_path, root_path)
+    if not path.is_dir():
+        return {"error": f"Directory {dir_path} not found"}
+
+    offset, limit = max(0, offset), min(limit, FILE_LIST_PAGE_SIZE) if limit > 0 else FILE_LIST_PAGE_SIZE
+    total = 0
+
+    def matches() -> Iterator[Path]:
+        nonlocal total
+        for entry in path.glob(pattern or "*"):
+            # Symlinks leading out of the root are not listed
+            if entry.resolve() == root_path or root_path in entry.resolve().parents:
+                total += 1
+                yield entry
+
+    page = heapq.nsmallest(offset + limit, matches())[offset:]
+    files = [_relative(entry.resolve(), root_path) + ("/" if entry.is_dir() else "") for entry in page]
+    return {
+        "success": True,
+        "files": files,
+        "total": total,
+        "offset": offset,
+        "next_offset": offset + len(files) if offset + len(files) < total else None,
+    }
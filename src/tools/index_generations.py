@@ -0,0 +1,245 @@
+"""Blue/green vector index generations with an atomically swapped alias"""
+
+import asyncio
+import os
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from src.config import (
+    CHROMA_DB_PATH, KNOWLEDGE_BASE_DIR, INDEX_REBUILD_MAX_FAIL_RATIO, INDEX_SWAP_GRACE_SECONDS
+)
+
+GENERATIONS_DIR = "generations"
+ALIAS_FILE = "CURRENT"
+LOCK_FILE = "REBUILD.lock"
+
+DEFAULT_VALIDATION_QUERIES = [
+    "Arduino setup and loop",
+    "ESP32 WiFi connection",
+    "Raspberry Pi GPIO",
+]
+
+
+def resolve_active_index(root: Path = CHROMA_DB_PATH) -> Path:
+    """Return the directory readers should open
+
+    Falls back to the root itself for indexes built before generations existed.
+    """
+    root = Path(root)
+    alias = root / ALIAS_FILE
+    if alias.exists():
+        active = root / GENERATIONS_DIR / alias.read_text(encoding="utf-8").strip()
+        if active.is_dir():
+            return active
+    return root
+
+
+def alias_version(root: Path = CHROMA_DB_PATH) -> int:
+    """Cheap change marker for the alias, compared by readers before each search"""
+    try:
+        return (Path(root) / ALIAS_FILE).stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def new_generation(root: Path = CHROMA_DB_PATH) -> Path:
+    """Create an empty directory for the next index generation"""
+    generation_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    path = Path(root) / GENERATIONS_DIR / generation_id
+    path.mkdir(parents=True)
+    return path
+
+
+def swap_active(generation: Path, root: Path = CHROMA_DB_PATH) -> Path:
+    """Point the alias at a generation in one atomic rename
+
+    Returns:
+        Directory that was active before the swap
+    """
+    root = Path(root)
+    previous = resolve_active_index(root)
+
+    tmp_alias = root / f"{ALIAS_FILE}.{os.getpid()}.tmp"
+    tmp_alias.write_text(generation.name, encoding="utf-8")
+    os.replace(tmp_alias, root / ALIAS_FILE)
+
+    return previous
+
+
+def remove_generation(path: Path, root: Path = CHROMA_DB_PATH) -> None:
+    """Delete a retired generation, or the legacy index files in the root"""
+    root = Path(root)
+    path = Path(path)
+
+    if path.resolve() == root.resolve():
+        # Legacy layout: the index lives directly in the root next to the generations
+        for entry in root.iterdir():
+            if entry.name in (GENERATIONS_DIR, ALIAS_FILE, LOCK_FILE) or entry.name.startswith(f"{ALIAS_FILE}."):
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink()
+    elif path.parent == root / GENERATIONS_DIR:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+async def activate_generation(generation: Path, root: Path = CHROMA_DB_PATH,
+                              grace_seconds: float = INDEX_SWAP_GRACE_SECONDS) -> None:
+    """Swap readers over to a generation and retire the previous one
+
+    The previous generation is deleted after grace_seconds so in-flight
+    searches finish. Callers hold rebuild_lock for the whole step.
+
+    Args:
+        generation: Validated generation to make active
+        root: Index root holding the alias and generations
+        grace_seconds: Delay before the previous generation is deleted
+    """
+    previous = swap_active(generation, root)
+
+    if previous.resolve() != generation.resolve():
+        if grace_seconds > 0:
+            await asyncio.sleep(grace_seconds)
+        remove_generation(previous, root)
+
+
+@contextmanager
+def rebuild_lock(root: Path = CHROMA_DB_PATH) -> Iterator[bool]:
+    """Hold the exclusive rebuild lock of an index root, without waiting
+
+    The lock is an OS file lock on LOCK_FILE, so it is released when the
+    holder exits, even if it crashes.
+
+    Yields:
+        True if the lock was taken, False if another rebuild holds it
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / LOCK_FILE, "a+b") as f:
+        try:
+            if os.name == "nt":
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            locked = True
+        except OSError:
+            locked = False
+        # Closing the file releases the lock
+        yield locked
+
+
+def rebuild_running(root: Path = CHROMA_DB_PATH) -> bool:
+    """Check whether a rebuild currently holds the lock of an index root"""
+    with rebuild_lock(root) as locked:
+        return not locked
+
+
+async def rebuild_index(directory_path: str = None, validation_queries: List[str] = None,
+                        grace_seconds: float = INDEX_SWAP_GRACE_SECONDS,
+                        root: Path = CHROMA_DB_PATH) -> Dict:
+    """Build a new index generation, validate it and swap readers over to it
+
+    The live index keeps serving searches until the swap. The previous
+    generation is deleted after grace_seconds so in-flight searches finish.
+    Only one rebuild per index root runs at a time; a second one returns
+    at once with success False.
+
+    Args:
+        directory_path: Knowledge base to ingest (defaults to KNOWLEDGE_BASE_DIR)
+        validation_queries: Queries that must return results before swapping
+        grace_seconds: Delay before the previous generation is deleted
+        root: Index root holding the alias and generations
+
+    Returns:
+        Dict with success status, counts and the new generation path
+    """
+    with rebuild_lock(root) as locked:
+        if not locked:
+            return {"success": False, "message": "⚠️ Index rebuild already running; try again when it finishes"}
+        return await _build_and_swap(directory_path, validation_queries, grace_seconds, root)
+
+
+async def _build_and_swap(directory_path: str, validation_queries: List[str], grace_seconds: float,
+                          root: Path) -> Dict:
+    """Body of rebuild_index, run while holding the rebuild lock"""
+    from src.tools.base import EmbeddedSystemsTools
+
+    directory_path = directory_path or str(KNOWLEDGE_BASE_DIR)
+    validation_queries = validation_queries or DEFAULT_VALIDATION_QUERIES
+
+    generation = new_generation(root)
+    try:
+        builder = EmbeddedSystemsTools(directory_path, index_path=str(generation))
+
+        def discard(message: str) -> Dict:
+            shutil.rmtree(generation, ignore_errors=True)
+            return {"success": False, "message": message}
+
+        if builder.vectorstore is None:
+            return discard("❌ Could not open the new index generation")
+
+        success, fail, errors = await builder.ingest_directory(directory_path, recursive=True)
+
+        # Validate before any reader can see the new generation
+        chunk_count = builder.vectorstore._collection.count()
+        if chunk_count == 0:
+            return discard("❌ Rebuild produced an empty index; keeping the current one")
+
+        total = success + fail
+        if total and fail / total > INDEX_REBUILD_MAX_FAIL_RATIO:
+            return discard(f"❌ {fail}/{total} files failed to ingest; keeping the current one")
+
+        for query in validation_queries:
+            results = builder.search_knowledge(query, k=1)
+            if not results or results[0].get("source") == "N/A":
+                return discard(f"❌ Validation query returned no results: {query!r}")
+    except BaseException:
+        # A failed build never leaves a half-built generation behind
+        shutil.rmtree(generation, ignore_errors=True)
+        raise
+
+    await activate_generation(generation, root, grace_seconds)
+
+    return {
+        "success": True,
+        "message": f"✅ Rebuilt index with {chunk_count} chunks from {success} files",
+        "generation": str(generation),
+        "chunk_count": chunk_count,
+        "success_count": success,
+        "fail_count": fail,
+        "errors": errors
+    }
+
+
+def start_rebuild(directory_path: str = None, validation_queries: List[str] = None,
+                  on_complete=None) -> threading.Thread:
+    """Run rebuild_index in a background thread
+
+    Args:
+        directory_path: Knowledge base to ingest
+        validation_queries: Queries that must return results before swapping
+        on_complete: Optional callback receiving the result dict
+
+    Returns:
+        The started thread
+    """
+    def run():
+        try:
+            result = asyncio.run(rebuild_index(directory_path, validation_queries))
+        except Exception as e:
+            result = {"success": False, "message": f"❌ Rebuild failed: {e}"}
+        if on_complete:
+            on_complete(result)
+
+    thread = threading.Thread(target=run, name="index-rebuild", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,212 @@
+"""Portable knowledge-base bundles: vector index, manifest and model weights"""
+
+import asyncio
+import json
+import shutil
+import tarfile
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from src import __version__
+from src.config import (
+    CHROMA_DB_PATH, EMBEDDINGS_MODEL, EMBEDDINGS_BACKEND, EMBEDDINGS_ONNX_INT8_FILE,
+    EMBEDDINGS_ONNX_INT8_FILES, EMBEDDINGS_MODELS_DIR, EMBEDDINGS_DIMENSIONS, EMBEDDINGS_REDUCTION,
+    INDEX_SWAP_GRACE_SECONDS
+)
+from src.tools.index_generations import (
+    resolve_active_index, new_generation, activate_generation, rebuild_lock,
+    ALIAS_FILE, GENERATIONS_DIR, LOCK_FILE
+)
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_INFO_FILE = "bundle.json"
+
+
+def _model_files_patterns() -> list:
+    """Files needed to run the configured backend offline"""
+    patterns = ["*.json", "*.txt", "1_Pooling/*", "*.safetensors"]
+    if EMBEDDINGS_BACKEND == "onnx":
+        patterns.append("onnx/model.onnx")
+    elif EMBEDDINGS_BACKEND == "onnx-int8":
+        # Every CPU family's graph, so the bundle runs wherever it is imported
+        files = set(EMBEDDINGS_ONNX_INT8_FILES.values())
+        if EMBEDDINGS_ONNX_INT8_FILE:
+            files.add(EMBEDDINGS_ONNX_INT8_FILE)
+        patterns.extend(sorted(files))
+    return patterns
+
+
+def _stage_model(target: Path) -> None:
+    """Copy the embedding model weights into target"""
+    local_model = EMBEDDINGS_MODELS_DIR / EMBEDDINGS_MODEL
+    if local_model.is_dir():
+        shutil.copytree(local_model, target)
+        return
+
+    from huggingface_hub import snapshot_download
+
+    repo_id = EMBEDDINGS_MODEL if "/" in EMBEDDINGS_MODEL else f"sentence-transformers/{EMBEDDINGS_MODEL}"
+    snapshot_download(repo_id=repo_id, local_dir=str(target), allow_patterns=_model_files_patterns())
+
+
+def export_bundle(output_path: str, include_model: bool = True) -> Dict:
+    """Pack the active index, its ingestion manifest and the model into one artifact
+
+    Args:
+        output_path: Bundle file to write (.tar.gz)
+        include_model: Whether to include embedding model weights
+
+    Returns:
+        Dict with success status and bundle metadata
+    """
+    index_dir = resolve_active_index(CHROMA_DB_PATH)
+    if not any(index_dir.glob("*.sqlite3")):
+        return {"success": False, "message": f"❌ No index found in {index_dir}"}
+
+    info = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "app_version": __version__,
+        "created": datetime.now().isoformat(),
+        "embeddings_model": EMBEDDINGS_MODEL,
+        "embeddings_backend": EMBEDDINGS_BACKEND,
+        "embeddings_dimensions": EMBEDDINGS_DIMENSIONS,
+        "embeddings_reduction": EMBEDDINGS_REDUCTION if EMBEDDINGS_DIMENSIONS else None,
+        "includes_model": include_model
+    }
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as staging:
+        staging = Path(staging)
+        (staging / BUNDLE_INFO_FILE).write_text(json.dumps(info, indent=2), encoding="utf-8")
+
+        # Skip nested generations when the active index is the legacy root
+        ignore = shutil.ignore_patterns("generations", ALIAS_FILE, f"{ALIAS_FILE}.*", LOCK_FILE)
+        shutil.copytree(index_dir, staging / "index", ignore=ignore)
+
+        if include_model:
+            _stage_model(staging / "model")
+
+        with tarfile.open(output, "w:gz") as tar:
+            for entry in sorted(staging.iterdir()):
+                tar.add(entry, arcname=entry.name)
+
+    return {"success": True, "message": f"✅ Exported knowledge base bundle to {output}", "info": info}
+
+
+def read_bundle_info(bundle_path: str) -> Dict:
+    """Read bundle.json without extracting the whole artifact"""
+    with tarfile.open(bundle_path, "r:*") as tar:
+        member = tar.extractfile(BUNDLE_INFO_FILE)
+        if member is None:
+            raise ValueError(f"{bundle_path} is not a knowledge base bundle")
+        return json.load(member)
+
+
+def _model_target(model_name) -> Optional[Path]:
+    """Model store directory for a bundle's model name, or None if the name is unsafe"""
+    if not isinstance(model_name, str) or not model_name:
+        return None
+    name = Path(model_name)
+    if name.is_absolute() or ".." in name.parts:
+        return None
+    store = EMBEDDINGS_MODELS_DIR.resolve()
+    target = (EMBEDDINGS_MODELS_DIR / name).resolve()
+    return target if store in target.parents else None
+
+
+def import_bundle(bundle_path: str, force: bool = False, if_empty: bool = False,
+                  grace_seconds: float = INDEX_SWAP_GRACE_SECONDS) -> Dict:
+    """Install a bundle as the active index generation, with no embedding work
+
+    Holds the rebuild lock, so an import and a rebuild never swap the
+    alias at the same time.
+
+    Args:
+        bundle_path: Bundle created by export_bundle
+        force: Import even if the bundle was built with a different model
+        if_empty: Only import when no index is present yet
+        grace_seconds: Delay before the previous generation is deleted
+
+    Returns:
+        Dict with success status and message
+    """
+    with rebuild_lock(CHROMA_DB_PATH) as locked:
+        if not locked:
+            return {"success": False, "message": "⚠️ Index rebuild already running; try again when it finishes"}
+        return _install_bundle(bundle_path, force, if_empty, grace_seconds)
+
+
+def _install_bundle(bundle_path: str, force: bool, if_empty: bool, grace_seconds: float) -> Dict:
+    """Body of import_bundle, run while holding the rebuild lock"""
+    if if_empty and any(resolve_active_index(CHROMA_DB_PATH).glob("*.sqlite3")):
+        return {"success": True, "message": "✅ Index already present; bundle import skipped"}
+
+    try:
+        info = read_bundle_info(bundle_path)
+    except (OSError, KeyError, ValueError, tarfile.TarError) as e:
+        return {"success": False, "message": f"❌ Invalid bundle: {e}"}
+
+    if info.get("format_version") != BUNDLE_FORMAT_VERSION:
+        return {"success": False, "message": f"❌ Unsupported bundle format: {info.get('format_version')}"}
+
+    model_name = info.get("embeddings_model")
+    if not model_name:
+        return {"success": False, "message": "❌ Invalid bundle: embeddings_model is missing"}
+    # The name becomes a path that is replaced, so it must stay inside the model store
+    target = _model_target(model_name)
+    if target is None:
+        return {"success": False, "message": f"❌ Invalid bundle: unsafe embeddings_model {model_name!r}"}
+
+    if not force:
+        mismatched = [
+            key for key, value in (
+                ("embeddings_model", EMBEDDINGS_MODEL),
+                ("embeddings_dimensions", EMBEDDINGS_DIMENSIONS),
+            ) if info.get(key) != value
+        ]
+        if mismatched:
+            return {
+                "success": False,
+                "message": f"❌ Bundle does not match config ({', '.join(mismatched)}); use --force to import anyway"
+            }
+
+    # Stage next to the generations so the index can be renamed into place on the same filesystem
+    staging_root = CHROMA_DB_PATH / GENERATIONS_DIR
+    staging_root.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=staging_root, prefix=".import-") as staging:
+        staging = Path(staging)
+        try:
+            with tarfile.open(bundle_path, "r:*") as tar:
+                tar.extractall(staging, filter="data")
+        except (OSError, tarfile.TarError) as e:
+            return {"success": False, "message": f"❌ Invalid bundle: {e}"}
+
+        # Check the layout before a generation directory or the model store is touched
+        index_dir = staging / "index"
+        if not index_dir.is_dir() or not any(index_dir.glob("*.sqlite3")):
+            return {"success": False, "message": "❌ Invalid bundle: no index/ directory with a vector store"}
+        model_dir = staging / "model"
+        if model_dir.exists() and not model_dir.is_dir():
+            return {"success": False, "message": "❌ Invalid bundle: model/ is not a directory"}
+
+        generation = new_generation(CHROMA_DB_PATH)
+        generation.rmdir()
+        index_dir.rename(generation)
+
+        if model_dir.is_dir():
+            if target.exists():
+                shutil.rmtree(target)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(model_dir), str(target))
+
+    asyncio.run(activate_generation(generation, CHROMA_DB_PATH, grace_seconds))
+
+    return {
+        "success": True,
+        "message": f"✅ Imported bundle built {info.get('created', 'unknown')} ({model_name})",
+        "generation": str(generation)
+    }
@@ -0,0 +1,207 @@
+"""Concurrent page fetching and main-text extraction for web search hits
+
+Pages are fetched over one pooled keep-alive requests.Session, at most
+PAGE_FETCH_PER_HOST at a time per host, and cached on disk by URL. Cached
+pages older than PAGE_CACHE_FRESH_SECONDS are revalidated with
+If-None-Match / If-Modified-Since, so unchanged pages cost a 304.
+"""
+
+import codecs
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from src.config import (
+    WEB_CACHE_DIR, PAGE_FETCH_CONCURRENCY, PAGE_FETCH_PER_HOST, PAGE_FETCH_TIMEOUT,
+    PAGE_FETCH_MAX_BYTES, PAGE_CACHE_FRESH_SECONDS, PAGE_TEXT_MAX_CHARS
+)
+
+USER_AGENT = "EmbeddedSystemsAgent/1.0"
+
+# Elements that never hold the main content
+_BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "svg", "iframe"]
+
+
+def _main_text(soup, max_chars: int) -> str:
+    for tag in soup(_BOILERPLATE_TAGS):
+        tag.decompose()
+    root = soup.find("article") or soup.find("main") or soup.find(attrs={"role": "main"}) or soup.body or soup
+    lines = (re.sub(r"\s+", " ", line).strip() for line in root.get_text("\n").splitlines())
+    return "\n".join(line for line in lines if line)[:max_chars]
+
+
+def extract_main_text(html: str, max_chars: int = PAGE_TEXT_MAX_CHARS) -> Tuple[str, str]:
+    """Title and main text of an HTML page
+
+    Uses <article>, <main> or role="main" when present, else <body>, with
+    navigation, scripts and other boilerplate removed.
+    """
+    title, text, _ = parse_html(html, "", max_chars)
+    return title, text
+
+
+def parse_html(html: str, base_url: str, max_chars: int = PAGE_TEXT_MAX_CHARS) -> Tuple[str, str, List[str]]:
+    """Title, main text and absolute http(s) links (without fragments) of a page
+
+    Links are collected before boilerplate removal, so navigation menus count.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    links = []
+    if base_url:
+        for anchor in soup.find_all("a", href=True):
+            link = urldefrag(urljoin(base_url, anchor["href"].strip()))[0]
+            if link.startswith(("http://", "https://")):
+                links.append(link)
+    return title, _main_text(soup, max_chars), links
+
+
+class PageCache:
+    """Extracted pages on disk, one JSON file per URL"""
+
+    def __init__(self, cache_dir: Path = WEB_CACHE_DIR / "pages"):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url: str, page: Dict) -> None:
+        path = self._path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(page, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # A failed cache write only costs a refetch next time
+
+
+class PageFetcher:
+    """Fetch and extract pages concurrently over a pooled HTTP session"""
+
+    def __init__(self, concurrency: int = PAGE_FETCH_CONCURRENCY, per_host: int = PAGE_FETCH_PER_HOST,
+                 timeout=PAGE_FETCH_TIMEOUT, cache: PageCache = None,
+                 fresh_seconds: float = PAGE_CACHE_FRESH_SECONDS, max_bytes: int = PAGE_FETCH_MAX_BYTES):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = USER_AGENT
+
+        self.timeout = timeout
+        self.per_host = per_host
+        self.cache = cache or PageCache()
+        self.fresh_seconds = fresh_seconds
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="page-fetch")
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def download(self, url: str, headers: Dict = None):
+        """GET with the per-host limit and a size cap; returns (response, body or None for 304)"""
+        with self._slot(url):
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            try:
+                if response.status_code == 304:
+                    return response, None
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) >= self.max_bytes:
+                        break
+                return response, bytes(body[:self.max_bytes])
+            finally:
+                response.close()
+
+    def fetch(self, url: str) -> Dict:
+        """Fetch one page; returns url, title, text and source, or url and error"""
+        cached = self.cache.get(url)
+        if cached and time.time() - cached["fetched"] < self.fresh_seconds:
+            return dict(cached, source="cache")
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            response, body = self.download(url, headers)
+        except Exception as e:
+            if cached:
+                return dict(cached, source="cache")
+            return {"url": url, "error": str(e)}
+
+        if body is None:
+            if not cached:
+                return {"url": url, "error": "Not modified, but the page is not cached"}
+            page = dict(cached, fetched=time.time())
+            self.cache.set(url, page)
+            return dict(page, source="revalidated")
+
+        content_type = response.headers.get("Content-Type", "")
+        if "html" not in content_type and "text" not in content_type:
+            return {"url": url, "error": f"Unsupported content type: {content_type or 'unknown'}"}
+
+        encoding = (response.encoding if "charset" in content_type.lower() else None) or "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"  # Unknown charset label; most pages are UTF-8 anyway
+        title, text = extract_main_text(body.decode(encoding, errors="replace"))
+        page = {
+            "url": url,
+            "title": title,
+            "text": text,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched": time.time()
+        }
+        self.cache.set(url, page)
+        return dict(page, source="network")
+
+    def fetch_many(self, urls: List[str]) -> List[Dict]:
+        """Fetch pages concurrently; results keep the order of urls"""
+        return list(self.executor.map(self.fetch, urls))
+
+
+_fetcher: Optional[PageFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_page_fetcher() -> PageFetcher:
+    """Process-wide fetcher, so every caller shares the connection pool"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = PageFetcher()
+    return _fetcher
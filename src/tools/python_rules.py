@@ -0,0 +1,304 @@
+"""AST analysis of Raspberry Pi Python scripts
+
+The script is parsed once. A visitor records imports, the pins used through
+RPi.GPIO and gpiozero, and where GPIO.cleanup() runs; the pins are then
+checked against the raspberry_pi pin table, in BCM or physical numbering as
+selected with GPIO.setmode. Findings are memoized per source, so validating
+the same generated code again (e.g. on a Streamlit rerun) is a cache hit.
+
+Findings use the format of src.tools.cpp_rules.
+"""
+
+import ast
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from src.data import get_index, load_dataset
+from src.data.pins import board_pin_map, check_pin_assignment
+from src.tools.cpp_rules import MAX_LINE_LENGTH
+
+GPIO_MODULE = "RPi.GPIO"
+GPIOZERO_MODULE = "gpiozero"
+
+# RPi.GPIO functions that use a pin set up earlier, and the direction they need
+GPIO_PIN_USES = {
+    "output": "OUT",
+    "PWM": "OUT",
+    "input": None,
+    "add_event_detect": "IN",
+    "remove_event_detect": "IN",
+    "event_detected": "IN",
+    "wait_for_edge": "IN",
+    "add_event_callback": "IN",
+}
+
+# gpiozero keyword arguments that take a pin
+GPIOZERO_PIN_KEYWORDS = {"pin", "echo", "trigger", "red", "green", "blue", "forward", "backward", "enable",
+                         "clock_pin", "mosi_pin", "miso_pin", "select_pin", "a", "b"}
+
+ANALYSIS_CACHE_SIZE = 256
+
+
+def _finding(rule_name: str, severity: str, message: str, node: Optional[ast.AST] = None) -> Dict:
+    line = getattr(node, "lineno", None)
+    column = node.col_offset + 1 if line is not None else None
+    return {"rule": rule_name, "severity": severity, "message": message, "line": line, "column": column}
+
+
+class _ScriptVisitor(ast.NodeVisitor):
+    """Collects imports, names, pin usage and cleanup placement in one walk"""
+
+    def __init__(self):
+        self.imports: Dict[str, Tuple[str, ast.AST]] = {}  # Bound name -> (module path, node)
+        self.loaded_names: Dict[str, ast.AST] = {}  # Name -> first load
+        self.constants: Dict[str, object] = {}  # Module-level NAME = <int or list of ints>
+        self.gpio_calls: List[Tuple[str, ast.Call]] = []
+        self.devices: List[Tuple[str, ast.Call]] = []  # gpiozero class, call
+        self.cleanups: List[Tuple[ast.Call, bool]] = []  # call, runs on every exit
+        self.has_endless_loop = False
+        self._guarded = 0  # Depth of finally blocks and exception handlers
+
+    # Imports and names
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            bound = alias.asname or alias.name.split(".")[0]
+            self.imports[bound] = (alias.name if alias.asname else bound, node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module == "__future__":
+            return
+        for alias in node.names:
+            self.imports[alias.asname or alias.name] = (f"{node.module}.{alias.name}", node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load):
+            self.loaded_names.setdefault(node.id, node)
+
+    def visit_Module(self, node: ast.Module) -> None:
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1 \
+                    and isinstance(statement.targets[0], ast.Name):
+                name = statement.targets[0].id
+                value = self._literal_pins(statement.value)
+                # A name bound twice is not a constant
+                self.constants[name] = value if name not in self.constants else None
+        self.generic_visit(node)
+
+    # Control flow that matters for cleanup
+
+    def visit_Try(self, node: ast.Try) -> None:
+        for statement in node.body + node.orelse:
+            self.visit(statement)
+        self._guarded += 1
+        for child in node.handlers + node.finalbody:
+            self.visit(child)
+        self._guarded -= 1
+
+    visit_TryStar = visit_Try
+
+    def visit_While(self, node: ast.While) -> None:
+        if isinstance(node.test, ast.Constant) and node.test.value:
+            self.has_endless_loop = True
+        self.generic_visit(node)
+
+    # Calls
+
+    def resolve(self, node: ast.AST) -> Optional[str]:
+        """Dotted module path a name or attribute refers to through the imports"""
+        if isinstance(node, ast.Name):
+            imported = self.imports.get(node.id)
+            return imported[0] if imported else None
+        if isinstance(node, ast.Attribute):
+            base = self.resolve(node.value)
+            return f"{base}.{node.attr}" if base else None
+        return None
+
+    def visit_Call(self, node: ast.Call) -> None:
+        target = self.resolve(node.func)
+        if target and target.startswith(GPIO_MODULE + "."):
+            function = target[len(GPIO_MODULE) + 1:]
+            self.gpio_calls.append((function, node))
+            if function == "cleanup":
+                self.cleanups.append((node, self._guarded > 0))
+        elif target and target.startswith(GPIOZERO_MODULE + "."):
+            self.devices.append((target[len(GPIOZERO_MODULE) + 1:], node))
+        elif target == "atexit.register" and node.args and self.resolve(node.args[0]) == f"{GPIO_MODULE}.cleanup":
+            self.cleanups.append((node, True))
+        self.generic_visit(node)
+
+    def _literal_pins(self, node: ast.AST):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, str)) and not isinstance(node.value, bool):
+            return node.value
+        if isinstance(node, (ast.List, ast.Tuple)):
+            values = [self._literal_pins(element) for element in node.elts]
+            return values if all(v is not None and not isinstance(v, list) for v in values) else None
+        return None
+
+    def pins(self, node: ast.AST) -> List:
+        """Pin numbers (or gpiozero pin strings) an argument evaluates to; empty if unknown"""
+        value = self._literal_pins(node)
+        if value is None and isinstance(node, ast.Name):
+            value = self.constants.get(node.id)
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+
+class _PinResolver:
+    """Maps pin numbers in a script to pin-table names"""
+
+    def __init__(self, numbering: str):
+        self.table = get_index("pinouts")["pins"]["raspberry_pi"]
+        self.board = board_pin_map(load_dataset("pinouts")["raspberry_pi"])
+        self.numbering = numbering
+
+    def resolve(self, pin, numbering: Optional[str] = None) -> Tuple[Optional[str], str]:
+        """(pin-table name or None, how the script refers to it)"""
+        numbering = numbering or self.numbering
+        if isinstance(pin, str):  # gpiozero: "GPIO17", "BOARD11", "17"
+            text = pin.upper()
+            if text.startswith("BOARD") and text[5:].isdigit():
+                return self.resolve(int(text[5:]), "BOARD")
+            digits = text[4:] if text.startswith("GPIO") else text
+            if not digits.isdigit():
+                return None, pin
+            pin, numbering = int(digits), "BCM"
+        if numbering == "BOARD":
+            name = self.board.get(pin)
+            return (name if name in self.table else None), f"physical pin {pin}"
+        name = f"GPIO{pin}"
+        return (name if name in self.table else None), name
+
+
+def _check_imports(visitor: _ScriptVisitor) -> List[Dict]:
+    findings = []
+    gpio_use = visitor.loaded_names.get("GPIO")
+    if gpio_use is not None and "GPIO" not in visitor.imports:
+        findings.append(_finding("gpio-import", "warning", "Using GPIO without importing RPi.GPIO", gpio_use))
+    for bound, (module, node) in visitor.imports.items():
+        if bound not in visitor.loaded_names:
+            findings.append(_finding("unused-import", "warning", f"'{module}' is imported but never used", node))
+    return findings
+
+
+def _check_rpi_gpio(visitor: _ScriptVisitor) -> Tuple[List[Dict], Dict[str, str]]:
+    """Findings for RPi.GPIO usage, and the pins it sets up (pin -> owner)"""
+    findings = []
+    modes = {}
+    for function, call in visitor.gpio_calls:
+        if function == "setmode" and call.args and isinstance(call.args[0], ast.Attribute):
+            modes.setdefault(call.args[0].attr, call)
+    if len(modes) > 1:
+        findings.append(_finding("gpio-mode", "error", "GPIO.setmode() is called with both BCM and BOARD",
+                                 list(modes.values())[1]))
+    resolver = _PinResolver(next(iter(modes), "BCM"))
+
+    setups: Dict[str, List[Tuple[str, ast.Call]]] = {}  # Pin name -> (direction, call)
+    uses: Dict[str, List[Tuple[str, ast.Call]]] = {}  # Pin name -> (function, call)
+    labels: Dict[str, str] = {}
+    for function, call in visitor.gpio_calls:
+        if (function != "setup" and function not in GPIO_PIN_USES) or not call.args:
+            continue
+        if function == "setup" and not modes:
+            findings.append(_finding("gpio-mode", "error", "GPIO.setmode(GPIO.BCM) must be called before GPIO.setup()",
+                                     call))
+            modes["BCM"] = call  # Report once
+        for pin in visitor.pins(call.args[0]):
+            name, label = resolver.resolve(pin)
+            if name is None:
+                findings.append(_finding("gpio-pin", "error",
+                                         f"{label} is not a GPIO pin on the Raspberry Pi header", call))
+                continue
+            labels[name] = label
+            if function == "setup":
+                direction = call.args[1].attr if len(call.args) > 1 and isinstance(call.args[1], ast.Attribute) else ""
+                setups.setdefault(name, []).append((direction, call))
+            else:
+                uses.setdefault(name, []).append((function, call))
+
+    for name, entries in setups.items():
+        directions = {direction for direction, _ in entries if direction}
+        if len(directions) > 1:
+            findings.append(_finding("gpio-conflict", "warning",
+                                     f"{labels[name]} is set up as both input and output", entries[-1][1]))
+        if name not in uses:
+            findings.append(_finding("gpio-unused", "warning", f"{labels[name]} is set up but never used",
+                                     entries[0][1]))
+        purpose = {"OUT": "output", "IN": "input"}.get(next(iter(directions), ""), "")
+        for conflict in check_pin_assignment(resolver.table, {name: purpose}):
+            findings.append(_finding("gpio-pin", "warning", conflict, entries[0][1]))
+
+    for name, entries in uses.items():
+        function, call = entries[0]
+        if name not in setups:
+            findings.append(_finding("gpio-setup", "error", f"GPIO.{function}() on {labels[name]} without GPIO.setup()",
+                                     call))
+            continue
+        directions = {direction for direction, _ in setups[name]}
+        for function, call in entries:
+            needed = GPIO_PIN_USES[function]
+            if needed and directions == {"IN" if needed == "OUT" else "OUT"}:
+                kind = "an input" if needed == "OUT" else "an output"
+                findings.append(_finding("gpio-conflict", "error",
+                                         f"GPIO.{function}() on {labels[name]}, which is set up as {kind}", call))
+                break
+
+    if visitor.gpio_calls:
+        if not visitor.cleanups:
+            findings.append(_finding("gpio-cleanup", "suggestion",
+                                     "Consider adding GPIO.cleanup() for proper resource cleanup"))
+        elif visitor.has_endless_loop and not any(guarded for _, guarded in visitor.cleanups):
+            findings.append(_finding("gpio-cleanup", "suggestion",
+                                     "GPIO.cleanup() is skipped when the loop is interrupted; call it in a finally block",
+                                     visitor.cleanups[0][0]))
+    return findings, {name: "RPi.GPIO" for name in setups}
+
+
+def _check_gpiozero(visitor: _ScriptVisitor, claimed: Dict[str, str]) -> List[Dict]:
+    findings = []
+    resolver = _PinResolver("BCM")  # gpiozero numbers pins BCM unless told otherwise
+    owners = dict(claimed)
+    for device, call in visitor.devices:
+        arguments = call.args[:1] + [kw.value for kw in call.keywords if kw.arg in GPIOZERO_PIN_KEYWORDS]
+        for argument in arguments:
+            for pin in visitor.pins(argument):
+                name, label = resolver.resolve(pin)
+                if name is None:
+                    findings.append(_finding("gpio-pin", "error",
+                                             f"{label} is not a GPIO pin on the Raspberry Pi header", call))
+                elif name in owners:
+                    findings.append(_finding("gpio-conflict", "error",
+                                             f"{label} is used by both {owners[name]} and {device}", call))
+                else:
+                    owners[name] = device
+    return findings
+
+
+def _check_line_lengths(code: str) -> List[Dict]:
+    return [
+        {"rule": "line-length", "severity": "warning", "message": f"Line is very long (>{MAX_LINE_LENGTH} chars)",
+         "line": number, "column": MAX_LINE_LENGTH + 1}
+        for number, line in enumerate(code.split("\n"), 1) if len(line.strip()) > MAX_LINE_LENGTH
+    ]
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def lint_python(code: str) -> Tuple[Dict, ...]:
+    """Findings for a Raspberry Pi Python script, memoized per source
+
+    Returns:
+        Findings ordered by position (findings without a position first);
+        treat them as read-only, they are shared between calls
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return ({"rule": "syntax", "severity": "error", "message": f"Python syntax error: {e.msg}",
+                 "line": e.lineno, "column": e.offset},)
+
+    visitor = _ScriptVisitor()
+    visitor.visit(tree)
+    gpio_findings, claimed = _check_rpi_gpio(visitor)
+    findings = _check_imports(visitor) + gpio_findings + _check_gpiozero(visitor, claimed) + _check_line_lengths(code)
+    return tuple(sorted(findings, key=lambda f: (f["line"] or 0, f["column"] or 0)))
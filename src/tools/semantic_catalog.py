@@ -0,0 +1,140 @@
+"""Semantic search over component and library descriptions
+
+Every component and library entry is embedded once and the normalized
+matrix is cached in DATA_CACHE_DIR, keyed by the dataset hashes and the
+embedding model. A lookup embeds the query and takes a dot product with
+that matrix; no network round-trip is involved.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.config import DATA_CACHE_DIR, EMBEDDINGS_MODEL
+from src.data import load_dataset, dataset_hash
+from src.data.library_index import library_id
+
+SEMANTIC_KINDS = ("components", "libraries")
+
+_index = None
+_lock = threading.Lock()
+
+
+def _entries() -> List[Tuple[str, str, str, str]]:
+    """(kind, platform, key, text) for every entry that gets an embedding
+
+    Libraries get one entry per platform they work on, keyed by library id.
+    """
+    entries = []
+    for key, info in load_dataset("components").items():
+        aliases = ", ".join(info.get("aliases", []))
+        text = f"{info['type']} ({key}): {info['description']}"
+        entries.append(("components", "", key, f"{text}. Also known as {aliases}" if aliases else text))
+    for home, libs in load_dataset("libraries").items():
+        for key, info in libs.items():
+            for platform in info.get("platforms", [home]):
+                text = f"{info['name']} library for {platform}: {info['description']}"
+                entries.append(("libraries", platform, library_id(home, key), text))
+    return entries
+
+
+def _get_embeddings():
+    """The process-wide model the knowledge base also uses"""
+    from src.tools.embeddings import get_shared_embeddings
+
+    return get_shared_embeddings()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _cache_key() -> str:
+    digest = hashlib.sha256(EMBEDDINGS_MODEL.encode())
+    for kind in SEMANTIC_KINDS:
+        digest.update(dataset_hash(kind).encode())
+    return digest.hexdigest()[:16]
+
+
+def _load_index() -> Dict:
+    """Load the embedding matrix from its cache, or embed every entry"""
+    global _index
+    if _index is not None:
+        return _index
+
+    with _lock:
+        if _index is not None:
+            return _index
+
+        cache_path = DATA_CACHE_DIR / f"semantic-{_cache_key()}.npz"
+        try:
+            with np.load(cache_path) as cached:
+                _index = {name: cached[name] for name in cached.files}
+            return _index
+        except (FileNotFoundError, OSError, ValueError):
+            pass
+
+        entries = _entries()
+        vectors = _get_embeddings().embed_documents([text for _, _, _, text in entries])
+        index = {
+            "kinds": np.array([kind for kind, _, _, _ in entries]),
+            "platforms": np.array([platform for _, platform, _, _ in entries]),
+            "keys": np.array([key for _, _, key, _ in entries]),
+            "matrix": _normalize(np.asarray(vectors, dtype=np.float32))
+        }
+
+        # Cache write failures only cost re-embedding in the next process
+        try:
+            DATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp.npz")
+            np.savez(tmp_path, **index)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+        _index = index
+        return _index
+
+
+def semantic_search(query: str, kind: str = "components", limit: int = 5,
+                    platform: str = None) -> List[Dict]:
+    """Entries whose descriptions are closest in meaning to the query
+
+    Args:
+        query: Free-text need, e.g. "cheap sensor to measure distance underwater"
+        kind: "components" or "libraries"
+        limit: Maximum results
+        platform: Restrict library results to one platform
+
+    Returns:
+        List of dicts with kind, key (library id for libraries), platform and
+        score (cosine), best first
+    """
+    if kind not in SEMANTIC_KINDS:
+        raise ValueError(f"Unknown kind: {kind}. Available: {', '.join(SEMANTIC_KINDS)}")
+
+    index = _load_index()
+    mask = index["kinds"] == kind
+    if platform:
+        mask &= index["platforms"] == platform.lower()
+    rows = np.flatnonzero(mask)
+    if rows.size == 0:
+        return []
+
+    query_vector = _normalize(np.asarray(_get_embeddings().embed_query(query), dtype=np.float32))
+    scores = index["matrix"][rows] @ query_vector
+    top = np.argsort(-scores)[:limit]
+    return [
+        {
+            "kind": kind,
+            "key": str(index["keys"][rows[i]]),
+            "platform": str(index["platforms"][rows[i]]),
+            "score": float(scores[i])
+        }
+        for i in top
+    ]
+
@@ -0,0 +1,244 @@
+"""Parameterized code templates rendered without an LLM round-trip
+
+Templates in code_templates.json declare typed slots and mark values with
+`{{slot}}` and composition points with `{{> section}}` on a line of their
+own. Components in components.json carry per-platform snippets (includes,
+globals, setup and loop lines plus their own slots) that are merged into
+those sections. Every pin a template or snippet uses is resolved and checked
+against the board's pin table before any code is produced.
+
+Slot schema: {"type": "pin" | "int" | "float" | "string", "default", "capability"
+(pins), "min"/"max" (numbers), "description"}. Component slot defaults may be a
+platform -> value map.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.data import load_dataset, get_index, search_components
+from src.data.pins import check_pin_assignment, find_pins, resolve_pin
+
+# Board whose pin table validates each template platform
+PLATFORM_BOARDS = {"arduino": "arduino_uno", "esp32": "esp32", "raspberry_pi": "raspberry_pi"}
+
+# Components share snippets between boards of one language
+SNIPPET_FAMILIES = {"arduino": "arduino", "esp32": "arduino", "raspberry_pi": "raspberry_pi"}
+
+# Sections whose single-line snippets are added once, even if several components need them
+UNIQUE_SECTIONS = {"includes", "imports", "setup", "cleanup"}
+
+# Sections where each component's lines form a block separated by a blank line
+BLOCK_SECTIONS = {"globals"}
+
+# Sections a template may leave out; their snippet lines are then dropped
+OPTIONAL_SECTIONS = {"html"}
+
+# check_pin_assignment conflicts that make a pin unusable; the rest are warnings
+_PIN_ERRORS = ("not a GPIO pin", "does not support", "input-only", "flash")
+
+_SLOT_RE = re.compile(r"\{\{\s*([\w.]+)\s*\}\}")
+_SECTION_RE = re.compile(r"^([ \t]*)\{\{>\s*(\w+)\s*\}\}[ \t]*$", re.MULTILINE)
+
+ComponentRequest = Union[List[str], Dict[str, Optional[Dict]], None]
+
+
+def list_templates(platform: Optional[str] = None) -> Dict[str, Dict[str, Dict]]:
+    """Platform -> template name -> {"description", "slots"}"""
+    templates = load_dataset("code_templates")
+    return {
+        name: {key: {"description": t["description"], "slots": t["slots"]} for key, t in platform_templates.items()}
+        for name, platform_templates in templates.items() if platform is None or name == platform
+    }
+
+
+def _escape(value: str) -> str:
+    """Escape a string for a double-quoted C or Python literal"""
+    value = value.replace("\\", "\\\\").replace('"', '\\"')
+    return value.replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _coerce(name: str, spec: Dict, value, table: Dict) -> Tuple[object, Optional[str]]:
+    """(value, error) with the value converted to the slot's type"""
+    kind = spec.get("type", "string")
+    if kind == "pin":
+        pin = resolve_pin(table, value)
+        return pin, None if pin in table else f"{name}: {value} is not a GPIO pin on this board"
+    if kind in ("int", "float"):
+        try:
+            number = int(value) if kind == "int" else float(value)
+        except (TypeError, ValueError):
+            return None, f"{name}: expected {'an integer' if kind == 'int' else 'a number'}, got {value!r}"
+        if "min" in spec and number < spec["min"] or "max" in spec and number > spec["max"]:
+            return None, f"{name}: {number} is outside {spec.get('min', '-inf')}..{spec.get('max', 'inf')}"
+        return number, None
+    return str(value), None
+
+
+def _render_value(spec: Dict, value) -> str:
+    if spec.get("type") == "pin":
+        # Sketches use pin numbers ("4", "A0"); RPi.GPIO uses BCM numbers
+        return value[4:] if value.startswith("GPIO") else value
+    if spec.get("type", "string") == "string":
+        return _escape(value)
+    return str(value)
+
+
+def _resolve_components(components: ComponentRequest) -> Tuple[Dict[str, Dict], List[str]]:
+    """Component key -> params, resolving names through the components index"""
+    if not components:
+        return {}, []
+    requested = components.items() if isinstance(components, dict) else ((name, None) for name in components)
+    resolved, errors = {}, []
+    data = load_dataset("components")
+    for name, params in requested:
+        key = name.lower()
+        if key not in data:
+            matches = search_components(name, limit=1)
+            if not matches:
+                errors.append(f"Unknown component '{name}'")
+                continue
+            key = matches[0][0]
+        resolved.setdefault(key, {}).update(params or {})
+    return resolved, errors
+
+
+def _fill(lines: List[str], values: Dict[str, str]) -> List[str]:
+    return [_SLOT_RE.sub(lambda m: values.get(m.group(1), m.group(0)), line) for line in lines]
+
+
+def render_template(platform: str, template: str, params: Optional[Dict] = None,
+                    components: ComponentRequest = None) -> Dict:
+    """Render a template with slot values and component snippets
+
+    Args:
+        platform: arduino, esp32 or raspberry_pi
+        template: Template name for the platform (basic, sensor, webserver, ...)
+        params: Slot values; component slots may be given as "component.slot"
+        components: Component names to merge in, or a name -> slot values dict
+
+    Returns:
+        Dict with "success", "code", the resolved "params" and pin "warnings",
+        or "success": False with a list of "errors"
+    """
+    platform, template = platform.lower(), template.lower()
+    templates = load_dataset("code_templates")
+    if platform not in templates:
+        return {"success": False, "errors": [f"Platform '{platform}' not supported. "
+                                             f"Available: {', '.join(templates)}"]}
+    if template not in templates[platform]:
+        return {"success": False, "errors": [f"Template '{template}' not found for {platform}. "
+                                             f"Available: {', '.join(templates[platform])}"]}
+
+    spec = templates[platform][template]
+    table = get_index("pinouts")["pins"][PLATFORM_BOARDS[platform]]
+    family = SNIPPET_FAMILIES[platform]
+    params = dict(params or {})
+    errors: List[str] = []
+
+    # Component slots passed as "component.slot" params
+    selected, component_errors = _resolve_components(components)
+    errors += component_errors
+    for key in [k for k in params if "." in k]:
+        name, slot = key.split(".", 1)
+        found, _ = _resolve_components([name])
+        if not found:
+            errors.append(f"Unknown component '{name}' in parameter '{key}'")
+            params.pop(key)
+            continue
+        selected.setdefault(next(iter(found)), {})[slot] = params.pop(key)
+
+    # (qualified name, slot spec, value, given explicitly) for the template and every component
+    slots: List[Tuple[str, Dict, object, bool]] = []
+    unknown = set(params) - set(spec["slots"])
+    errors += [f"Unknown parameter '{name}' for {platform} {template}. Available: {', '.join(spec['slots'])}"
+               for name in sorted(unknown)]
+    for name, slot in spec["slots"].items():
+        slots.append((name, slot, params.get(name, slot.get("default")), name in params))
+
+    snippets: Dict[str, Dict] = {}
+    for key, component_params in selected.items():
+        snippet = load_dataset("components")[key].get("snippets", {}).get(family)
+        if snippet is None:
+            errors.append(f"Component '{key}' has no {family} snippet")
+            continue
+        snippets[key] = snippet
+        for name in sorted(set(component_params) - set(snippet.get("slots", {}))):
+            errors.append(f"Unknown parameter '{key}.{name}'. Available: {', '.join(snippet.get('slots', {}))}")
+        for name, slot in snippet.get("slots", {}).items():
+            default = slot.get("default")
+            if isinstance(default, dict):
+                default = default.get(platform)
+            slots.append((f"{key}.{name}", slot, component_params.get(name, default), name in component_params))
+
+    values: Dict[str, str] = {}
+    resolved: Dict[str, object] = {}
+    pins: Dict[str, List[Tuple[str, Dict]]] = {}
+    warnings: List[str] = []
+    requested = {resolve_pin(table, value) for _, slot, value, explicit in slots
+                 if explicit and slot.get("type") == "pin"}
+    for name, slot, value, explicit in slots:
+        if value is None:
+            errors.append(f"{name}: a value is required")
+            continue
+        value, error = _coerce(name, slot, value, table)
+        if error:
+            errors.append(error)
+            continue
+        if slot.get("type") == "pin" and not explicit and "." in name and (value in pins or value in requested):
+            # A component's default pin is taken; move it to a free pin with the same capability
+            free = [pin for pin in find_pins(table, [slot["capability"]] if slot.get("capability") else [],
+                                             boot_safe=True) if pin not in pins and pin not in requested]
+            if free:
+                warnings.append(f"{name}: default pin {value} is in use, using {free[0]}")
+                value = free[0]
+        resolved[name] = value
+        values[name] = _render_value(slot, value)
+        if slot.get("type") == "pin":
+            pins.setdefault(value, []).append((name, slot))
+
+    for pin, users in pins.items():
+        if len(users) > 1:
+            errors.append(f"{pin}: assigned to {', '.join(name for name, _ in users)}")
+        for conflict in check_pin_assignment(table, {pin: users[0][1].get("capability", "")}):
+            (errors if any(marker in conflict for marker in _PIN_ERRORS) else warnings).append(
+                f"{conflict} ({users[0][0]})")
+
+    sections: Dict[str, List[str]] = {}
+    for key, snippet in snippets.items():
+        component_values = {name[len(key) + 1:]: value for name, value in values.items()
+                            if name.startswith(f"{key}.")}
+        for section, lines in snippet.items():
+            if section == "slots":
+                continue
+            if section in BLOCK_SECTIONS and sections.get(section):
+                sections[section].append("")
+            sections.setdefault(section, []).extend(_fill(lines, component_values))
+
+    code = spec["code"]
+    used = {section for _, section in _SECTION_RE.findall(code)}
+    for section in sorted(set(sections) - used - OPTIONAL_SECTIONS):
+        errors.append(f"Template {platform} {template} has no '{section}' section for "
+                      f"{', '.join(key for key, s in snippets.items() if section in s)}")
+
+    if errors:
+        return {"success": False, "errors": errors}
+
+    code = _fill([code], values)[0]
+    existing = {line.strip() for line in code.splitlines()}
+
+    def expand(match: re.Match) -> str:
+        indent, section = match.group(1), match.group(2)
+        lines, seen = [], set(existing)
+        for line in sections.get(section, []):
+            if section in UNIQUE_SECTIONS and line.strip() in seen:
+                continue
+            seen.add(line.strip())
+            lines.append(f"{indent}{line}" if line else "")
+        # An empty section leaves no blank line behind
+        return "\n".join(lines) if lines else "\0"
+
+    code = _SECTION_RE.sub(expand, code)
+    # Drop empty section lines, and one of the blank lines around them
+    code = re.sub(r"\n\n\0\n(?=\n)", "\n", code)
+    code = re.sub(r"\0\n?", "", code)
+    return {"success": True, "code": code, "params": resolved, "warnings": warnings}
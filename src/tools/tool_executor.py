@@ -0,0 +1,51 @@
+"""Bounded thread pool for blocking tool calls made from async code
+
+The agent graph runs on the event loop. Tools that still block (web search,
+dataset and catalog lookups, compile checks, knowledge searches) run in this
+dedicated pool instead of the loop's default executor, so a burst of
+concurrent sessions queues for TOOL_EXECUTOR_WORKERS threads rather than
+exhausting the default pool that everything else shares.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.config import TOOL_EXECUTOR_WORKERS
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Process-wide tool pool, started on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=TOOL_EXECUTOR_WORKERS, thread_name_prefix="agent-tool")
+    return _executor
+
+
+async def run_blocking(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call in the tool pool, keeping the caller's context (callbacks, tracing)"""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_tool_executor(), call)
+
+
+def with_tool_executor(tool):
+    """Copy of a sync LangChain tool whose async calls run in the tool pool
+
+    Tools that already have a coroutine are returned unchanged.
+    """
+    if getattr(tool, "coroutine", None) is not None or getattr(tool, "func", None) is None:
+        return tool
+    func = tool.func
+
+    async def coroutine(*args: Any, **kwargs: Any) -> Any:
+        return await run_blocking(func, *args, **kwargs)
+
+    return tool.model_copy(update={"coroutine": coroutine})
@@ -0,0 +1,213 @@
+"""Cached, circuit-broken web search
+
+Results are cached on disk per (enhanced query, max_results). Fresh entries
+are served directly; entries past the TTL but inside the stale window are
+served immediately while a background refresh fetches new results. After
+repeated provider errors the circuit opens: searches fail fast (or serve
+stale results) while a background probe waits for the provider to recover.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from src.config import (
+    WEB_CACHE_DIR, WEB_SEARCH_CACHE_TTL, WEB_SEARCH_STALE_TTL, WEB_SEARCH_TIMEOUT,
+    WEB_SEARCH_FAILURE_THRESHOLD, WEB_SEARCH_RESET_TIMEOUT
+)
+
+ENHANCED_QUERY_SUFFIX = "embedded systems arduino esp32 raspberry pi"
+PROBE_QUERY = "arduino"
+
+
+def enhance_query(query: str) -> str:
+    return f"{query} {ENHANCED_QUERY_SUFFIX}"
+
+
+class SearchCache:
+    """JSON file per cache key, written atomically"""
+
+    def __init__(self, cache_dir: Path = WEB_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(enhanced_query: str, max_results: int) -> str:
+        return hashlib.sha256(f"{enhanced_query}\0{max_results}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached entry ({"created", "results"}), or None"""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, results: List[Dict]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "results": results}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # A failed cache write only costs a network search next time
+
+
+class CircuitBreaker:
+    """Fail fast after repeated errors; a background probe closes the circuit again"""
+
+    def __init__(self, failure_threshold: int = WEB_SEARCH_FAILURE_THRESHOLD,
+                 reset_timeout: float = WEB_SEARCH_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self, probe: Callable[[], None]) -> None:
+        """Count a failure; at the threshold open the circuit and start probing"""
+        with self._lock:
+            self.failures += 1
+            if self.failures < self.failure_threshold or self.is_open:
+                return
+            self.opened_at = time.time()
+            if self._probe is None or not self._probe.is_alive():
+                self._probe = threading.Thread(target=self._probe_loop, args=(probe,), daemon=True)
+                self._probe.start()
+
+    def _probe_loop(self, probe: Callable[[], None]) -> None:
+        delay = self.reset_timeout
+        while self.is_open:
+            time.sleep(delay)
+            try:
+                probe()
+            except Exception:
+                delay = min(delay * 2, self.reset_timeout * 8)
+                continue
+            self.record_success()
+
+
+class WebSearch:
+    """DuckDuckGo text search with a disk cache and a circuit breaker"""
+
+    def __init__(self, ddgs_class, cache: SearchCache = None, breaker: CircuitBreaker = None,
+                 ttl: float = WEB_SEARCH_CACHE_TTL, stale_ttl: float = WEB_SEARCH_STALE_TTL,
+                 timeout: float = WEB_SEARCH_TIMEOUT):
+        self.ddgs_class = ddgs_class
+        self.cache = cache or SearchCache()
+        self.breaker = breaker or CircuitBreaker()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
+    def _client(self):
+        """One search client per thread, reused across calls"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            try:
+                client = self.ddgs_class(timeout=self.timeout)
+            except TypeError:
+                client = self.ddgs_class()
+            self._local.client = client
+        return client
+
+    def _fetch(self, enhanced_query: str, max_results: int) -> List[Dict]:
+        raw = self._client().text(enhanced_query, max_results=max_results) or []
+        return [
+            {"title": r.get("title", ""), "url": r.get("href", ""), "snippet": r.get("body", "")}
+            for r in raw
+        ]
+
+    def _fetch_and_store(self, enhanced_query: str, max_results: int, key: str) -> List[Dict]:
+        try:
+            results = self._fetch(enhanced_query, max_results)
+        except Exception:
+            self.breaker.record_failure(lambda: self._fetch(enhance_query(PROBE_QUERY), 1))
+            raise
+        self.breaker.record_success()
+        self.cache.set(key, results)
+        return results
+
+    def _refresh_in_background(self, enhanced_query: str, max_results: int, key: str) -> None:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch_and_store(enhanced_query, max_results, key)
+            except Exception:
+                pass  # The stale entry stays until a later refresh succeeds
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def search(self, query: str, max_results: int) -> Dict:
+        """Search with caching
+
+        Returns:
+            Dict with "results", "source" ("cache", "stale" or "network") and,
+            when no results could be served, "error"
+        """
+        enhanced = enhance_query(query)
+        key = self.cache.key(enhanced, max_results)
+        entry = self.cache.get(key)
+        age = time.time() - entry["created"] if entry else None
+
+        if entry and age < self.ttl:
+            return {"results": entry["results"], "source": "cache"}
+
+        if entry and age < self.stale_ttl:
+            if not self.breaker.is_open:
+                self._refresh_in_background(enhanced, max_results, key)
+            return {"results": entry["results"], "source": "stale"}
+
+        if self.breaker.is_open:
+            if entry:  # Past the stale window, but better than nothing while search is down
+                return {"results": entry["results"], "source": "stale"}
+            return {"results": [], "source": "network",
+                    "error": "search is temporarily unavailable after repeated failures"}
+
+        try:
+            return {"results": self._fetch_and_store(enhanced, max_results, key), "source": "network"}
+        except Exception as e:
+            if entry:
+                return {"results": entry["results"], "source": "stale"}
+            return {"results": [], "source": "network", "error": str(e)}
+
+
+_search: Optional[WebSearch] = None
+_search_lock = threading.Lock()
+
+
+def get_web_search(ddgs_class) -> WebSearch:
+    """Process-wide search instance, so the breaker sees every caller's failures"""
+    global _search
+    with _search_lock:
+        if _search is None:
+            _search = WebSearch(ddgs_class)
+    return _search
@@ -1,16 +1,15 @@
 """Streamlit UI for Embedded Systems AI Agent"""
 
 import os
-import asyncio
 import streamlit as st
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 
 from src.agent import EmbeddedSystemsAgent
-from src.utils import extract_code_from_response
+from src.utils import extract_code_from_response, iterate_async, run_async
 from src.ui.components import (
     render_sidebar_menu,
-    render_code_display,
     render_validation_results,
     render_component_info,
     render_pinout_info,
@@ -126,16 +125,41 @@ def add_to_history(item_type: str, **kwargs):
     st.session_state.session_history.append(history_item)
 
 
-async def handle_chat(agent: EmbeddedSystemsAgent, question: str, platform: str):
+def stream_response(agent: EmbeddedSystemsAgent, request: str, platform: str, label: str) -> Dict:
+    """Show the agent's reply as it streams in, with tool calls in a status box
+    
+    Returns:
+        The final result dictionary, as from process_request
+    """
+    status = st.status(label, expanded=False)
+    placeholder = st.empty()
+    text = ""
+    result = {"success": False, "error": "No response"}
+    for event in iterate_async(agent.stream_request(request, platform)):
+        if event["type"] == "token":
+            text += event["text"]
+            placeholder.markdown(text + "▌")
+        elif event["type"] == "tool_start":
+            status.update(label=f"🔧 Using {event['name']}...")
+            status.write(f"🔧 {event['name']}")
+        elif event["type"] == "result":
+            result = event["result"]
+
+    if result["success"]:
+        placeholder.markdown(result["response"])
+        status.update(label="✅ Response received", state="complete")
+    else:
+        placeholder.empty()
+        status.update(label="❌ Request failed", state="error")
+    return result
+
+
+def handle_chat(agent: EmbeddedSystemsAgent, question: str, platform: str):
     """Handle chat interaction"""
-    with st.spinner("🤔 Thinking..."):
-        result = await agent.process_request(question, platform)
+    result = stream_response(agent, question, platform, "🤔 Thinking...")
     
     if result["success"]:
         st.session_state.last_response = result["response"]
-        render_success_message("Response received")
-        
-        st.markdown(result["response"])
         
         # Display sources if available
         if result.get("sources"):
@@ -152,19 +176,14 @@ async def handle_chat(agent: EmbeddedSystemsAgent, question: str, platform: str)
         render_error_message(result["error"])
 
 
-async def handle_code_generation(agent: EmbeddedSystemsAgent, requirements: str, platform: str):
+def handle_code_generation(agent: EmbeddedSystemsAgent, requirements: str, platform: str):
     """Handle code generation"""
-    with st.spinner("⚡ Generating code..."):
-        request = f"Generate {platform} code for: {requirements}"
-        result = await agent.process_request(request, platform)
+    st.subheader("Generated Code")
+    request = f"Generate {platform} code for: {requirements}"
+    result = stream_response(agent, request, platform, "⚡ Generating code...")
     
     if result["success"]:
         st.session_state.generated_code = result["response"]
-        render_success_message("Code generated successfully")
-        
-        st.subheader("Generated Code")
-        language = "cpp" if platform in ["arduino", "esp32"] else "python"
-        render_code_display(result["response"], language)
         
         # Display sources
         if result.get("sources"):
@@ -198,14 +217,14 @@ async def handle_code_generation(agent: EmbeddedSystemsAgent, requirements: str,
         render_error_message(result["error"])
 
 
-async def handle_project_generation(agent: EmbeddedSystemsAgent, project_name: str, requirements: str, platform: str):
+def handle_project_generation(agent: EmbeddedSystemsAgent, project_name: str, requirements: str, platform: str):
     """Handle project generation"""
     if not project_name or not requirements:
         render_error_message("Project name and requirements are required")
         return
     
     with st.spinner("🏗️ Creating project..."):
-        result = await agent.generate_project(platform, requirements, project_name)
+        result = run_async(agent.generate_project(platform, requirements, project_name))
     
     if result["success"]:
         render_success_message(f"Project '{project_name}' created successfully!")
@@ -220,7 +239,7 @@ async def handle_project_generation(agent: EmbeddedSystemsAgent, project_name: s
         render_error_message(result["error"])
 
 
-async def handle_web_search(agent: EmbeddedSystemsAgent, query: str):
+def handle_web_search(agent: EmbeddedSystemsAgent, query: str):
     """Handle web search"""
     from src.tools.embedded_tools import web_search_tool
     
@@ -259,7 +278,7 @@ def handle_pinout_lookup(platform: str):
         render_error_message(result)
 
 
-async def handle_knowledge_upload(agent: EmbeddedSystemsAgent, uploaded_file):
+def handle_knowledge_upload(agent: EmbeddedSystemsAgent, uploaded_file):
     """Handle knowledge base upload with source tracking"""
     import tempfile
     from pathlib import Path
@@ -274,7 +293,7 @@ async def handle_knowledge_upload(agent: EmbeddedSystemsAgent, uploaded_file):
             tmp_path = tmp_file.name
         
         with st.spinner("📚 Adding to knowledge base..."):
-            result = await agent.add_knowledge(tmp_path)
+            result = run_async(agent.add_knowledge(tmp_path))
         
         if result.get("success"):
             render_success_message(result.get("message", f"Added {uploaded_file.name}"))
@@ -314,7 +333,7 @@ def main():
             submit = st.button("Send 📤", use_container_width=True)
         
         if submit and question:
-            asyncio.run(handle_chat(agent, question, platform))
+            handle_chat(agent, question, platform)
     
     elif option == "⚡ Generate Code":
         st.header("⚡ Generate Code")
@@ -330,7 +349,7 @@ def main():
             submit = st.button("Generate 🚀", use_container_width=True)
         
         if submit and requirements:
-            asyncio.run(handle_code_generation(agent, requirements, platform))
+            handle_code_generation(agent, requirements, platform)
     
     elif option == "🏗️ Create Project":
         st.header("🏗️ Create Project")
@@ -348,12 +367,12 @@ def main():
         )
         
         if st.button("Create Project 🏗️", use_container_width=True):
-            asyncio.run(handle_project_generation(
+            handle_project_generation(
                 agent,
                 project_name,
                 requirements,
                 platform_select.lower().replace(" ", "_")
-            ))
+            )
     
     elif option == "🔍 Search":
         st.header("🔍 Search")
@@ -365,7 +384,7 @@ def main():
         )
         
         if st.button("Search 🔎", use_container_width=True) and query:
-            asyncio.run(handle_web_search(agent, query))
+            handle_web_search(agent, query)
     
     elif option == "🔌 Component Lookup":
         st.header("🔌 Component Lookup")
@@ -416,12 +435,15 @@ def main():
             
             if uploaded_file is not None:
                 if st.button("Add to Knowledge Base 📚", use_container_width=True):
-                    asyncio.run(handle_knowledge_upload(agent, uploaded_file))
+                    handle_knowledge_upload(agent, uploaded_file)
         
         with kb_tab2:
             st.subheader("Search Knowledge Base")
             search_query = st.text_input("Enter search query:", placeholder="e.g., DHT22 sensor wiring")
             
+            if not agent.tools_instance.is_ready:
+                st.caption("⏳ Knowledge search is warming up; the first search may take a few seconds")
+            
             if search_query and st.button("Search 🔍", use_container_width=True):
                 with st.spinner("Searching knowledge base..."):
                     results = agent.tools_instance.search_knowledge(search_query, k=3)
@@ -490,7 +512,7 @@ def main():
             with ingest_col1:
                 if st.button("🚀 Start Bulk Ingest", use_container_width=True, type="primary"):
                     with st.spinner("Ingesting all files from knowledge_base..."):
-                        ingest_results = asyncio.run(agent.ingest_knowledge_base())
+                        ingest_results = run_async(agent.ingest_knowledge_base())
                         
                         if ingest_results["success"]:
                             st.success(f"✅ {ingest_results['message']}")
@@ -519,6 +541,12 @@ def main():
                         
                         structure = _build_tree(KNOWLEDGE_BASE_DIR, max_depth=3)
                         st.text(structure)
+            
+            st.divider()
+            st.markdown("**Rebuild index** builds a fresh index in the background and switches searches to it once validated.")
+            if st.button("🔄 Rebuild Index (zero downtime)", use_container_width=True):
+                rebuild_result = run_async(agent.rebuild_knowledge_base(background=True))
+                render_info_message(rebuild_result["message"])
     
     elif option == "ℹ️ About":
         st.header("ℹ️ About")
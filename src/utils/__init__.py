@@ -2,6 +2,7 @@
 
 from .helpers import extract_code_from_response, save_code_to_file, validate_platform
 from .file_ops import read_file, write_file, create_directory, list_directory
+from .event_loop import run_async, iterate_async
 
 __all__ = [
     "extract_code_from_response",
@@ -10,5 +11,7 @@ __all__ = [
     "read_file",
     "write_file",
     "create_directory",
-    "list_directory"
+    "list_directory",
+    "run_async",
+    "iterate_async"
 ]
@@ -0,0 +1,63 @@
+"""Long-lived event loop for calling the async agent from sync code
+
+asyncio.run() creates and closes a loop on every call, but the agent keeps
+loop-bound resources between calls (the LLM's async HTTP client). Sync
+callers such as Streamlit reruns and the startup ingest therefore submit
+their coroutines to one process-wide loop running in a background thread.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide background loop, started on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="agent-loop", daemon=True).start()
+    return _loop
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the background loop and wait for its result
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait, or None to wait until it finishes
+
+    Returns:
+        The coroutine's result; its exception is raised in the caller
+    """
+    loop = get_event_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_async() called from the background loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def iterate_async(iterator: AsyncIterator) -> Iterator:
+    """Consume an async iterator on the background loop from sync code
+
+    Items are yielded in the caller's thread, so UI updates per item stay in
+    the thread that owns the UI.
+    """
+    try:
+        while True:
+            try:
+                yield run_async(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        # Closing early (break, exception) still runs the generator's cleanup on its loop
+        if hasattr(iterator, "aclose"):
+            run_async(iterator.aclose())
@@ -0,0 +1,93 @@
+"""Startup import-time measurement using `python -X importtime`"""
+
+import re
+import subprocess
+import sys
+from typing import Dict, List
+
+from src.config import BASE_DIR
+
+# "import time:      self [us] |  cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Parse -X importtime output into one entry per imported module"""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                "module": module,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": (len(indent) - 1) // 2
+            })
+    return entries
+
+
+def measure_import_time(module: str = "main", runs: int = 3) -> Dict:
+    """Import a module in fresh interpreters and report the fastest run
+
+    Args:
+        module: Module to import, relative to the project root
+        runs: Fresh interpreter runs; the minimum filters out cold-cache noise
+
+    Returns:
+        Dict with total_ms and the slowest direct imports
+    """
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=str(BASE_DIR), capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+
+        total_ms, children = _module_cost(parse_importtime(completed.stderr), module)
+        if best is None or total_ms < best["total_ms"]:
+            best = {
+                "module": module,
+                "total_ms": total_ms,
+                "slowest": sorted(children, key=lambda e: e["cumulative_ms"], reverse=True)[:10]
+            }
+    return best
+
+
+def _module_cost(entries: List[Dict], module: str):
+    """Cumulative time of the imported module and its direct imports
+
+    Interpreter startup imports (site, encodings) are excluded. Parent
+    packages of a dotted module are separate top-level entries and count
+    towards the total. Children are listed before their parent, so the
+    direct imports are the depth-1 entries since the previous top-level entry.
+    """
+    parts = module.split(".")
+    owned = {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+
+    total_ms = 0.0
+    children: List[Dict] = []
+    pending: List[Dict] = []
+    for entry in entries:
+        if entry["depth"] == 1:
+            pending.append(entry)
+        elif entry["depth"] == 0:
+            if entry["module"] in owned:
+                total_ms += entry["cumulative_ms"]
+                children.extend(pending)
+            pending = []
+    return total_ms, children
+
+
+def check_import_budget(module: str, budget_ms: float, runs: int = 3) -> Dict:
+    """Measure a module's import time and compare it with a budget
+
+    Returns:
+        measure_import_time report plus budget_ms and within_budget
+    """
+    report = measure_import_time(module, runs)
+    report["budget_ms"] = budget_ms
+    report["within_budget"] = report["total_ms"] <= budget_ms
+    return report
@@ -0,0 +1,76 @@
+"""Shared fixtures: a local HTTP server with scripted routes"""
+
+import http.server
+import threading
+import time
+from typing import Callable, Dict, List, Tuple, Union
+
+import pytest
+
+Response = Tuple[int, Dict[str, str], bytes]
+Route = Union[Response, Callable[[http.server.BaseHTTPRequestHandler], Response]]
+
+
+class Site:
+    """Routes served on 127.0.0.1; every request and the peak concurrency per host are recorded"""
+
+    def __init__(self):
+        self.routes: Dict[str, Route] = {}
+        self.requests: List[Tuple[str, Dict[str, str], float]] = []
+        self.delay = 0.0
+        self.active: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.server = None
+
+    def url(self, path: str, host: str = "127.0.0.1") -> str:
+        return f"http://{host}:{self.server.server_address[1]}{path}"
+
+    def paths(self) -> List[str]:
+        return [path for path, _, _ in self.requests]
+
+    def html(self, path: str, body: str, **headers: str) -> None:
+        self.routes[path] = (200, {"Content-Type": "text/html; charset=utf-8", **headers}, body.encode())
+
+
+def _handler(site: Site):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            host = self.headers.get("Host", "").split(":")[0]
+            with site.lock:
+                site.requests.append((self.path, dict(self.headers), time.monotonic()))
+                site.active[host] = site.active.get(host, 0) + 1
+                site.peak[host] = max(site.peak.get(host, 0), site.active[host])
+            try:
+                if site.delay:
+                    time.sleep(site.delay)
+                route = site.routes.get(self.path, (404, {"Content-Type": "text/plain"}, b"not found"))
+                status, headers, body = route(self) if callable(route) else route
+            finally:
+                with site.lock:
+                    site.active[host] -= 1
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def site():
+    site = Site()
+    site.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _handler(site))
+    site.server.daemon_threads = True
+    thread = threading.Thread(target=site.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield site
+    site.server.shutdown()
+    site.server.server_close()
@@ -0,0 +1,46 @@
+"""Parts and library catalog search"""
+
+import pytest
+
+from src.data.catalog import CatalogStore
+
+LIBRARIES = {
+    "arduino": {
+        "dht": {"name": "DHT sensor library", "description": "Reads DHT11 and DHT22 temperature sensor modules"},
+        "bmp": {"name": "BMP280", "description": "Pressure sensor driver for the BMP280 over I2C or SPI"},
+        "servo": {"name": "Servo", "description": "Controls hobby servo motors"},
+    }
+}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = CatalogStore(str(tmp_path / "catalog.sqlite3"))
+    catalog.import_libraries(LIBRARIES)
+    return catalog
+
+
+def test_exact_alias_scores_one(catalog):
+    key, _, score = catalog.find_libraries("DHT sensor library", "arduino")[0]
+    assert (key, score) == ("dht", 1.0)
+
+
+def test_weaker_full_text_hits_score_lower(catalog):
+    results = catalog.find_libraries("sensor", "arduino")
+    scores = [score for _, _, score in results]
+    assert {key for key, _, _ in results} == {"dht", "bmp"}
+    assert scores[0] == 0.99
+    assert 0 < scores[1] < scores[0]
+
+
+def test_resolve_libraries_needs_a_name_match_from_the_catalog(catalog, monkeypatch):
+    from src.data import catalog as catalog_module
+    from src.data.loader import resolve_libraries
+
+    catalog.import_libraries({"arduino": {"relayctl": {"name": "RelayControl",
+                                                       "description": "Drives a wifi relay board"}}})
+    monkeypatch.setattr(catalog_module, "get_catalog", lambda path=None: catalog)
+
+    # A shared description word is not a match, whatever its rank among catalog hits
+    assert resolve_libraries(["board"], "arduino")["missing"] == ["board"]
+    assert resolve_libraries(["relaycontrol"], "arduino")["resolved"] == {"relaycontrol": "arduino/relayctl"}
@@ -0,0 +1,146 @@
+"""Crawler against a local HTTP server"""
+
+import asyncio
+
+import pytest
+
+from src.tools.crawler import Crawler
+from src.tools.page_fetch import PageCache, PageFetcher
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def page(title: str, *links: str, text: str = None) -> str:
+    anchors = "".join(f'<a href="{link}">{link}</a>' for link in links)
+    return (f"<html><head><title>{title}</title></head><body><nav>{anchors}</nav>"
+            f"<main><p>{text or f'Content of {title}.'}</p></main></body></html>")
+
+
+@pytest.fixture
+def make_crawler(tmp_path):
+    fetchers = []
+
+    def make(**options):
+        fetcher = PageFetcher(concurrency=4, timeout=5, cache=PageCache(tmp_path / "pages"))
+        fetchers.append(fetcher)
+        options = dict(dict(state_name="test", concurrency=2, delay=0, max_pages=50, max_depth=3), **options)
+        return Crawler(None, output_dir=tmp_path / "crawled", state_dir=tmp_path / "state", fetcher=fetcher,
+                       **options)
+
+    yield make
+    for fetcher in fetchers:
+        fetcher.executor.shutdown(wait=True)
+        fetcher.session.close()
+
+
+def crawl(crawler: Crawler) -> dict:
+    return asyncio.run(crawler.run())
+
+
+def test_follows_links_within_depth_and_scope(site, make_crawler, tmp_path):
+    site.html("/docs/index.html", page("Index", "a.html", "/blog/post.html", "logo.png"))
+    site.html("/docs/a.html", page("A", "b.html"))
+    site.html("/docs/b.html", page("B"))
+    site.html("/blog/post.html", page("Post"))
+
+    crawler = make_crawler(max_depth=1)
+    crawler.add_seeds([site.url("/docs/index.html")])
+    stats = crawl(crawler)
+
+    assert stats["fetched"] == 2
+    assert set(site.paths()) == {"/robots.txt", "/docs/index.html", "/docs/a.html"}
+    assert len(list((tmp_path / "crawled").glob("*.md"))) == 2
+
+
+def test_honours_robots_disallow(site, make_crawler):
+    site.routes["/robots.txt"] = (200, {"Content-Type": "text/plain"}, b"User-agent: *\nDisallow: /docs/private/\n")
+    site.html("/docs/index.html", page("Index", "private/secret.html", "a.html"))
+    site.html("/docs/a.html", page("A"))
+    site.html("/docs/private/secret.html", page("Secret"))
+
+    crawler = make_crawler()
+    crawler.add_seeds([site.url("/docs/index.html")])
+    stats = crawl(crawler)
+
+    assert stats["disallowed"] == 1
+    assert stats["frontier"]["disallowed"] == 1
+    assert "/docs/private/secret.html" not in site.paths()
+
+
+def test_honours_robots_crawl_delay(site, make_crawler):
+    site.routes["/robots.txt"] = (200, {"Content-Type": "text/plain"}, b"User-agent: *\nCrawl-delay: 1\n")
+    site.html("/docs/index.html", page("Index", "a.html"))
+    site.html("/docs/a.html", page("A"))
+
+    crawler = make_crawler()
+    crawler.add_seeds([site.url("/docs/index.html")])
+    crawl(crawler)
+
+    times = [when for path, _, when in site.requests if path != "/robots.txt"]
+    assert len(times) == 2
+    assert times[1] - times[0] >= 0.95
+
+
+def test_skips_duplicate_content(site, make_crawler, tmp_path):
+    site.html("/docs/index.html", page("Index", "a.html", "a-copy.html"))
+    site.html("/docs/a.html", page("A", text="Same text."))
+    site.html("/docs/a-copy.html", page("A", text="Same text."))
+
+    crawler = make_crawler()
+    crawler.add_seeds([site.url("/docs/index.html")])
+    stats = crawl(crawler)
+
+    assert stats["fetched"] == 3
+    assert stats["duplicates"] == 1
+    assert len(list((tmp_path / "crawled").glob("*.md"))) == 2
+
+
+def test_resumes_from_the_persisted_frontier(site, make_crawler):
+    site.html("/docs/index.html", page("Index", "a.html", "b.html", "c.html"))
+    for name in "abc":
+        site.html(f"/docs/{name}.html", page(name.upper()))
+
+    first = make_crawler(max_pages=2)
+    first.add_seeds([site.url("/docs/index.html")])
+    assert crawl(first)["fetched"] == 2
+    # A page claimed when the process stopped is queued again on resume
+    in_flight, _ = first.frontier.next()
+
+    second = make_crawler()
+    stats = crawl(second)
+
+    assert stats["fetched"] == 2
+    assert stats["frontier"] == {"done": 4}
+    pages = [path for path in site.paths() if path != "/robots.txt"]
+    assert sorted(pages) == ["/docs/a.html", "/docs/b.html", "/docs/c.html", "/docs/index.html"]
+    assert in_flight in [site.url(path) for path in pages[2:]]
+
+
+def sitemap(tag: str, *urls: str) -> bytes:
+    inner = "sitemap" if tag == "sitemapindex" else "url"
+    entries = "".join(f"<{inner}><loc>{url}</loc></{inner}>" for url in urls)
+    return f'<?xml version="1.0"?><{tag} xmlns="{SITEMAP_NS}">{entries}</{tag}>'.encode()
+
+
+def test_expands_sitemap_indexes_and_reports_broken_sitemaps(site, make_crawler, capsys):
+    xml = {"Content-Type": "application/xml"}
+    site.routes["/sitemap.xml"] = (200, xml, sitemap(
+        "sitemapindex", site.url("/docs-sitemap.xml"), site.url("/api-sitemap.xml"),
+        site.url("/broken.xml"), site.url("/missing.xml")))
+    site.routes["/docs-sitemap.xml"] = (200, xml, sitemap("urlset", site.url("/docs/a.html"), site.url("/docs/b.html")))
+    site.routes["/api-sitemap.xml"] = (200, xml, sitemap("urlset", site.url("/api/c.html")))
+    site.routes["/broken.xml"] = (200, xml, b"<urlset><url><loc>")
+
+    crawler = make_crawler()
+    assert crawler.add_sitemap(site.url("/sitemap.xml")) == 3
+    assert sorted(crawler.frontier.scope) == [site.url("/api/"), site.url("/docs/")]
+
+    output = capsys.readouterr().out
+    assert f"Sitemap {site.url('/broken.xml')} failed" in output
+    assert f"Sitemap {site.url('/missing.xml')} failed" in output
+
+
+def test_unreadable_sitemap_raises_with_its_url(site, make_crawler):
+    crawler = make_crawler()
+    with pytest.raises(ValueError, match="missing.xml"):
+        crawler.add_sitemap(site.url("/missing.xml"))
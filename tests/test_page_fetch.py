@@ -0,0 +1,116 @@
+"""PageFetcher against a local HTTP server"""
+
+import time
+
+import pytest
+
+from src.tools.page_fetch import PageCache, PageFetcher
+
+ARTICLE = ("<html><head><title>Blink</title><script>var x = 1;</script></head><body>"
+           "<nav>Home Menu</nav><article><h1>Blink an LED</h1><p>Use digitalWrite(13, HIGH).</p></article>"
+           "<footer>Copyright</footer></body></html>")
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    fetcher = PageFetcher(concurrency=8, per_host=2, timeout=5, cache=PageCache(tmp_path / "pages"))
+    yield fetcher
+    fetcher.executor.shutdown(wait=True)
+    fetcher.session.close()
+
+
+def test_extracts_main_text(site, fetcher):
+    site.html("/blink", ARTICLE)
+    page = fetcher.fetch(site.url("/blink"))
+    assert page["source"] == "network"
+    assert page["title"] == "Blink"
+    assert "digitalWrite(13, HIGH)" in page["text"]
+    assert "Home Menu" not in page["text"] and "var x" not in page["text"]
+
+
+def test_per_host_limit_and_concurrency(site, fetcher):
+    site.delay = 0.2
+    for i in range(6):
+        site.html(f"/page{i}", ARTICLE)
+    urls = [site.url(f"/page{i}", host) for host in ("127.0.0.1", "localhost") for i in range(6)]
+
+    start = time.monotonic()
+    pages = fetcher.fetch_many(urls)
+    elapsed = time.monotonic() - start
+
+    assert [page["url"] for page in pages] == urls
+    assert all(page.get("text") for page in pages)
+    assert site.peak == {"127.0.0.1": 2, "localhost": 2}
+    # 6 pages per host, 2 at a time: about 3 rounds, hosts in parallel
+    assert 0.55 < elapsed < 1.2
+
+
+def test_revalidates_with_etag_and_last_modified(site, fetcher):
+    modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def page(handler):
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return 304, {}, b""
+        return 200, {"Content-Type": "text/html", "ETag": '"v1"', "Last-Modified": modified}, ARTICLE.encode()
+
+    site.routes["/blink"] = page
+    fetcher.fresh_seconds = 0
+    first = fetcher.fetch(site.url("/blink"))
+    second = fetcher.fetch(site.url("/blink"))
+
+    assert first["source"] == "network"
+    assert second["source"] == "revalidated"
+    assert second["text"] == first["text"]
+    headers = site.requests[1][1]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == modified
+
+
+def test_fresh_cache_skips_the_network(site, fetcher):
+    site.html("/blink", ARTICLE)
+    fetcher.fetch(site.url("/blink"))
+    assert fetcher.fetch(site.url("/blink"))["source"] == "cache"
+    assert len(site.requests) == 1
+
+
+def test_caps_body_size(site, fetcher):
+    fetcher.max_bytes = 10_000
+    site.html("/big", "<html><body><p>" + "x" * 200_000 + "</p></body></html>")
+    _, body = fetcher.download(site.url("/big"))
+    assert len(body) == 10_000
+    assert len(fetcher.fetch(site.url("/big"))["text"]) < 10_000
+
+
+def test_rejects_non_html(site, fetcher):
+    site.routes["/datasheet.pdf"] = (200, {"Content-Type": "application/pdf"}, b"%PDF-1.4")
+    page = fetcher.fetch(site.url("/datasheet.pdf"))
+    assert "Unsupported content type: application/pdf" in page["error"]
+    assert "text" not in page
+
+
+def test_unknown_charset_falls_back_to_utf8(site, fetcher):
+    site.html("/blink", ARTICLE.replace("HIGH", "HIGH \u00b0"), **{"Content-Type": "text/html; charset=x-unknown"})
+    pages = fetcher.fetch_many([site.url("/blink")])
+    assert "digitalWrite(13, HIGH \u00b0)" in pages[0]["text"]
+
+
+def test_serves_stale_cache_when_the_server_fails(site, fetcher):
+    site.html("/blink", ARTICLE)
+    url = site.url("/blink")
+    fetched = fetcher.fetch(url)
+    fetcher.fresh_seconds = 0
+
+    site.routes["/blink"] = (500, {"Content-Type": "text/plain"}, b"boom")
+    stale = fetcher.fetch(url)
+    assert stale["source"] == "cache"
+    assert stale["text"] == fetched["text"]
+
+    site.server.shutdown()
+    site.server.server_close()
+    assert fetcher.fetch(url)["source"] == "cache"
+
+
+def test_reports_errors_without_cache(site, fetcher):
+    site.routes["/missing"] = (404, {"Content-Type": "text/plain"}, b"not found")
+    page = fetcher.fetch(site.url("/missing"))
+    assert "404" in page["error"]
@@ -0,0 +1,61 @@
+"""Fast-path router: requests it must answer, and requests it must leave to the agent"""
+
+import pytest
+
+from src.agent.router import IntentRouter
+
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter()
+
+
+@pytest.mark.parametrize("text, platform, tool, args", [
+    ("show pinout for esp32", "", "pinout_lookup_tool", {"platform": "esp32"}),
+    ("Show pinout information for arduino_uno", "", "pinout_lookup_tool", {"platform": "arduino_uno"}),
+    ("pinout", "esp32", "pinout_lookup_tool", {"platform": "esp32"}),
+    ("dht22 pinout", "esp32", "component_lookup_tool", {"component_name": "dht22"}),
+    ("Look up component information for HC-SR04", "", "component_lookup_tool", {"component_name": "hc-sr04"}),
+    ("library for dht22", "esp32", "library_lookup_tool", {"library_name": "DHT", "platform": "esp32"}),
+    ("which library for wifi on esp32", "", "library_lookup_tool", {"library_name": "wifi", "platform": "esp32"}),
+    ("Get web_server template for esp32", "", "code_template_tool",
+     {"platform": "esp32", "template_type": "webserver"}),
+    ("esp32 web server template on port 8080 with DHT22 on GPIO4", "", "code_template_tool",
+     {"platform": "esp32", "template_type": "webserver", "params": {"port": 8080, "dht22.pin": "gpio4"},
+      "components": ["dht22"]}),
+    ("servo template for arduino with servo on pin 9", "", "code_template_tool",
+     {"platform": "arduino", "template_type": "servo", "params": {"servo_pin": "9"}}),
+])
+def test_routes_plain_lookups(router, text, platform, tool, args):
+    route = router.route(text, platform)
+    assert route is not None
+    assert (route.tool, route.args) == (tool, args)
+
+
+@pytest.mark.parametrize("text", [
+    # Unknown board model; the Uno pinout would be wrong
+    "pinout for arduino mega",
+    # Wiring a part to a board is neither the part nor the board pinout
+    "what pins does the dht22 use on esp32",
+    "dht22 pinout on esp32",
+    # Unknown parts would be dropped from the template
+    "template for esp32 with pir sensor",
+    "template for esp32 with bme280 sensor",
+    # Capability questions need the pin table, not the whole pinout
+    "list esp32 pins that support touch",
+    "pinout for esp32 pin 34",
+    # A pin no slot takes would be ignored
+    "basic template for arduino with relay on pin 7",
+    # Reasoning and generation
+    "why does my esp32 reset when I use pin 12",
+    "write a program that blinks an led on esp32",
+    "compare esp32 and arduino",
+])
+def test_leaves_other_requests_to_the_agent(router, text):
+    assert router.route(text) is None
+
+
+def test_template_pin_goes_to_its_slot_even_if_invalid(router):
+    # The template tool, not the router, reports that the Uno has no pin 20
+    route = router.route("servo template for arduino with servo on pin 20")
+    assert route.args["params"] == {"servo_pin": "20"}